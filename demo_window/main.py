@@ -3,9 +3,12 @@
 Affiche un fichier HTML moderne avec Tailwind CSS dans la fenêtre.
 """
 
+import socket
 import threading
 import time
+import uvicorn
 import webview
+from fastapi import FastAPI
 from pathlib import Path
 from nicegui import ui
 
@@ -13,12 +16,43 @@ from nicegui import ui
 WINDOW_TITLE = "🖥️ VisionIT - Installation HTML"
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 900
-PORT = 8080
+
+
+def bind_server_socket() -> socket.socket:
+    """Bind a port chosen by the OS; uvicorn then serves this very socket.
+
+    No other instance can take the port between the choice and the start.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    return sock
+
+
+def wait_for_server(port: int, timeout: float = 30.0) -> None:
+    """Wait until the NiceGUI server accepts connections."""
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while True:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"NiceGUI server not ready on port {port}")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.25)
+
+
+SERVER_SOCKET = bind_server_socket()
+PORT = SERVER_SOCKET.getsockname()[1]
 
 
 def start_server():
-    """Start NiceGUI server."""
-    ui.run(host='127.0.0.1', port=PORT, reload=False, show=False, uvicorn_logging_level='error')
+    """Start NiceGUI server on SERVER_SOCKET."""
+    fastapi_app = FastAPI()
+    ui.run_with(fastapi_app)
+    server = uvicorn.Server(uvicorn.Config(fastapi_app, log_level='error'))
+    server.run(sockets=[SERVER_SOCKET])
 
 
 def create_window():
@@ -36,7 +70,7 @@ def create_window():
     # Start server
     server = threading.Thread(target=start_server, daemon=True)
     server.start()
-    time.sleep(2)
+    wait_for_server(PORT)
     
     # Get HTML file path
     html_file = Path(__file__).parent / "templates" / "index.html"
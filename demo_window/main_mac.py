@@ -3,16 +3,47 @@
 Lance une VRAIE fenêtre desktop sur Mac avec pywebview direct.
 """
 
+import socket
 import threading
 import time
+import uvicorn
 import webview
+from fastapi import FastAPI
 from nicegui import ui
 
 # === CONFIGURATION ===
 WINDOW_TITLE = "🖥️ Démo VisionIT - Fenêtre Mac"
 WINDOW_WIDTH = 1000
 WINDOW_HEIGHT = 700
-PORT = 8080
+
+
+def bind_server_socket() -> socket.socket:
+    """Bind a port chosen by the OS; uvicorn then serves this very socket.
+
+    No other instance can take the port between the choice and the start.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    return sock
+
+
+def wait_for_server(port: int, timeout: float = 30.0) -> None:
+    """Wait until the NiceGUI server accepts connections."""
+    deadline = time.monotonic() + timeout
+    delay = 0.01
+    while True:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"NiceGUI server not ready on port {port}")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.25)
+
+
+SERVER_SOCKET = bind_server_socket()
+PORT = SERVER_SOCKET.getsockname()[1]
 
 
 @ui.page("/")
@@ -97,14 +128,12 @@ def main_page():
 
 
 def start_nicegui_server():
-    """Démarre le serveur NiceGUI en arrière-plan."""
-    ui.run(
-        host='127.0.0.1',
-        port=PORT,
-        reload=False,
-        show=False,  # Ne pas ouvrir le navigateur
-        uvicorn_logging_level='error'
-    )
+    """Démarre le serveur NiceGUI en arrière-plan, sur SERVER_SOCKET."""
+    # NiceGUI monté sur FastAPI : uvicorn sert le socket déjà réservé
+    fastapi_app = FastAPI()
+    ui.run_with(fastapi_app)
+    server = uvicorn.Server(uvicorn.Config(fastapi_app, log_level='error'))
+    server.run(sockets=[SERVER_SOCKET])
 
 
 def create_mac_window():
@@ -125,7 +154,7 @@ def create_mac_window():
     server_thread.start()
     
     # Attendre que le serveur démarre
-    time.sleep(2)
+    wait_for_server(PORT)
     
     # Créer la fenêtre avec pywebview (spécial Mac)
     url = f"http://127.0.0.1:{PORT}"
@@ -13,7 +13,7 @@ import sys
 WINDOW_TITLE = "test_final"
 WINDOW_WIDTH = 1000
 WINDOW_HEIGHT = 800
-PORT = 8080
+PORT = None  # Mode natif : NiceGUI choisit un port libre
 
 
 # Helper pour les ressources (compatible PyInstaller)
@@ -116,7 +116,7 @@ if __name__ == "__main__":
     print("="*60)
     print(f"📝 Titre: {WINDOW_TITLE}")
     print(f"📐 Taille: {WINDOW_WIDTH}x{WINDOW_HEIGHT}")
-    print(f"🌐 Port: {PORT}")
+    print(f"🌐 Port: {PORT or 'auto'}")
     print(f"🖥️  Mode: Fenêtre Desktop Native")
     print("="*60)
     print("\n⏳ Ouverture de la fenêtre...\n")
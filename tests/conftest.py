@@ -0,0 +1,50 @@
+"""Shared fixtures for VisionIT tests."""
+
+import os
+import stat
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.cli import app
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a non-interactive VisionIT project and return its path."""
+    original_dir = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        result = CliRunner().invoke(app, ["new", "test_app", "--no-interactive"])
+        assert result.exit_code == 0, result.output
+    finally:
+        os.chdir(original_dir)
+    return Path(tmp_path) / "test_app"
+
+
+@pytest.fixture
+def fake_prisma(tmp_path, monkeypatch):
+    """Put a fake `prisma` CLI on PATH that logs its arguments."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "prisma.log"
+    script = bin_dir / "prisma"
+    script.write_text(
+        "#!/bin/sh\n"
+        f'echo "$*" >> "{log}"\n'
+        # db push creates the SQLite database (file:../dev.db from db/)
+        'if [ "$1" = "db" ]; then touch dev.db; fi\n',
+        encoding="utf-8",
+    )
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return log
+
+
+@pytest.fixture(autouse=True)
+def shared_cache(tmp_path_factory, monkeypatch):
+    """Keep the shared PyInstaller cache out of the user's cache folder."""
+    cache = tmp_path_factory.mktemp("visionit-cache")
+    monkeypatch.setenv("VISIONIT_CACHE_DIR", str(cache))
+    return cache / "pyinstaller"
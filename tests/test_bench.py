@@ -0,0 +1,97 @@
+"""Tests for the VisionIT startup benchmark."""
+
+import json
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.bench import available_targets, measure_startup, percentile, summarize
+from visionit.cli import app
+
+runner = CliRunner()
+
+FAKE_APP = '''
+import os
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+if os.environ.get("VISIONIT_BENCH"):
+    print("VISIONIT_BENCH imported", flush=True)
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.end_headers()
+        self.wfile.write(b"<html>ok</html>")
+
+    def log_message(self, *args):
+        pass
+
+
+HTTPServer(("127.0.0.1", int(os.environ["VISIONIT_PORT"])), Handler).serve_forever()
+'''
+
+
+@pytest.fixture
+def fake_app(tmp_path):
+    """Create a project whose main.py is a tiny HTTP server."""
+    (tmp_path / "main.py").write_text(FAKE_APP, encoding="utf-8")
+    with open(tmp_path / "build.json", "w", encoding="utf-8") as f:
+        json.dump({"app_name": "fake", "main_module": "main"}, f)
+    return tmp_path
+
+
+def test_percentile_and_summary():
+    """Test interpolated percentiles and phases missing from every run."""
+    assert percentile([10, 20, 30, 40], 50) == 25
+    assert percentile([5], 90) == 5
+
+    summary = summarize([{"spawn": 1, "import": None, "ready": 10, "render": 12},
+                         {"spawn": 3, "import": None, "ready": 20, "render": 30}])
+    assert summary["import"] is None
+    assert summary["ready"]["p50"] == 15
+    assert summary["render"]["max"] == 30
+
+
+def test_bench_startup_source(fake_app):
+    """Test a full run against the source entry point and its JSON results."""
+    assert available_targets(fake_app, {"app_name": "fake"}) == ["source"]
+
+    result = runner.invoke(app, ["bench", "startup", "--path", str(fake_app), "--runs", "2"])
+    assert result.exit_code == 0, result.output
+    assert "cold p50" in result.output
+
+    report = json.loads((fake_app / ".visionit" / "bench-startup.json").read_text(encoding="utf-8"))
+    assert report["build"]["app_name"] == "fake"
+    source = report["results"][0]
+    assert source["target"] == "source"
+    assert len(source["runs"]["cold"]) == 2 and len(source["runs"]["warm"]) == 2
+    for run in source["runs"]["cold"] + source["runs"]["warm"]:
+        assert run["spawn"] <= run["import"] <= run["ready"] <= run["render"]
+
+
+def test_app_exiting_early(tmp_path):
+    """Test that a crashing app is reported with its output."""
+    (tmp_path / "main.py").write_text("raise SystemExit('boom')\n", encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        measure_startup([sys.executable, "main.py"], tmp_path, {}, 1, timeout=10)
+
+
+def test_missing_build(fake_app):
+    """Test that asking for an executable that was not built fails cleanly."""
+    result = runner.invoke(app, ["bench", "startup", "--path", str(fake_app), "-t", "onefile"])
+
+    assert result.exit_code == 1
+    assert "No onefile build found" in result.output
+
+
+def test_generated_main_supports_headless(project):
+    """Test that generated apps take their port and headless mode from the bench."""
+    content = (project / "main.py").read_text(encoding="utf-8")
+
+    assert 'os.environ.get("VISIONIT_PORT", "")' in content
+    assert '{"fd": server_socket.fileno()}' in content
+    assert "VISIONIT_BENCH imported" in content
+    assert "native=not HEADLESS" in content
@@ -0,0 +1,79 @@
+"""Tests for VisionIT build commands and spec generation."""
+
+import ast
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.cli import app
+from visionit.commands.build import generate_pyinstaller_spec, load_build_config
+
+runner = CliRunner()
+
+
+def test_spec_single_mode_follows_config(project):
+    """Test that the spec builds only the mode selected in build.json."""
+    config = load_build_config(project)
+    content = generate_pyinstaller_spec(project, config).read_text(encoding="utf-8")
+
+    ast.parse(content)
+    assert content.count("Analysis(") == 1
+    assert "runtime_tmpdir=None" in content
+    assert "COLLECT(" not in content
+
+    config["onefile"] = False
+    content = generate_pyinstaller_spec(project, config).read_text(encoding="utf-8")
+    assert "COLLECT(" in content
+    assert "exclude_binaries=True" in content
+
+
+def test_spec_multi_output_shares_analysis(project):
+    """Test that onefile and onedir outputs share one Analysis and PYZ."""
+    config = load_build_config(project)
+    spec_path = generate_pyinstaller_spec(project, config, ["onefile", "onedir"])
+    content = spec_path.read_text(encoding="utf-8")
+
+    ast.parse(content)
+    assert content.count("Analysis(") == 1
+    assert content.count("PYZ(") == 1
+    assert content.count("EXE(") == 2
+    assert 'name="test_app_onedir"' in content
+    assert 'datas=[("templates", "templates")' in content
+
+
+def test_spec_honors_build_options(project):
+    """Test that windowed, icon and upx from build.json reach the spec."""
+    config = load_build_config(project)
+    config.update({"windowed": True, "icon": "static/icons/icon.ico", "upx": False})
+    content = generate_pyinstaller_spec(project, config).read_text(encoding="utf-8")
+
+    assert "console=False" in content
+    assert 'icon="static/icons/icon.ico"' in content
+    assert "upx=False" in content
+    assert '"numpy"' in content.split("excludes=")[1].split("\n")[0]
+
+
+def test_build_excludes_modules_from_toc(tmp_path):
+    """Test that exclude_modules really keeps a module out of the bundle."""
+    pytest.importorskip("PyInstaller")
+
+    (tmp_path / "main.py").write_text("import json\nimport csv\n", encoding="utf-8")
+    config = {
+        "app_name": "toc_app",
+        "main_module": "main",
+        "onefile": False,
+        "hidden_imports": [],
+        "exclude_modules": ["csv"],
+        "add_data": [],
+    }
+    with open(tmp_path / "build.json", "w", encoding="utf-8") as f:
+        json.dump(config, f)
+
+    result = runner.invoke(app, ["build", "onedir", "--path", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+
+    toc = ast.literal_eval((tmp_path / "build" / "toc_app" / "PYZ-00.toc").read_text())
+    modules = {entry[0] for entry in toc[1]}
+    assert "json" in modules
+    assert "csv" not in modules
@@ -0,0 +1,96 @@
+"""Tests for the VisionIT incremental build cache."""
+
+from typer.testing import CliRunner
+
+from visionit import build_cache
+from visionit.build_cache import (
+    artifact_path,
+    bundled_distributions,
+    compute_fingerprint,
+    is_up_to_date,
+    record_build,
+)
+from visionit.cli import app
+from visionit.commands.build import load_build_config
+
+runner = CliRunner()
+
+
+def test_fingerprint_is_stable(project):
+    """Test that unchanged inputs produce the same fingerprint."""
+    config = load_build_config(project)
+
+    assert compute_fingerprint(project, config, "onefile") == \
+        compute_fingerprint(project, config, "onefile")
+    assert compute_fingerprint(project, config, "onefile") != \
+        compute_fingerprint(project, config, "onedir")
+
+
+def test_fingerprint_tracks_inputs(project):
+    """Test that sources, data trees and config all change the fingerprint."""
+    config = load_build_config(project)
+    before = compute_fingerprint(project, config, "onefile")
+
+    (project / "actions" / "handlers.py").write_text("X = 1\n", encoding="utf-8")
+    after_source = compute_fingerprint(project, config, "onefile")
+    assert after_source != before
+
+    (project / "templates" / "index.html").write_text("<p>hi</p>", encoding="utf-8")
+    after_data = compute_fingerprint(project, config, "onefile")
+    assert after_data != after_source
+
+    config["windowed"] = True
+    assert compute_fingerprint(project, config, "onefile") != after_data
+
+
+def test_bundled_distributions(project, monkeypatch):
+    """Test that hidden imports count as the distribution that installs them."""
+    config = dict(load_build_config(project), hidden_imports=["_pytest.main", "actions.main_logic"])
+    names = bundled_distributions(project, config)
+    assert "pytest" in names and "_pytest" not in names
+    assert "actions" in names and "pyinstaller" in names
+
+    # Upgrading the distribution behind a hidden import invalidates the build
+    before = compute_fingerprint(project, config, "onefile")
+    version = build_cache.metadata.version
+    monkeypatch.setattr(build_cache.metadata, "version",
+                        lambda name: "99.0" if name == "pytest" else version(name))
+    assert compute_fingerprint(project, config, "onefile") != before
+
+
+def test_fingerprint_ignores_build_output(project):
+    """Test that files under build/ and dist/ do not affect the fingerprint."""
+    config = load_build_config(project)
+    before = compute_fingerprint(project, config, "onefile")
+
+    (project / "build").mkdir()
+    (project / "build" / "generated.py").write_text("X = 1\n", encoding="utf-8")
+
+    assert compute_fingerprint(project, config, "onefile") == before
+
+
+def test_is_up_to_date_requires_artifact(project):
+    """Test that a recorded build is only reused while its artifact exists."""
+    config = load_build_config(project)
+    fingerprint = compute_fingerprint(project, config, "onefile")
+    record_build(project, config, "onefile", fingerprint)
+
+    assert not is_up_to_date(project, config, "onefile")
+
+    artifact_path(project, config, "onefile").write_bytes(b"exe")
+    assert is_up_to_date(project, config, "onefile")
+
+    (project / "main.py").write_text("print('changed')\n", encoding="utf-8")
+    assert not is_up_to_date(project, config, "onefile")
+
+
+def test_build_onefile_skips_when_cached(project):
+    """Test that build onefile does not run PyInstaller for a cached build."""
+    config = load_build_config(project)
+    record_build(project, config, "onefile", compute_fingerprint(project, config, "onefile"))
+    artifact_path(project, config, "onefile").write_bytes(b"exe")
+
+    result = runner.invoke(app, ["build", "onefile", "--path", str(project)])
+
+    assert result.exit_code == 0
+    assert "up to date" in result.output
@@ -0,0 +1,109 @@
+"""Tests for the VisionIT bundle analysis report."""
+
+import json
+
+from typer.testing import CliRunner
+
+from visionit.bundle_analysis import analyze_bundle, import_chains, package_of, parse_xref
+from visionit.cli import app
+from visionit.commands.build import load_build_config
+
+runner = CliRunner()
+
+XREF = """<html><body>
+<div class="node">
+  <a name="main.py"></a>
+  <a target="code" href="main.py"><tt>main.py</tt></a>
+<span class="moduletype">Script</span>  <div class="import">
+imports:
+    <a href="#nicegui">nicegui</a>
+ &#8226;   <a href="#json">json</a>
+  </div>
+</div>
+<div class="node">
+  <a name="nicegui"></a>
+<span class="moduletype">Package</span>  <div class="import">
+imports:
+    <a href="#heavy.core">heavy.core</a>
+  </div>
+</div>
+<div class="node">
+  <a name="heavy.core"></a>
+<span class="moduletype">SourceModule</span>
+</div>
+</body></html>
+"""
+
+
+def make_workpath(project, files):
+    """Write a fake PyInstaller work directory with the given (name, size, typecode)."""
+    site = project / "venv_site" / "site-packages"
+    site.mkdir(parents=True)
+    toc = []
+    for name, size, typecode in files:
+        src = site / name.replace("/", "_")
+        src.write_bytes(b"x" * size)
+        toc.append((name, str(src), typecode))
+
+    workpath = project / "build" / "test_app"
+    workpath.mkdir(parents=True)
+    (workpath / "Analysis-00.toc").write_text(repr((["main.py"], toc, toc[:1])), encoding="utf-8")
+    (workpath / "xref-test_app.html").write_text(XREF, encoding="utf-8")
+    return workpath
+
+
+def test_package_of():
+    """Test that TOC entries are grouped by top-level package."""
+    assert package_of("nicegui.elements.button", "PYMODULE") == "nicegui"
+    assert package_of("numpy/core/_multiarray.so", "EXTENSION") == "numpy"
+    assert package_of("python3.11/lib-dynload/_ssl.cpython-311.so", "EXTENSION") == "_ssl"
+    assert package_of("libcrypto.so.3", "BINARY") == "libcrypto"
+
+
+def test_import_chains(tmp_path):
+    """Test that the shortest chain from the script to each package is found."""
+    xref = tmp_path / "xref.html"
+    xref.write_text(XREF, encoding="utf-8")
+
+    graph, scripts = parse_xref(xref)
+    chains = import_chains(graph, scripts)
+
+    assert scripts == ["main.py"]
+    assert chains["heavy"] == ["main.py", "nicegui", "heavy.core"]
+    assert chains["json"] == ["main.py", "json"]
+
+
+def test_analyze_bundle_ranks_and_suggests(project):
+    """Test sizes, ranking and exclude suggestions for transitive heavy packages."""
+    workpath = make_workpath(project, [
+        ("heavy.core", 2 << 20, "PYMODULE"),
+        ("heavy/_native.so", 1 << 20, "EXTENSION"),
+        ("nicegui", 1000, "PYMODULE"),
+    ])
+
+    report = analyze_bundle(project, load_build_config(project), workpath)
+
+    assert [p["name"] for p in report["packages"]] == ["heavy", "nicegui"]
+    assert report["packages"][0]["size"] == 3 << 20
+    assert report["packages"][0]["files"] == 2
+    assert report["suggested_excludes"] == ["heavy"]
+
+
+def test_build_analyze_json(project):
+    """Test the machine-readable output of build analyze."""
+    make_workpath(project, [("nicegui", 1000, "PYMODULE")])
+
+    result = runner.invoke(app, ["build", "analyze", "--path", str(project), "--json"])
+
+    assert result.exit_code == 0
+    report = json.loads(result.output)
+    assert report["app_name"] == "test_app"
+    assert report["packages"][0]["name"] == "nicegui"
+
+
+def test_build_analyze_without_build(project):
+    """Test that build analyze explains how to produce the analysis."""
+    result = runner.invoke(app, ["build", "analyze", "--path", str(project)])
+
+    assert result.exit_code != 0
+    assert "build onedir" in result.output
@@ -0,0 +1,153 @@
+"""Tests for the VisionIT database analyzer."""
+
+import json
+import sqlite3
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.cli import app
+from visionit.db_analysis import (
+    apply_proposals, check_query_plans, find_missing_indexes, load_queries, propose_indexes,
+)
+from visionit.prisma_schema import parse_schema
+
+runner = CliRunner()
+
+SCHEMA = '''datasource db {
+  provider = "sqlite"
+  url      = "file:./dev.db"
+}
+
+model User {
+  id    Int    @id @default(autoincrement())
+  email String @unique
+  name  String
+  posts Post[]
+}
+
+model Post {
+  id       Int    @id @default(autoincrement())
+  title    String @map("post_title")
+  author   User   @relation(fields: [authorId], references: [id])
+  authorId Int
+  tagged   Tag?   @relation(fields: [tagId], references: [id])
+  tagId    Int?
+
+  @@index([tagId])
+  @@map("posts")
+}
+
+model Tag {
+  id    Int    @id
+  label String // closing brace in a comment }
+  posts Post[]
+}
+'''
+
+
+def make_database(path):
+    """Create the tables of SCHEMA, without the missing indexes."""
+    connection = sqlite3.connect(path)
+    connection.executescript('''
+        CREATE TABLE "User" (id INTEGER PRIMARY KEY, email TEXT UNIQUE, name TEXT);
+        CREATE TABLE "Tag" (id INTEGER PRIMARY KEY, label TEXT);
+        CREATE TABLE "posts" (id INTEGER PRIMARY KEY, post_title TEXT, authorId INTEGER, tagId INTEGER);
+        CREATE INDEX "posts_tagId_idx" ON "posts"(tagId);
+    ''')
+    connection.close()
+
+
+def test_find_missing_indexes():
+    """Test that uncovered foreign keys and lookup fields are flagged."""
+    schema = parse_schema(SCHEMA)
+    findings = find_missing_indexes(schema, [
+        {"model": "User", "where": ["name"]},
+        {"model": "User", "where": ["email"]},
+        {"model": "Post", "where": ["tagId"]},
+    ])
+
+    assert [(f["model"], f["fields"]) for f in findings] == [
+        ("Post", ["authorId"]),
+        ("User", ["name"]),
+    ]
+
+
+def test_query_plans(tmp_path):
+    """Test full-table scan detection on a real SQLite database."""
+    schema = parse_schema(SCHEMA)
+    # URI characters in the path must not change which file is opened
+    (tmp_path / "a#b%20c").mkdir()
+    database = tmp_path / "a#b%20c" / "dev.db"
+    make_database(database)
+    queries_file = tmp_path / "queries.sql"
+    queries_file.write_text(
+        '-- recorded queries\n'
+        'SELECT * FROM "posts" WHERE "post_title" = ? ORDER BY id;\n'
+        'SELECT * FROM "posts" WHERE tagId = ?;\n'
+        'SELECT * FROM missing;\n',
+        encoding="utf-8",
+    )
+
+    plans = check_query_plans(schema, database, load_queries(queries_file))
+
+    assert plans[0]["full_scan"] and plans[0]["model"] == "Post" and plans[0]["where"] == ["title"]
+    assert not plans[1]["full_scan"]
+    assert plans[2]["error"]
+
+    proposals = propose_indexes(schema, find_missing_indexes(schema), plans)
+    assert proposals == {"Post": ["@@index([authorId])", "@@index([title])"]}
+
+    updated = apply_proposals(SCHEMA, proposals)
+    assert "  @@map(\"posts\")\n  @@index([authorId])\n  @@index([title])\n}\n\nmodel Tag" in updated
+    assert parse_schema(updated)["models"][1]["indexes"][1:] == [
+        {"fields": ["authorId"], "name": None},
+        {"fields": ["title"], "name": None},
+    ]
+
+
+def test_load_queries_validation(tmp_path):
+    """Test that a malformed query set names the bad entry."""
+    queries_file = tmp_path / "queries.json"
+    queries_file.write_text(json.dumps([{"model": "User"}, {"where": ["name"]}]), encoding="utf-8")
+    with pytest.raises(ValueError, match=r'^entry 1: needs a "model" name or a "sql" statement'):
+        load_queries(queries_file)
+
+    queries_file.write_text(json.dumps([{"model": "User", "where": "name"}]), encoding="utf-8")
+    with pytest.raises(ValueError, match=r'^entry 0: "where" must be a list'):
+        load_queries(queries_file)
+
+    (tmp_path / "db").mkdir()
+    (tmp_path / "db" / "schema.prisma").write_text(SCHEMA, encoding="utf-8")
+    queries_file.write_text(json.dumps(["SELECT 1"]), encoding="utf-8")
+    result = runner.invoke(app, ["db", "analyze", "--path", str(tmp_path), "-q", str(queries_file)])
+    assert result.exit_code == 1
+    assert "entry 0: expected an object, got str" in result.output
+
+
+def test_db_analyze(tmp_path):
+    """Test the analyze command, from the report to --apply."""
+    (tmp_path / "db").mkdir()
+    schema_path = tmp_path / "db" / "schema.prisma"
+    schema_path.write_text(SCHEMA, encoding="utf-8")
+    (tmp_path / "db" / "queries.json").write_text(
+        json.dumps([{"model": "User", "where": ["name"], "order_by": ["email"]}]), encoding="utf-8"
+    )
+
+    result = runner.invoke(app, ["db", "analyze", "--path", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert "Post(authorId)" in result.output
+    assert "dev.db not found" in result.output
+
+    make_database(tmp_path / "db" / "dev.db")
+    result = runner.invoke(app, ["db", "analyze", "--path", str(tmp_path), "--json"])
+    report = json.loads(result.output)
+    assert report["query_plans"][0]["full_scan"]
+    assert report["proposed_indexes"] == {"Post": ["@@index([authorId])"], "User": ["@@index([name])"]}
+
+    result = runner.invoke(app, ["db", "analyze", "--path", str(tmp_path), "--apply"])
+    assert result.exit_code == 0, result.output
+    assert "+  @@index([name])" in result.output
+
+    result = runner.invoke(app, ["db", "analyze", "--path", str(tmp_path)])
+    assert "No index to add" in result.output
@@ -0,0 +1,117 @@
+"""Tests for the generated process-wide database client."""
+
+import os
+import sqlite3
+import subprocess
+import sys
+import textwrap
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.cli import app
+
+runner = CliRunner()
+
+# Stands in for the client `prisma generate` writes into site-packages
+FAKE_PRISMA = '''
+import asyncio
+
+
+class Prisma:
+    connects = 0
+
+    def __init__(self):
+        self.connected = False
+        self.statements = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def connect(self):
+        await asyncio.sleep(0.05)
+        Prisma.connects += 1
+        self.connected = True
+
+    async def disconnect(self):
+        self.connected = False
+
+    async def query_raw(self, statement):
+        self.statements.append(statement)
+        return []
+'''
+
+CHECK = '''
+import asyncio
+import sqlite3
+
+from db import client
+from prisma import Prisma
+
+
+async def main():
+    clients = await asyncio.gather(*(client.get_db() for _ in range(20)))
+    assert Prisma.connects == 1 and all(c is clients[0] for c in clients)
+    print("statements", len(clients[0].statements))
+
+    active = peak = 0
+
+    @client.limited
+    async def query():
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+
+    await asyncio.gather(*(query() for _ in range(50)))
+    print("peak", peak)
+
+    await client.disconnect_db()
+    assert not clients[0].is_connected()
+    # A cancelled connection attempt is retried, not re-raised
+    client._connection = asyncio.ensure_future(asyncio.sleep(10))
+    client._connection.cancel()
+    await asyncio.sleep(0)
+    await client.get_db()
+    print("connects", Prisma.connects)
+
+
+asyncio.run(main())
+print("journal", sqlite3.connect("dev.db").execute("PRAGMA journal_mode").fetchone()[0])
+'''
+
+
+# Without connection_limit, Prisma pools cpus * 2 + 1 connections
+@pytest.mark.parametrize("profile, statements, peak, journal", [
+    ("default", 0, (os.cpu_count() or 1) * 2 + 1, "delete"),
+    ("performance", 0, 8, "wal"),
+])
+def test_shared_client(tmp_path, monkeypatch, profile, statements, peak, journal):
+    """Test one connection for concurrent callers, the query limit and the profile."""
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(app, ["new", "app_db", "--no-interactive", "--db-profile", profile])
+    assert result.exit_code == 0, result.output
+
+    project = tmp_path / "app_db"
+    main_code = (project / "main.py").read_text(encoding="utf-8")
+    assert "app.on_startup(connect_db)" in main_code
+    assert "app.on_shutdown(disconnect_db)" in main_code
+    # main.py must import before `prisma generate` has run
+    assert "\nfrom db.client import" not in main_code
+
+    fake = tmp_path / "site" / "prisma"
+    fake.mkdir(parents=True)
+    (fake / "__init__.py").write_text(FAKE_PRISMA, encoding="utf-8")
+    sqlite3.connect(project / "dev.db").close()
+
+    output = subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(CHECK)],
+        cwd=project,
+        env=dict(os.environ, PYTHONPATH=f"{project}{os.pathsep}{tmp_path / 'site'}"),
+        capture_output=True,
+        text=True,
+    )
+    assert output.returncode == 0, output.stderr
+    assert output.stdout.split() == ["statements", str(statements), "peak", str(peak),
+                                     "connects", "2", "journal", journal]
@@ -0,0 +1,123 @@
+"""Tests for the VisionIT streaming export."""
+
+import csv
+import gzip
+import json
+import sqlite3
+
+from typer.testing import CliRunner
+
+from visionit.cli import app
+from visionit.db_export import connect_readonly, iter_pages, resolve_targets, split_filters
+from visionit.db_seed import seed_file
+from visionit.prisma_schema import parse_schema
+from tests.test_db_seed import SCHEMA, TABLES
+
+runner = CliRunner()
+
+
+def make_project(path, users=25):
+    """A project with SCHEMA and a dev.db holding users and one post each."""
+    (path / "db").mkdir(parents=True)
+    (path / "db" / "schema.prisma").write_text(SCHEMA, encoding="utf-8")
+    connection = sqlite3.connect(path / "db" / "dev.db")
+    connection.executescript(TABLES)
+    connection.executemany(
+        'INSERT INTO "User" (email, role, active, score, createdAt) VALUES (?, ?, ?, ?, ?)',
+        [(f"u{i}@x.io", "USER", i % 2, None, 1704153600000 + i) for i in range(users)],
+    )
+    connection.executemany(
+        'INSERT INTO "posts" (id, post_title, meta, authorId) VALUES (?, ?, ?, ?)',
+        [(f"c{i:024d}", f"Post {i}", '{"n": %d}' % i, i + 1) for i in range(users)],
+    )
+    connection.commit()
+    connection.close()
+    return path
+
+
+def test_keyset_pages(tmp_path):
+    """Test that pages resume after the last key, with composite and rowid keys."""
+    # URI characters in the path must not change which file is opened
+    (tmp_path / "a#b%20c").mkdir()
+    database = tmp_path / "a#b%20c" / "t.db"
+    connection = sqlite3.connect(database)
+    connection.executescript('''
+        CREATE TABLE pair (a INTEGER, b TEXT, v TEXT, PRIMARY KEY (a, b));
+        CREATE TABLE log (line TEXT);
+    ''')
+    connection.executemany("INSERT INTO pair VALUES (?, ?, ?)",
+                           [(a, b, f"{a}{b}") for a in range(3) for b in "xyz"])
+    connection.executemany("INSERT INTO log VALUES (?)", [(str(i),) for i in range(7)])
+    connection.commit()
+    connection.close()
+
+    connection = connect_readonly(database)
+    pages = list(iter_pages(connection, "pair", ["a", "b", "v"], ["a", "b"], page_size=4))
+    assert [len(page) for page in pages] == [4, 4, 1]
+    assert [row[2] for page in pages for row in page] == [f"{a}{b}" for a in range(3) for b in "xyz"]
+
+    pages = list(iter_pages(connection, "log", ["line"], ["rowid"], ["line != '3'"], page_size=3))
+    assert [row for page in pages for row in page] == [(str(i),) for i in range(7) if i != 3]
+
+    targets = resolve_targets({"models": []}, connection, None)
+    assert [t["name"] for t in targets] == ["log", "pair"]
+    assert split_filters(["pair: a > 0", "1 = 1"], targets) == {"log": ["1 = 1"],
+                                                                "pair": ["a > 0", "1 = 1"]}
+    connection.close()
+
+
+def test_export_round_trip(tmp_path):
+    """Test that a JSONL export seeds an empty database with the same values."""
+    project = make_project(tmp_path / "app")
+    result = runner.invoke(app, ["db", "export", "--path", str(project), "-o", str(tmp_path / "out"),
+                                 "--page-size", "4", "--gzip"])
+    assert result.exit_code == 0, result.output
+    assert "✅ 50 rows from 2 models" in result.output
+
+    with gzip.open(tmp_path / "out" / "User.jsonl.gz", "rt", encoding="utf-8") as f:
+        users = [json.loads(line) for line in f]
+    assert len(users) == 25
+    assert users[1] == {"id": 2, "email": "u1@x.io", "role": "USER", "active": True, "score": None,
+                        "createdAt": "2024-01-02T00:00:00.001Z"}
+
+    copy = tmp_path / "copy.db"
+    connection = sqlite3.connect(copy)
+    connection.executescript(TABLES)
+    connection.close()
+    schema = parse_schema(SCHEMA)
+    for name in ("User", "Post"):
+        with gzip.open(tmp_path / "out" / f"{name}.jsonl.gz", "rt", encoding="utf-8") as f:
+            (tmp_path / f"{name}.jsonl").write_text(f.read(), encoding="utf-8")
+        seed_file(schema, copy, tmp_path / f"{name}.jsonl")
+
+    original = sqlite3.connect(project / "db" / "dev.db")
+    copied = sqlite3.connect(copy)
+    for table in ("User", "posts"):
+        query = f'SELECT * FROM "{table}" ORDER BY id'
+        assert copied.execute(query).fetchall() == original.execute(query).fetchall()
+    original.close()
+    copied.close()
+
+
+def test_export_csv_chunks(tmp_path):
+    """Test csv-chunks with a filter, and stdout output."""
+    project = make_project(tmp_path / "app")
+    out = tmp_path / "out"
+    result = runner.invoke(app, ["db", "export", "Post", "--path", str(project), "-o", str(out),
+                                 "-f", "csv-chunks", "--chunk-rows", "10", "-w", "Post: authorId > 5"])
+    assert result.exit_code == 0, result.output
+
+    chunks = sorted((out / "Post").iterdir())
+    assert [c.name for c in chunks] == ["part-00000.csv", "part-00001.csv"]
+    rows = [row for chunk in chunks for row in csv.DictReader(chunk.open(encoding="utf-8"))]
+    assert len(rows) == 20
+    assert rows[0] == {"id": "c000000000000000000000005", "title": "Post 5", "meta": '{"n": 5}',
+                       "authorId": "6"}
+
+    result = runner.invoke(app, ["db", "export", "posts", "--path", str(project), "-o", "-",
+                                 "-w", "authorId = 1"])
+    assert result.exit_code == 0, result.output
+    assert '"title": "Post 0"' in result.output
+
+    result = runner.invoke(app, ["db", "export", "--path", str(project), "-o", "-"])
+    assert result.exit_code == 1
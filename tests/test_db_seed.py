@@ -0,0 +1,181 @@
+"""Tests for the VisionIT streaming seed loader."""
+
+import json
+import sqlite3
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.cli import app
+from visionit.db_seed import SeedError, seed_file
+from visionit.prisma_schema import parse_schema
+
+runner = CliRunner()
+
+SCHEMA = '''datasource db {
+  provider = "sqlite"
+  url      = "file:./dev.db"
+}
+
+enum Role {
+  USER
+  ADMIN
+}
+
+model User {
+  id        Int      @id @default(autoincrement())
+  email     String   @unique
+  role      Role     @default(USER)
+  active    Boolean  @default(true)
+  score     Float?
+  createdAt DateTime @default(now())
+  posts     Post[]
+}
+
+model Post {
+  id       String @id @default(cuid())
+  title    String @map("post_title")
+  meta     Json?
+  author   User   @relation(fields: [authorId], references: [id])
+  authorId Int
+
+  @@map("posts")
+}
+'''
+
+# The tables `prisma db push` creates for SCHEMA
+TABLES = '''
+    CREATE TABLE "User" (id INTEGER PRIMARY KEY AUTOINCREMENT, email TEXT NOT NULL UNIQUE,
+                         role TEXT NOT NULL DEFAULT 'USER', active BOOLEAN NOT NULL DEFAULT true,
+                         score REAL, createdAt DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP);
+    CREATE TABLE "posts" (id TEXT NOT NULL PRIMARY KEY, post_title TEXT NOT NULL, meta TEXT,
+                          authorId INTEGER NOT NULL REFERENCES "User"(id));
+'''
+
+
+@pytest.fixture
+def seed_project(tmp_path):
+    """A project with SCHEMA and its empty dev.db."""
+    (tmp_path / "db" / "seed").mkdir(parents=True)
+    (tmp_path / "db" / "schema.prisma").write_text(SCHEMA, encoding="utf-8")
+    connection = sqlite3.connect(tmp_path / "db" / "dev.db")
+    connection.executescript(TABLES)
+    connection.close()
+    return tmp_path
+
+
+def test_seed_csv_and_jsonl(seed_project):
+    """Test type conversion, defaults and batching on both formats."""
+    schema = parse_schema(SCHEMA)
+    database = seed_project / "db" / "dev.db"
+    users = seed_project / "users.csv"
+    users.write_text("email,role,active,score,createdAt\n"
+                     + "".join(f"u{i}@x.io,{'ADMIN' if i == 0 else ''},{'no' if i == 1 else ''},"
+                               f"{i / 2 if i % 2 else ''},{'2024-01-02T00:00:00Z' if i == 0 else ''}\n"
+                               for i in range(25)),
+                     encoding="utf-8")
+    batches = []
+
+    result = seed_file(schema, database, users, batch_size=10, progress=batches.append)
+    assert result["model"] == "User" and result["rows"] == 25
+    assert batches == [10, 20, 25]
+
+    posts = seed_project / "02_posts.jsonl"
+    posts.write_text(json.dumps({"title": "Hello", "authorId": 1, "meta": {"tags": ["a"]}}) + "\n\n"
+                     + json.dumps({"title": "Bye", "authorId": 2}) + "\n", encoding="utf-8")
+    assert seed_file(schema, database, posts)["rows"] == 2
+
+    connection = sqlite3.connect(database)
+    first, second = connection.execute(
+        'SELECT role, active, score, createdAt FROM "User" ORDER BY id LIMIT 2').fetchall()
+    assert first == ("ADMIN", 1, None, 1704153600000)
+    assert second[:3] == ("USER", 0, 0.5) and second[3] > 1704153600000
+    post = connection.execute('SELECT id, post_title, meta FROM "posts" ORDER BY authorId').fetchone()
+    assert post[0].startswith("c") and len(post[0]) == 25
+    assert post[1:] == ("Hello", '{"tags": ["a"]}')
+    connection.close()
+
+
+def test_seed_validation(seed_project):
+    """Test that invalid rows stop the load, or are skipped and counted."""
+    schema = parse_schema(SCHEMA)
+    database = seed_project / "db" / "dev.db"
+    users = seed_project / "User.jsonl"
+    users.write_text('{"email": "a@x.io"}\n{"email": "b@x.io", "role": "ROOT"}\n'
+                     '{"role": "USER"}\n{"email": "c@x.io", "posts": []}\n{"email": 3}\n',
+                     encoding="utf-8")
+
+    with pytest.raises(SeedError, match="line 2: role: expected one of USER, ADMIN"):
+        seed_file(schema, database, users, batch_size=1)
+
+    # a@x.io was committed in its own batch before the error
+    users.write_text(users.read_text(encoding="utf-8").replace("a@x.io", "d@x.io"), encoding="utf-8")
+    errors = {"count": 0, "messages": []}
+    result = seed_file(schema, database, users, errors=errors)
+    assert result["rows"] == 1
+    assert errors["count"] == 4
+    assert errors["messages"][1:] == ["line 3: missing required field email",
+                                      "line 4: not a column: posts",
+                                      "line 5: email: expected a string (got 3)"]
+
+
+def test_seed_too_many_values(seed_project):
+    """Test that a CSV row longer than the header is reported, not a crash."""
+    schema = parse_schema(SCHEMA)
+    database = seed_project / "db" / "dev.db"
+    users = seed_project / "users.csv"
+    users.write_text("email\na@x.io,A,extra\nb@x.io\n", encoding="utf-8")
+
+    with pytest.raises(SeedError, match="line 2: too many values"):
+        seed_file(schema, database, users)
+    errors = {"count": 0, "messages": []}
+    assert seed_file(schema, database, users, errors=errors)["rows"] == 1
+    assert errors["messages"] == ["line 2: too many values"]
+
+    users.write_text("email\nc@x.io,C,extra\n", encoding="utf-8")
+    result = runner.invoke(app, ["db", "seed", str(users), "--path", str(seed_project),
+                                 "--skip-invalid"])
+    assert result.exit_code == 0, result.output
+    assert "line 2: too many values" in result.output
+
+
+def test_seed_generated_keys(seed_project):
+    """Test autoincrement keys set on some rows only, and dbgenerated() keys."""
+    schema = parse_schema(SCHEMA)
+    database = seed_project / "db" / "dev.db"
+    users = seed_project / "User.jsonl"
+    users.write_text('{"email": "a@x.io"}\n{"id": 100, "email": "b@x.io"}\n{"email": "c@x.io"}\n',
+                     encoding="utf-8")
+    assert seed_file(schema, database, users)["rows"] == 3
+    connection = sqlite3.connect(database)
+    assert connection.execute('SELECT id FROM "User" ORDER BY id').fetchall() == [(1,), (100,), (101,)]
+    connection.execute("CREATE TABLE Tag (id TEXT PRIMARY KEY DEFAULT (hex(randomblob(8))), name TEXT)")
+    connection.commit()
+    connection.close()
+
+    schema = parse_schema(SCHEMA + 'model Tag {\n'
+                          '  id   String @id @default(dbgenerated("hex(randomblob(8))"))\n'
+                          '  name String\n}\n')
+    tags = seed_project / "Tag.jsonl"
+    tags.write_text('{"name": "a"}\n{"id": "t2", "name": "b"}\n', encoding="utf-8")
+    with pytest.raises(SeedError, match="line 2: id is generated by the database: set it in every row"):
+        seed_file(schema, database, tags)
+
+
+def test_db_seed_command(seed_project):
+    """Test the command on db/seed/, with progress and foreign key errors."""
+    seed_dir = seed_project / "db" / "seed"
+    (seed_dir / "01_User.csv").write_text("email\na@x.io\nb@x.io\n", encoding="utf-8")
+    (seed_dir / "02_Post.csv").write_text("title,authorId\nHi,2\n", encoding="utf-8")
+
+    result = runner.invoke(app, ["db", "seed", "--path", str(seed_project)])
+    assert result.exit_code == 0, result.output
+    assert "✅ User: 2 rows" in result.output
+    assert "rows/s" in result.output
+    assert "3 rows from 2 files" in result.output
+
+    bad = seed_project / "posts.csv"
+    bad.write_text("title,authorId\nOrphan,99\n", encoding="utf-8")
+    result = runner.invoke(app, ["db", "seed", str(bad), "--path", str(seed_project), "-m", "Post"])
+    assert result.exit_code == 1
+    assert "FOREIGN KEY constraint failed" in result.output
@@ -0,0 +1,74 @@
+"""Tests for the VisionIT dependency lock and wheelhouse."""
+
+from importlib import metadata
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.cli import app
+from visionit.dependency_lock import (
+    format_lock, install_command, lock_entries, read_lock, requirements_hash, wheelhouse_missing,
+)
+
+runner = CliRunner()
+
+REPORT = {
+    "install": [
+        {"metadata": {"name": "NiceGUI", "version": "1.4.2"},
+         "download_info": {"archive_info": {"hashes": {"sha256": "aa11"}}}},
+        {"metadata": {"name": "typing_extensions", "version": "4.9.0"},
+         "download_info": {"archive_info": {"hash": "sha256=bb22"}}},
+    ],
+}
+
+
+def test_lock_round_trip(tmp_path):
+    """Test that a pip report becomes a hashed lock that reads back as pins."""
+    package_file = tmp_path / "package.txt"
+    package_file.write_text("nicegui>=1.4.0\n", encoding="utf-8")
+    entries = lock_entries(REPORT)
+    assert [e["hash"] for e in entries] == ["sha256:aa11", "sha256:bb22"]
+
+    lock_file = tmp_path / "package.lock"
+    lock_file.write_text(format_lock(entries, requirements_hash(package_file), "CPython 3.11"),
+                         encoding="utf-8")
+    assert "nicegui==1.4.2 \\\n    --hash=sha256:aa11\n" in lock_file.read_text(encoding="utf-8")
+    lock = read_lock(lock_file)
+    assert lock == {"source": requirements_hash(package_file),
+                    "packages": {"nicegui": "1.4.2", "typing-extensions": "4.9.0"}}
+
+    # Comments and blank lines do not make the lock stale
+    package_file.write_text("# UI\nnicegui>=1.4.0   \n\n", encoding="utf-8")
+    assert requirements_hash(package_file) == lock["source"]
+
+    offline = install_command(lock, package_file, lock_file, tmp_path / "wheelhouse")
+    assert offline[3:] == ["install", "--no-index", "--find-links", str(tmp_path / "wheelhouse"),
+                           "--no-deps", "nicegui==1.4.2", "typing-extensions==4.9.0"]
+    assert "--require-hashes" in install_command(lock, package_file, lock_file)
+
+    (tmp_path / "nicegui-1.4.2-py3-none-any.whl").touch()
+    assert wheelhouse_missing(lock["packages"], tmp_path) == ["typing-extensions==4.9.0"]
+
+    with pytest.raises(ValueError, match="cannot be locked"):
+        lock_entries({"install": [{"metadata": {"name": "app", "version": "0.1"},
+                                   "download_info": {"dir_info": {}}}]})
+
+
+def test_install_fast_path(tmp_path):
+    """Test that a satisfied lock skips pip and that a stale one is ignored."""
+    package_file = tmp_path / "package.txt"
+    package_file.write_text("typer\n", encoding="utf-8")
+    entries = [{"name": "typer", "version": metadata.version("typer"), "hash": "sha256:00"}]
+    (tmp_path / "package.lock").write_text(
+        format_lock(entries, requirements_hash(package_file), "test"), encoding="utf-8")
+
+    result = runner.invoke(app, ["install", "--path", str(tmp_path), "--offline"])
+    assert result.exit_code == 0, result.output
+    assert "Dependencies are up to date (1 locked packages)" in result.output
+    assert not (tmp_path / ".visionit").exists()
+
+    package_file.write_text("typer\nclick\n", encoding="utf-8")
+    result = runner.invoke(app, ["install", "--path", str(tmp_path), "--offline"])
+    assert result.exit_code == 1
+    assert "package.lock is older than package.txt" in result.output
+    assert "wheelhouse not found" in result.output
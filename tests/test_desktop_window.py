@@ -0,0 +1,114 @@
+"""Tests for VisionIT desktop window helpers."""
+
+import socket
+import threading
+
+import pytest
+
+from visionit.desktop_window import bind_server_socket, parse_port_range, wait_for_server
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_wait_for_server_listening():
+    """Test that a listening socket is detected immediately."""
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        port = server.getsockname()[1]
+
+        elapsed = wait_for_server("127.0.0.1", port, timeout=5)
+
+    assert 0 <= elapsed < 5
+
+
+def test_wait_for_server_ready_event():
+    """Test that the launcher waits for the startup hook before polling."""
+    port = _free_port()
+    ready = threading.Event()
+    server = socket.socket()
+
+    def start():
+        server.bind(("127.0.0.1", port))
+        server.listen()
+        ready.set()
+
+    timer = threading.Timer(0.1, start)
+    timer.start()
+    try:
+        elapsed = wait_for_server("127.0.0.1", port, timeout=5, ready_event=ready)
+    finally:
+        timer.join()
+        server.close()
+
+    assert elapsed >= 0.1
+
+
+def test_wait_for_server_timeout():
+    """Test that an unreachable server raises TimeoutError."""
+    with pytest.raises(TimeoutError):
+        wait_for_server("127.0.0.1", _free_port(), timeout=0.2)
+
+
+def test_wait_for_server_dead_thread():
+    """Test that a crashed server thread is reported without waiting for the timeout."""
+    thread = threading.Thread(target=lambda: None)
+    thread.start()
+    thread.join()
+
+    with pytest.raises(RuntimeError):
+        wait_for_server("127.0.0.1", _free_port(), timeout=30, server_thread=thread)
+
+
+def test_parse_port_range():
+    """Test single ports, ranges and invalid values."""
+    assert parse_port_range("8080") == (8080, 8080)
+    assert parse_port_range("8100-8199") == (8100, 8199)
+    with pytest.raises(ValueError):
+        parse_port_range("9000-8000")
+
+
+def test_bind_server_socket_skips_busy_ports():
+    """Test that a busy port is skipped and an exhausted range is reported."""
+    with socket.socket() as busy:
+        busy.bind(("127.0.0.1", 0))
+        port = busy.getsockname()[1]
+
+        with bind_server_socket("127.0.0.1") as sock:
+            assert sock.getsockname()[1] != port
+        with pytest.raises(RuntimeError):
+            bind_server_socket("127.0.0.1", port_range=(port, port))
+        if port < 65535:
+            with bind_server_socket("127.0.0.1", port_range=(port, port + 1)) as sock:
+                assert sock.getsockname()[1] == port + 1
+
+
+def test_bind_server_socket_keeps_the_port():
+    """Test that the port stays reserved until the server uses the socket."""
+    port = _free_port()
+    with bind_server_socket("127.0.0.1", port=port) as sock:
+        assert sock.getsockname()[1] == port
+        # A second instance started at the same time cannot get it
+        with pytest.raises(RuntimeError):
+            bind_server_socket("127.0.0.1", port_range=(port, port))
+        # Not listening yet: readiness checks only succeed once the server runs
+        with pytest.raises(TimeoutError):
+            wait_for_server("127.0.0.1", port, timeout=0.1)
+        sock.listen()
+        assert wait_for_server("127.0.0.1", port, timeout=5) < 5
+
+
+def test_bind_server_socket_port_choice(monkeypatch):
+    """Test that an explicit port wins over VISIONIT_PORT."""
+    port = _free_port()
+    monkeypatch.setenv("VISIONIT_PORT", str(port))
+    with bind_server_socket("127.0.0.1") as sock:
+        assert sock.getsockname()[1] == port
+
+    other = _free_port()
+    with bind_server_socket("127.0.0.1", port=other) as sock:
+        assert sock.getsockname()[1] == other
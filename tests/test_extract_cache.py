@@ -0,0 +1,192 @@
+"""Tests for the VisionIT onefile extraction cache."""
+
+import json
+import os
+import struct
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.cli import app
+from visionit.commands.build import generate_pyinstaller_spec, load_build_config
+from visionit.extract_cache import COOKIE_FORMAT, COOKIE_MAGIC, attach_payload
+from visionit.onefile_launcher import (
+    COOKIE_SIZE,
+    IN_USE_PREFIX,
+    MARKER_FILE,
+    TRAILER_SIZE,
+    ensure_extracted,
+    read_trailer,
+)
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def launcher(tmp_path):
+    """Create a fake launcher executable carrying a small bundle."""
+    bundle = tmp_path / "bundle"
+    (bundle / "_internal").mkdir(parents=True)
+    (bundle / "app").write_text("#!/bin/sh\necho app\n", encoding="utf-8")
+    (bundle / "app").chmod(0o755)
+    (bundle / "_internal" / "data.txt").write_text("data", encoding="utf-8")
+
+    exe = tmp_path / "app"
+    # A PyInstaller archive holding nothing but its cookie
+    cookie = struct.pack(COOKIE_FORMAT, COOKIE_MAGIC, COOKIE_SIZE, 0, 0, 311, b"libpython")
+    exe.write_bytes(b"\x7fELF fake launcher" + cookie + b"section headers")
+    digest = attach_payload(exe, bundle)
+    return exe, digest
+
+
+def test_payload_trailer(launcher):
+    """Test that the payload hash and size are readable from the trailer."""
+    exe, digest = launcher
+    found, crc, size = read_trailer(exe)
+
+    assert found == digest
+    assert 0 <= crc < 2**32
+    assert 0 < size < exe.stat().st_size
+
+    # The bootloader finds a cookie right before the trailer, pointing at its archive
+    content = exe.read_bytes()
+    cookie = content[-(TRAILER_SIZE + COOKIE_SIZE) : -TRAILER_SIZE]
+    _, length, *_ = struct.unpack(COOKIE_FORMAT, cookie)
+    assert content[len(content) - TRAILER_SIZE - length :].startswith(COOKIE_MAGIC)
+
+
+def test_extract_once_and_reuse(launcher, tmp_path):
+    """Test that the bundle is unpacked once and reused on later launches."""
+    exe, digest = launcher
+    root = tmp_path / "cache"
+
+    target = ensure_extracted(exe, root)
+    assert target.name == digest[:16]
+    assert (target / "_internal" / "data.txt").read_text(encoding="utf-8") == "data"
+    if os.name == "posix":
+        assert os.access(target / "app", os.X_OK)
+
+    marker_mtime = (target / MARKER_FILE).stat().st_mtime_ns
+    assert ensure_extracted(exe, root) == target
+    assert (target / MARKER_FILE).stat().st_mtime_ns == marker_mtime
+
+
+def test_damaged_cache_is_extracted_again(launcher, tmp_path):
+    """Test that a damaged copy in use is left alone and the bundle is unpacked next to it."""
+    exe, _ = launcher
+    root = tmp_path / "cache"
+    target = ensure_extracted(exe, root)
+    # Another launch (here our parent process) still runs from it
+    (target / f"{IN_USE_PREFIX}{os.getpid()}").rename(target / f"{IN_USE_PREFIX}{os.getppid()}")
+
+    (target / "_internal" / "data.txt").write_text("tampered!", encoding="utf-8")
+    fresh = ensure_extracted(exe, root)
+
+    assert fresh != target and fresh.name.startswith(target.name)
+    assert (fresh / "_internal" / "data.txt").read_text(encoding="utf-8") == "data"
+    assert (target / "_internal" / "data.txt").read_text(encoding="utf-8") == "tampered!"
+    assert ensure_extracted(exe, root) == fresh
+
+    # Once that launch exits, the damaged copy goes
+    (target / f"{IN_USE_PREFIX}{os.getppid()}").unlink()
+    assert ensure_extracted(exe, root) == fresh
+    assert not target.exists()
+
+
+def test_corrupted_payload_is_rejected(launcher, tmp_path):
+    """Test that a payload not matching its hash is never unpacked."""
+    exe, _ = launcher
+    _, _, size = read_trailer(exe)
+    content = bytearray(exe.read_bytes())
+    content[-(TRAILER_SIZE + COOKIE_SIZE + size // 2)] ^= 0xFF
+    exe.write_bytes(bytes(content))
+
+    with pytest.raises(RuntimeError):
+        ensure_extracted(exe, tmp_path / "cache")
+
+
+def test_stale_versions_are_removed(launcher, tmp_path):
+    """Test that only the bundles and staging directories of dead launches are removed."""
+    exe, digest = launcher
+    root = tmp_path / "cache"
+    # Above the largest Linux pid: no such process
+    dead = 4194305
+    (root / "0123456789abcdef").mkdir(parents=True)
+    (root / "0123456789abcdef" / f"{IN_USE_PREFIX}{dead}").touch()
+    (root / f"{digest[:16]}-{dead}").mkdir()
+    (root / f"{digest[:16]}.tmp-{dead}").mkdir()
+    running = root / f"fedcba9876543210.tmp-{os.getpid()}"
+    running.mkdir()
+    # An older version still running
+    older = root / "00112233445566aa"
+    older.mkdir()
+    (older / f"{IN_USE_PREFIX}{os.getppid()}").touch()
+
+    target = ensure_extracted(exe, root)
+
+    assert sorted(p.name for p in root.iterdir()) == sorted(
+        [target.name, running.name, older.name]
+    )
+    assert [p.name for p in target.glob(f"{IN_USE_PREFIX}*")] == [f"{IN_USE_PREFIX}{os.getpid()}"]
+
+
+def test_spec_with_extract_cache(project):
+    """Test that the onefile target becomes a launcher fed by the onedir bundle."""
+    config = load_build_config(project)
+    config["extract_cache"] = True
+    content = generate_pyinstaller_spec(project, config).read_text(encoding="utf-8")
+
+    assert "COLLECT(" in content
+    assert '["build/visionit_launcher.py"]' in content
+    assert '"hashlib"' in content and "upx=False" in content
+    assert (project / "build" / "visionit_launcher.py").exists()
+
+
+def test_extract_cache_refused_on_macos(project, monkeypatch):
+    """Test that macOS builds keep a plain, signable onefile."""
+    monkeypatch.setattr(sys, "platform", "darwin")
+    config = load_build_config(project)
+    config["extract_cache"] = True
+    content = generate_pyinstaller_spec(project, config).read_text(encoding="utf-8")
+
+    assert "visionit_launcher.py" not in content
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a POSIX cache location")
+def test_built_app_runs_from_cache(tmp_path):
+    """Test a real onefile build: first launch extracts, second reuses the cache."""
+    pytest.importorskip("PyInstaller")
+
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data" / "msg.txt").write_text("hello", encoding="utf-8")
+    (tmp_path / "main.py").write_text(
+        "import sys\nfrom pathlib import Path\n"
+        "print(Path(sys._MEIPASS, 'data', 'msg.txt').read_text(), sys.executable)\n",
+        encoding="utf-8",
+    )
+    config = {
+        "app_name": "cached_app",
+        "main_module": "main",
+        "onefile": True,
+        "hidden_imports": [],
+        "exclude_modules": [],
+        "add_data": [["data", "data"]],
+        "extract_cache": True,
+    }
+    with open(tmp_path / "build.json", "w", encoding="utf-8") as f:
+        json.dump(config, f)
+
+    result = runner.invoke(app, ["build", "onefile", "--path", str(tmp_path)])
+    assert result.exit_code == 0, result.output
+    assert not (tmp_path / "dist" / "cached_app_onedir").exists()
+
+    env = dict(os.environ, XDG_CACHE_HOME=str(tmp_path / "cache"))
+    exe = str(tmp_path / "dist" / "cached_app")
+    for _ in range(2):
+        output = subprocess.run([exe], capture_output=True, text=True, env=env, check=True).stdout
+        assert output.startswith("hello")
+        assert str(tmp_path / "cache" / "cached_app") in output
+
+    assert len(list((tmp_path / "cache" / "cached_app").iterdir())) == 1
@@ -0,0 +1,98 @@
+"""Tests for the VisionIT static import scanner."""
+
+import json
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.cli import app
+from visionit.commands.build import load_build_config
+from visionit.import_scan import (
+    CACHE_FILE,
+    ScanError,
+    compute_hidden_imports,
+    scan_project,
+    scan_source,
+)
+
+runner = CliRunner()
+
+
+def test_scan_source():
+    """Test static, dynamic and native-mode detection in one file."""
+    result = scan_source(
+        "import json\n"
+        "from nicegui import ui\n"
+        "from . import local\n"
+        "import importlib\n"
+        "plugin = importlib.import_module('plugins.csv_export')\n"
+        "other = __import__('yaml')\n"
+        "ui.run(native=True)\n"
+    )
+
+    assert result["imports"] == ["importlib", "json", "nicegui"]
+    assert result["dynamic"] == ["plugins.csv_export", "yaml"]
+    assert result["native"] is True
+
+
+def test_generated_project_hidden_imports(project):
+    """Test that the generated app needs the same imports as the old defaults."""
+    hidden = compute_hidden_imports(project, load_build_config(project))
+
+    assert hidden == ["nicegui", "nicegui.elements", "nicegui.page", "uvicorn", "webview"]
+
+
+def test_scan_includes_actions(project):
+    """Test that dynamic imports under actions/ are picked up."""
+    (project / "actions" / "export.py").write_text(
+        "import importlib\nmod = importlib.import_module('openpyxl')\n", encoding="utf-8"
+    )
+
+    assert "openpyxl" in compute_hidden_imports(project, load_build_config(project))
+
+
+def test_scan_cache_reuses_unchanged_files(project):
+    """Test that per-file results are cached by mtime."""
+    config = load_build_config(project)
+    scan_project(project, config)
+
+    cache_file = project / CACHE_FILE
+    cache = json.loads(cache_file.read_text(encoding="utf-8"))
+    cache["main.py"]["result"]["dynamic"] = ["from_cache"]
+    cache_file.write_text(json.dumps(cache), encoding="utf-8")
+
+    assert scan_project(project, config)["main.py"]["dynamic"] == ["from_cache"]
+
+    main_file = project / "main.py"
+    stat = main_file.stat()
+    os.utime(main_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert scan_project(project, config)["main.py"]["dynamic"] == []
+
+
+def test_deps_scan_command(project):
+    """Test that deps-scan rewrites hidden_imports in build.json."""
+    config = load_build_config(project)
+    config["hidden_imports"] = ["nicegui", "pandas"]
+    with open(project / "build.json", "w", encoding="utf-8") as f:
+        json.dump(config, f)
+
+    result = runner.invoke(app, ["build", "deps-scan", "--path", str(project)])
+
+    assert result.exit_code == 0
+    assert "- pandas" in result.output
+    assert "+ webview" in result.output
+    assert "pandas" not in load_build_config(project)["hidden_imports"]
+
+
+def test_scan_syntax_error(project):
+    """Test that a source that does not parse fails the scan with file:line."""
+    (project / "actions" / "broken.py").write_text("def f(:\n    pass\n", encoding="utf-8")
+
+    with pytest.raises(ScanError, match=r"^actions/broken.py:1: "):
+        scan_project(project, load_build_config(project))
+
+    for command in (["build", "deps-scan"], ["build", "onedir"]):
+        result = runner.invoke(app, command + ["--path", str(project)])
+        assert result.exit_code == 1
+        assert "❌ Error: cannot scan imports, actions/broken.py:1:" in result.output
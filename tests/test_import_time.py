@@ -0,0 +1,82 @@
+"""Import-time regression budget for the VisionIT CLI entry point."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time allowed for visionit.cli, in milliseconds
+IMPORT_BUDGET_MS = float(os.environ.get("VISIONIT_IMPORT_BUDGET_MS", "400"))
+
+# Modules that must only be loaded when their command is invoked
+LAZY_MODULES = [
+    "questionary",
+    "visionit.commands.new",
+    "visionit.commands.install",
+    "visionit.commands.db",
+    "visionit.commands.build",
+    "visionit.commands.component",
+    "visionit.commands.setup",
+    "visionit.commands.bench",
+]
+
+
+def run_importtime(*args: str) -> dict:
+    """Run the CLI under `python -X importtime` and return cumulative times in ms."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative) / 1000
+    return times
+
+
+def loaded_modules(*argv: str) -> set:
+    """Run the CLI with argv and return the names in sys.modules once it is done."""
+    script = (
+        "import sys\n"
+        "from visionit.cli import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('\\n'.join(sys.modules), file=sys.stderr)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script, *argv], capture_output=True, text=True)
+    return set(result.stderr.splitlines())
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["version"]])
+def test_fast_commands_skip_lazy_modules(argv):
+    """Test that --help and version do not import command modules."""
+    modules = loaded_modules(*argv)
+
+    assert "visionit.cli" in modules
+    for module in LAZY_MODULES:
+        assert module not in modules, f"{module} imported by 'visionit {' '.join(argv)}'"
+
+
+def test_cli_import_budget():
+    """Test that importing the entry point stays within the import-time budget."""
+    times = run_importtime("-c", "import visionit.cli")
+
+    assert times["visionit.cli"] < IMPORT_BUDGET_MS, (
+        f"visionit.cli import took {times['visionit.cli']:.1f} ms "
+        f"(budget {IMPORT_BUDGET_MS:.0f} ms)"
+    )
+
+
+def test_command_module_loaded_on_dispatch():
+    """Test that invoking a group imports only that group's module."""
+    modules = loaded_modules("component", "list")
+
+    assert "visionit.commands.component" in modules
+    assert "visionit.commands.build" not in modules
+    assert "questionary" not in modules
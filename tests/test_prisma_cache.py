@@ -0,0 +1,70 @@
+"""Tests for the VisionIT Prisma generate/push cache."""
+
+import os
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.cli import app
+from visionit.prisma_cache import database_file, load_state, normalize_schema
+
+runner = CliRunner()
+
+
+def calls(log):
+    return log.read_text(encoding="utf-8").splitlines() if log.exists() else []
+
+
+def test_normalize_schema():
+    """Test that comments and alignment are ignored but strings and docs are kept."""
+    a = 'model User {\n  id   Int @id // key\n  url  String @default("http://x")\n}\n'
+    b = '// header\nmodel User {\n\n  id Int @id\n  url String @default("http://x")\n}\n'
+    assert normalize_schema(a) == normalize_schema(b)
+    assert "http://x" in normalize_schema(a)
+    assert normalize_schema("/// A user\nmodel U {}") != normalize_schema("model U {}")
+
+
+def test_database_file(project):
+    """Test that the SQLite URL is resolved from the schema directory."""
+    assert database_file(project / "db" / "schema.prisma") == (project / "dev.db").resolve()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="fake prisma is a shell script")
+def test_generate_is_cached(project, fake_prisma):
+    """Test that generate runs once, then again only after a real schema change."""
+    args = ["db", "generate", "--path", str(project)]
+    assert runner.invoke(app, args).exit_code == 0
+    result = runner.invoke(app, args)
+    assert "up to date" in result.output
+    assert len(calls(fake_prisma)) == 1
+
+    schema = project / "db" / "schema.prisma"
+    schema.write_text("// comment only\n" + schema.read_text(encoding="utf-8"), encoding="utf-8")
+    assert "up to date" in runner.invoke(app, args).output
+
+    schema.write_text(schema.read_text(encoding="utf-8") + "\nmodel Tag {\n  id Int @id\n}\n",
+                      encoding="utf-8")
+    runner.invoke(app, args)
+    runner.invoke(app, args + ["--force"])
+    assert len(calls(fake_prisma)) == 3
+    assert "generate" in load_state(project)["prisma"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="fake prisma is a shell script")
+def test_sync_generate_skips_what_is_current(project, fake_prisma):
+    """Test that sync --generate runs one Prisma command, then none."""
+    args = ["db", "sync", "--generate", "--path", str(project)]
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert calls(fake_prisma) == [f"db push --schema {project / 'db' / 'schema.prisma'}"]
+
+    result = runner.invoke(app, args)
+    assert "Database is up to date" in result.output
+    assert "Prisma client is up to date" in result.output
+    assert len(calls(fake_prisma)) == 1
+
+    # Deleting the database needs a push, but not a new client
+    (project / "dev.db").unlink()
+    runner.invoke(app, args)
+    assert calls(fake_prisma)[-1].endswith("--skip-generate")
@@ -0,0 +1,123 @@
+"""Tests for the VisionIT schema.prisma parser."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit import prisma_schema
+from visionit.cli import app
+from visionit.prisma_schema import SchemaError, get_model, load_schema, parse_schema
+
+runner = CliRunner()
+
+SCHEMA = '''
+// Comment with a "quote
+datasource db {
+  provider = "postgresql"
+  url      = env("DATABASE_URL") // trailing comment
+}
+
+generator client {
+  provider             = "prisma-client-py"
+  recursive_type_depth = 5
+}
+
+enum Role {
+  USER
+  ADMIN @map("admin")
+}
+
+model User {
+  id    Int     @id @default(autoincrement())
+  email String  @unique
+  site  String? @default("https://example.com") // not a comment: //
+  role  Role    @default(USER)
+  posts Post[]
+}
+
+model Post {
+  id       Int    @id @default(autoincrement())
+  title    String @db.VarChar(255)
+  slug     String
+  /// Author of the post
+  author   User   @relation("Authored", fields: [authorId], references: [id], onDelete: Cascade)
+  authorId Int
+  shape    Unsupported("circle")?
+
+  @@index([title(sort: Desc), authorId], map: "title_author")
+  @@unique([slug, authorId])
+}
+'''
+
+
+def test_parse_blocks():
+    """Test datasources, generators, enums and field modifiers."""
+    schema = parse_schema(SCHEMA)
+
+    assert schema["datasources"] == [{"name": "db", "provider": "postgresql",
+                                      "url": {"function": "env", "args": ["DATABASE_URL"],
+                                              "named": {}}}]
+    assert schema["generators"][0]["recursive_type_depth"] == 5
+    assert schema["enums"] == [{"name": "Role", "values": ["USER", "ADMIN"]}]
+
+    user = get_model(schema, "User")
+    site = user["fields"][2]
+    assert (site["type"], site["optional"], site["list"]) == ("String", True, False)
+    assert site["attributes"][0]["args"] == ["https://example.com"]
+    assert user["fields"][4]["list"] is True
+    assert user["id"] == ["id"] and user["unique"] == [["email"]]
+
+
+def test_parse_relations_and_indexes():
+    """Test @relation, @@index, @@unique and documentation comments."""
+    post = get_model(parse_schema(SCHEMA), "Post")
+    author = next(f for f in post["fields"] if f["name"] == "author")
+
+    assert author["relation"] == {"model": "User", "name": "Authored", "fields": ["authorId"],
+                                  "references": ["id"], "on_delete": "Cascade"}
+    assert author["doc"] == "Author of the post"
+    assert post["indexes"] == [{"fields": ["title", "authorId"], "name": "title_author"}]
+    assert post["unique"] == [["slug", "authorId"]]
+    assert post["fields"][-1]["type"] == 'Unsupported("circle")'
+    assert post["fields"][1]["attributes"][0]["raw"] == "@db.VarChar(255)"
+
+
+def test_invalid_schema():
+    """Test that syntax errors name the block."""
+    with pytest.raises(SchemaError, match="model Broken"):
+        parse_schema("model Broken {\n  id Int @id(\n}\n")
+    with pytest.raises(SchemaError):
+        parse_schema("model Open {\n  id Int\n")
+
+
+def test_load_schema_cache(project, monkeypatch):
+    """Test that the parsed schema is reused until the file changes."""
+    first = load_schema(project)
+    assert (project / prisma_schema.CACHE_FILE).exists()
+
+    def fail(text):
+        raise AssertionError("schema parsed again")
+
+    monkeypatch.setattr(prisma_schema, "parse_schema", fail)
+    assert load_schema(project) == first
+
+    monkeypatch.undo()
+    schema_path = project / "db" / "schema.prisma"
+    schema_path.write_text(schema_path.read_text(encoding="utf-8") + "\nmodel Tag {\n  id Int @id\n}\n",
+                           encoding="utf-8")
+    assert get_model(load_schema(project), "Tag") is not None
+
+
+def test_db_inspect(project):
+    """Test the inspect command on a generated project."""
+    result = runner.invoke(app, ["db", "inspect", "--path", str(project)])
+    assert result.exit_code == 0, result.output
+    assert "📋 User" in result.output
+    assert "@default(autoincrement())" in result.output
+
+    result = runner.invoke(app, ["db", "inspect", "--path", str(project), "-m", "User", "--json"])
+    assert json.loads(result.output)["unique"] == [["email"]]
+
+    result = runner.invoke(app, ["db", "inspect", "--path", str(project), "-m", "Nope"])
+    assert result.exit_code == 1
@@ -0,0 +1,56 @@
+"""Tests for the VisionIT streamed process runner."""
+
+import json
+import sys
+
+from visionit.process_runner import (
+    PIP_PHASES, PYINSTALLER_PHASES, detect_phase, phase_summary, run_streamed, timings_path,
+)
+
+# Prints what `pyinstaller` prints, on stderr like PyInstaller does
+FAKE_PYINSTALLER = '''
+import sys, time
+for line in ["123 INFO: PyInstaller: 6.3.0",
+             "456 INFO: Running Analysis Analysis-00.toc",
+             "789 INFO: Building PYZ (ZlibArchive) build/app/PYZ-00.pyz",
+             "790 INFO: Building EXE from EXE-00.toc",
+             "791 INFO: Building EXE from EXE-00.toc completed successfully.",
+             "800 INFO: Building COLLECT COLLECT-00.toc"]:
+    print(line, file=sys.stderr, flush=True)
+    time.sleep(0.01)
+for i in range(500):
+    print(f"noise {i}")
+sys.exit(int(sys.argv[1]))
+'''
+
+
+def test_detect_phase():
+    """Test PyInstaller and pip phase patterns."""
+    assert detect_phase("4 INFO: Building PKG (CArchive) app.pkg", PYINSTALLER_PHASES) == "PKG"
+    assert detect_phase("4 INFO: Looking for dynamic libraries", PYINSTALLER_PHASES) is None
+    assert detect_phase("Collecting pyinstaller>=6.0.0", PIP_PHASES) == "Resolve"
+    assert detect_phase("  Downloading pyinstaller-6.3.0.whl (2.5 MB)", PIP_PHASES) == "Download"
+    assert detect_phase("Installing collected packages: altgraph", PIP_PHASES) == "Install"
+
+
+def test_run_streamed(tmp_path):
+    """Test phases, the bounded tail and the full log on disk."""
+    script = tmp_path / "fake.py"
+    script.write_text(FAKE_PYINSTALLER, encoding="utf-8")
+    log = tmp_path / "logs" / "build.log"
+    started = []
+
+    result = run_streamed([sys.executable, str(script), "3"], log, phases=PYINSTALLER_PHASES,
+                          on_phase=started.append, tail_lines=5)
+    assert result["returncode"] == 3
+    assert started == ["Analysis", "PYZ", "EXE", "COLLECT"]
+    assert list(result["phases"]) == started
+    assert all(seconds >= 0 for seconds in result["phases"].values())
+    assert result["tail"] == [f"noise {i}" for i in range(495, 500)]
+
+    lines = log.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 506 and lines[1].endswith("Running Analysis Analysis-00.toc")
+    saved = json.loads(timings_path(log).read_text(encoding="utf-8"))
+    assert saved["phases"] == result["phases"] and "tail" not in saved
+    assert phase_summary(result).startswith("Analysis ")
+    assert phase_summary({"phases": {}, "seconds": 1.25}) == "total 1.2s"
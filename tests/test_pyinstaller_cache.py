@@ -0,0 +1,122 @@
+"""Tests for the shared VisionIT PyInstaller cache."""
+
+import json
+import os
+import shutil
+import sys
+import time
+
+from typer.testing import CliRunner
+
+from visionit.cli import app
+from visionit.commands import build
+from visionit.pyinstaller_cache import (
+    cache_key,
+    entry_for,
+    evict,
+    in_use,
+    inactive_reason,
+    list_entries,
+    stack,
+    uses_bincache,
+)
+
+runner = CliRunner()
+
+CONFIG = {"app_name": "demo", "hidden_imports": ["actions.main_logic", "typer"]}
+
+
+def make_project(path):
+    path.mkdir(parents=True)
+    (path / "package.txt").write_text("typer\n", encoding="utf-8")
+    return path
+
+
+def test_projects_share_an_entry(tmp_path, shared_cache):
+    """Test that projects on the same stack share one entry and a new stack gets another."""
+    one = make_project(tmp_path / "one")
+    two = make_project(tmp_path / "two")
+    project_stack = stack(one, CONFIG)
+    assert "typer" in project_stack["packages"] and "actions" not in project_stack["packages"]
+    # Hidden imports are keyed by their distribution (_pytest is installed by pytest)
+    packages = stack(one, dict(CONFIG, hidden_imports=["_pytest.main"]))["packages"]
+    assert "pytest" in packages and "_pytest" not in packages
+    assert cache_key(project_stack) == cache_key(stack(two, CONFIG))
+
+    entry = entry_for(one, CONFIG)
+    assert entry_for(two, CONFIG) == entry and entry.parent == shared_cache
+    info = json.loads((entry / "visionit-cache.json").read_text(encoding="utf-8"))
+    assert info["projects"] == [str(one.resolve()), str(two.resolve())]
+
+    upgraded = dict(project_stack, python="cpython 9.9.9")
+    assert cache_key(upgraded) != cache_key(project_stack)
+
+
+def test_evict_least_recently_used(tmp_path):
+    """Test LRU eviction under the size cap, sparing the running build's entry."""
+    root = tmp_path / "cache"
+    for age, name in enumerate(["old", "mid", "new"]):
+        entry = root / name
+        entry.mkdir(parents=True)
+        (entry / "bincache").write_bytes(b"x" * 1000)
+        (entry / "visionit-cache.json").write_text(json.dumps({"last_used": time.time() - 100 + age}),
+                                                   encoding="utf-8")
+    assert [e["path"].name for e in list_entries(root)] == ["old", "mid", "new"]
+
+    assert evict(10 ** 6, root) == []
+    removed = evict(2500, root, keep=root / "old")
+    assert [e["path"].name for e in removed] == ["mid"]
+    assert sorted(os.listdir(root)) == ["new", "old"]
+
+    # A running build protects its entry; markers of dead processes do not
+    (root / "new" / ".in-use-4194305").touch()
+    with in_use(root / "old"):
+        assert [e["path"].name for e in evict(0, root)] == ["new"]
+    assert not list((root / "old").glob(".in-use-*"))
+    assert [e["path"].name for e in evict(0, root)] == ["old"]
+
+
+def test_uses_bincache(monkeypatch):
+    """Test that the shared cache is only used where PyInstaller fills it."""
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+    assert not uses_bincache({}) and inactive_reason({}) == "UPX is not installed"
+    monkeypatch.setattr(shutil, "which", lambda name: "/usr/bin/upx")
+    assert uses_bincache({}) and not uses_bincache({"upx": False})
+    assert inactive_reason({}) is None and inactive_reason({"upx": False}) == "upx is false in build.json"
+    monkeypatch.setattr(sys, "platform", "darwin")
+    assert uses_bincache({"upx": False})
+
+
+def test_build_reports_inactive_cache(project, monkeypatch):
+    """Test that build says why the shared cache is not used."""
+    monkeypatch.setattr(sys, "platform", "linux")
+    monkeypatch.setattr(shutil, "which", lambda name: None)
+
+    def no_pyinstaller(*args, **kwargs):
+        raise FileNotFoundError("pyinstaller")
+
+    monkeypatch.setattr(build, "run_streamed", no_pyinstaller)
+    result = runner.invoke(app, ["build", "onedir", "--path", str(project)])
+    assert "Shared PyInstaller cache inactive: UPX is not installed" in result.output
+
+
+def test_clean_keep_cache(project, shared_cache):
+    """Test that clean --keep-cache keeps build/ and shrinks the shared cache."""
+    for folder in ("build/test_app", "dist"):
+        (project / folder).mkdir(parents=True)
+    (project / "test_app.spec").write_text("", encoding="utf-8")
+    stale = shared_cache / "stale"
+    stale.mkdir(parents=True)
+    (stale / "bincache").write_bytes(b"x" * 2 * 1024 * 1024)
+
+    result = runner.invoke(app, ["build", "clean", "--path", str(project), "--keep-cache",
+                                 "--cache-max-mb", "1"])
+    assert result.exit_code == 0, result.output
+    assert (project / "build" / "test_app").is_dir()
+    assert not (project / "dist").exists() and not (project / "test_app.spec").exists()
+    assert "Evicted cache entry stale" in result.output and not stale.exists()
+
+    result = runner.invoke(app, ["build", "clean", "--path", str(project)])
+    assert result.exit_code == 0, result.output
+    assert not (project / "build").exists()
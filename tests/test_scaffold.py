@@ -0,0 +1,179 @@
+"""Tests for the VisionIT scaffolding engine."""
+
+import io
+import json
+import zipfile
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.cli import app
+from visionit.commands.new import load_manifest, plan_project
+from visionit.scaffold import add_dir, add_file, new_plan, write_memory, write_plan, write_zip
+
+runner = CliRunner()
+
+
+def test_write_plan(tmp_path):
+    """Test that directories, text and binary files are written in place."""
+    plan = new_plan()
+    add_dir(plan, "static/css")
+    add_file(plan, "main.py", "print('ok')\n")
+    add_file(plan, "static/icons/icon.png", b"\x89PNG", announce=False)
+
+    write_plan(plan, tmp_path / "app")
+
+    assert (tmp_path / "app" / "static" / "css").is_dir()
+    assert (tmp_path / "app" / "main.py").read_text(encoding="utf-8") == "print('ok')\n"
+    assert (tmp_path / "app" / "static" / "icons" / "icon.png").read_bytes() == b"\x89PNG"
+    assert plan["messages"] == ["static/css/", "main.py"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["app"]
+
+
+def test_failed_write_leaves_nothing(tmp_path):
+    """Test that an error while writing removes the staging directory."""
+    plan = new_plan()
+    add_file(plan, "main.py", "ok")
+    add_file(plan, "broken.txt", None)
+
+    with pytest.raises(TypeError):
+        write_plan(plan, tmp_path / "app")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_existing_target_is_untouched(tmp_path):
+    """Test that an existing directory is never overwritten."""
+    (tmp_path / "app").mkdir()
+    (tmp_path / "app" / "keep.txt").write_text("mine", encoding="utf-8")
+    plan = new_plan()
+    add_file(plan, "keep.txt", "theirs")
+
+    with pytest.raises(FileExistsError):
+        write_plan(plan, tmp_path / "app")
+
+    assert (tmp_path / "app" / "keep.txt").read_text(encoding="utf-8") == "mine"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["app"]
+
+
+def test_plan_project():
+    """Test that a project plan is built without touching the disk."""
+    plan = plan_project("demo", "Vision IT", "1.0.0", "Prisma", "SQLite")
+
+    assert {"main.py", "info.json", "build.json", "db/schema.prisma"} <= set(plan["files"])
+    assert "actions" in plan["dirs"]
+    assert any(f.startswith("templates/components/") for f in plan["files"])
+
+
+def test_new_batch(tmp_path, monkeypatch):
+    """Test creating several projects from a JSONL manifest in one process."""
+    manifest = tmp_path / "projects.jsonl"
+    manifest.write_text(
+        '{"project_name": "crm", "author": "Ops", "version": "2.0.0"}\n'
+        '\n'
+        '{"project_name": "stock"}\n',
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(app, ["new", "--batch", str(manifest), "-j", "2"])
+
+    assert result.exit_code == 0, result.output
+    assert "2/2 projects created" in result.output
+    info = json.loads((tmp_path / "crm" / "info.json").read_text(encoding="utf-8"))
+    assert (info["author"], info["version"], info["orm"]) == ("Ops", "2.0.0", "Prisma")
+    assert (tmp_path / "stock" / "main.py").exists()
+
+
+def test_new_batch_db_profile(tmp_path, monkeypatch):
+    """Test that --db-profile is the default of entries without their own db_profile."""
+    manifest = tmp_path / "projects.json"
+    manifest.write_text(json.dumps([{"project_name": "fast"},
+                                    {"project_name": "plain", "db_profile": "default"}]),
+                        encoding="utf-8")
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(app, ["new", "--batch", str(manifest), "--db-profile", "performance"])
+
+    assert result.exit_code == 0, result.output
+    assert "socket_timeout" in (tmp_path / "fast" / "db" / "schema.prisma").read_text(encoding="utf-8")
+    assert "socket_timeout" not in (tmp_path / "plain" / "db" / "schema.prisma").read_text(
+        encoding="utf-8")
+
+    result = runner.invoke(app, ["new", "--batch", str(manifest), "--db-profile", "turbo"])
+    assert result.exit_code == 1 and "unknown --db-profile" in result.output
+
+
+def test_new_batch_reports_failures(tmp_path, monkeypatch):
+    """Test that an existing project fails alone and sets the exit code."""
+    manifest = tmp_path / "projects.json"
+    manifest.write_text(json.dumps({"projects": [{"project_name": "a"}, {"project_name": "b"}]}),
+                        encoding="utf-8")
+    (tmp_path / "a").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(app, ["new", "--batch", str(manifest)])
+
+    assert result.exit_code == 1
+    assert "1/2 projects created" in result.output
+    assert (tmp_path / "b" / "main.py").exists()
+    assert list((tmp_path / "a").iterdir()) == []
+
+
+def test_load_manifest_errors(tmp_path):
+    """Test that missing or path-like names, unknown fields and duplicates are rejected."""
+    manifest = tmp_path / "projects.json"
+    for entries in ([{"author": "x"}], [{"project_name": "a", "colour": "red"}],
+                    [{"project_name": "a"}, {"project_name": "a"}],
+                    [{"project_name": "../escape"}], [{"project_name": "/tmp/abs"}],
+                    [{"project_name": ".."}], [{"project_name": "a\\b"}], [{"project_name": 3}]):
+        manifest.write_text(json.dumps(entries), encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_manifest(manifest)
+
+
+def test_write_memory():
+    """Test checking generated content without touching the disk."""
+    tree = write_memory(plan_project("demo", "Ops", "3.1.0", "Prisma", "SQLite"), "demo")
+
+    info = json.loads(tree["demo/info.json"])
+    assert (info["project_name"], info["author"], info["version"]) == ("demo", "Ops", "3.1.0")
+    assert tree["demo/static/icons/"] is None
+    assert 'WINDOW_TITLE = "demo"' in tree["demo/main.py"]
+
+
+def test_write_zip_stream():
+    """Test streaming a project into an unseekable binary stream."""
+
+    class Unseekable(io.RawIOBase):
+        def __init__(self):
+            self.data = bytearray()
+
+        def writable(self):
+            return True
+
+        def write(self, b):
+            self.data += b
+            return len(b)
+
+    stream = Unseekable()
+    plan = plan_project("demo", "Ops", "1.0.0", "Prisma", "SQLite")
+    write_zip(plan, stream, "demo")
+
+    with zipfile.ZipFile(io.BytesIO(bytes(stream.data))) as archive:
+        names = archive.namelist()
+        assert "demo/" in names and "demo/actions/" in names
+        assert archive.read("demo/main.py").decode("utf-8") == plan["files"]["main.py"]
+
+
+def test_new_to_zip(tmp_path, monkeypatch):
+    """Test that --to-zip writes an archive and no project directory."""
+    monkeypatch.chdir(tmp_path)
+
+    result = runner.invoke(app, ["new", "demo", "--no-interactive", "--to-zip", "demo.zip"])
+
+    assert result.exit_code == 0, result.output
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["demo.zip"]
+    with zipfile.ZipFile(tmp_path / "demo.zip") as archive:
+        archive.extractall(tmp_path / "out")
+    assert (tmp_path / "out" / "demo" / "db" / "schema.prisma").exists()
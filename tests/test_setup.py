@@ -0,0 +1,76 @@
+"""Tests for the VisionIT setup pipeline."""
+
+import os
+import threading
+from importlib import metadata
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.cli import app
+from visionit.dependency_lock import format_lock, requirements_hash
+from visionit.setup_pipeline import run_graph
+
+runner = CliRunner()
+
+
+def step(name, after=(), run=None, check=lambda: False):
+    return {"name": name, "after": list(after), "check": check, "run": run or (lambda: None)}
+
+
+def test_run_graph():
+    """Test that independent steps overlap and that failures skip what follows."""
+    a_running = threading.Event()
+
+    def a():
+        a_running.set()
+
+    def b():
+        # Only returns if a runs at the same time
+        assert a_running.wait(5)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    started = []
+    results = run_graph([step("b", run=b), step("a", run=a), step("c", ["a", "b"], fail),
+                         step("d", ["c"]), step("e", ["a"], check=lambda: True)],
+                        workers=2, on_start=started.append)
+    assert [r["status"] for r in results] == ["done", "done", "failed", "skipped", "cached"]
+    assert results[2]["error"] == "boom" and results[3]["error"] == "after c"
+    assert started.index("c") > max(started.index("a"), started.index("b"))
+    assert "d" not in started
+
+    with pytest.raises(ValueError, match="cycle"):
+        run_graph([step("x", ["y"]), step("y", ["x"])])
+    with pytest.raises(ValueError, match="unknown step z"):
+        run_graph([step("x", ["z"])])
+
+
+@pytest.mark.skipif(os.name == "nt", reason="fake prisma is a shell script")
+def test_setup_command(project, fake_prisma):
+    """Test a first setup, then a second one where every step is cached."""
+    (project / "static" / "js").rmdir()
+    args = ["setup", "--path", str(project), "--skip", "install"]
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 0, result.output
+    assert "Project is ready" in result.output
+    assert (project / "static" / "js").is_dir()
+    assert list((project / "__pycache__").glob("main.*.pyc"))
+    schema = project / "db" / "schema.prisma"
+    assert fake_prisma.read_text(encoding="utf-8").splitlines() == [
+        f"generate --schema {schema}", f"db push --schema {schema} --skip-generate"]
+
+    # An installed lock makes install a cache check too
+    entries = [{"name": "typer", "version": metadata.version("typer"), "hash": "sha256:00"}]
+    (project / "package.lock").write_text(
+        format_lock(entries, requirements_hash(project / "package.txt"), "test"), encoding="utf-8")
+    result = runner.invoke(app, ["setup", "--path", str(project)])
+    assert result.exit_code == 0, result.output
+    assert result.output.count("is up to date") == 5
+    assert len(fake_prisma.read_text(encoding="utf-8").splitlines()) == 2
+
+    result = runner.invoke(app, ["setup", "--path", str(project), "--skip", "lint"])
+    assert result.exit_code == 1
+    assert "unknown step lint" in result.output
@@ -0,0 +1,106 @@
+"""Tests for the VisionIT SQLite profiles."""
+
+import json
+import os
+import sqlite3
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.cli import app
+from visionit.prisma_cache import database_file
+from visionit.sqlite_tuning import (
+    bench_writes,
+    connection_url,
+    read_settings,
+    set_datasource_url,
+    tuning_module,
+)
+
+runner = CliRunner()
+
+
+def test_set_datasource_url():
+    """Test that only the datasource url is replaced."""
+    schema = ('// url = "keep"\ndatasource db {\n  provider = "sqlite"\n  url      = "file:./dev.db"\n}\n\n'
+              'model User {\n  url String @default("file:./dev.db")\n}\n')
+    updated = set_datasource_url(schema, connection_url("performance", "./dev.db"))
+
+    assert 'url      = "file:./dev.db?connection_limit=8&socket_timeout=5"' in updated
+    assert '// url = "keep"' in updated
+    assert '@default("file:./dev.db")' in updated
+    assert set_datasource_url(updated, connection_url("default", "./dev.db")) == schema
+
+    with pytest.raises(ValueError):
+        set_datasource_url('datasource db {\n  url = env("DATABASE_URL")\n}\n', "file:x.db")
+
+
+def test_new_and_tune(tmp_path):
+    """Test the profile of a new project, then switching it with db tune."""
+    original_dir = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        result = runner.invoke(app, ["new", "fast_app", "--no-interactive", "--db-profile", "performance"])
+        assert result.exit_code == 0, result.output
+    finally:
+        os.chdir(original_dir)
+
+    project = tmp_path / "fast_app"
+    schema_path = project / "db" / "schema.prisma"
+    assert "socket_timeout=5" in schema_path.read_text(encoding="utf-8")
+    assert database_file(schema_path) == (project / "dev.db").resolve()
+    assert "from db.client import connect_db" in (project / "main.py").read_text(encoding="utf-8")
+
+    sqlite3.connect(project / "dev.db").close()
+    result = runner.invoke(app, ["db", "tune", "--path", str(project)])
+    assert result.exit_code == 0, result.output
+    assert "profile: performance" in result.output
+
+    # The generated startup hook switches the file to WAL
+    namespace = {"__file__": str(project / "db" / "tuning.py")}
+    exec((project / "db" / "tuning.py").read_text(encoding="utf-8"), namespace)
+    assert namespace["database_file"]() == (project / "dev.db").resolve()
+    namespace["tune_database"]()
+    assert namespace["CONNECTION_LIMIT"] == 8
+    assert "in the file: wal" in runner.invoke(app, ["db", "tune", "--path", str(project)]).output
+
+    result = runner.invoke(app, ["db", "tune", "--path", str(project), "--profile", "default"])
+    assert result.exit_code == 0, result.output
+    assert 'url      = "file:../dev.db"' in schema_path.read_text(encoding="utf-8")
+    assert "in the file: delete" in result.output
+
+    result = runner.invoke(app, ["db", "tune", "--path", str(project), "--profile", "turbo"])
+    assert result.exit_code == 1
+
+
+def test_tuning_reaches_every_connection(tmp_path, monkeypatch):
+    """Test that the profile written at startup holds on a second connection."""
+    project = tmp_path / "app"
+    (project / "db").mkdir(parents=True)
+    (project / "db" / "schema.prisma").write_text(
+        'datasource db {\n  provider = "sqlite"\n  url      = env("APP_DATABASE_URL")\n}\n',
+        encoding="utf-8",
+    )
+    (project / "db" / "tuning.py").write_text(tuning_module("performance"), encoding="utf-8")
+    database = project / "data" / "app.db"
+    database.parent.mkdir()
+    sqlite3.connect(database).close()
+
+    namespace = {"__file__": str(project / "db" / "tuning.py")}
+    exec((project / "db" / "tuning.py").read_text(encoding="utf-8"), namespace)
+    monkeypatch.setenv("APP_DATABASE_URL", "file:../data/app.db?connection_limit=8")
+    namespace["tune_database"]()
+
+    assert namespace["PRAGMAS"]
+    assert read_settings(database, list(namespace["PRAGMAS"])) == {"journal_mode": "wal"}
+
+
+def test_bench_sqlite(tmp_path):
+    """Test that the performance profile commits every concurrent write."""
+    result = bench_writes("performance", writers=4, writes=20, directory=tmp_path)
+    assert result["committed"] == 80 and result["locked"] == 0
+
+    result = runner.invoke(app, ["bench", "sqlite", "--path", str(tmp_path), "-w", "2", "-n", "5"])
+    assert result.exit_code == 0, result.output
+    report = json.loads((tmp_path / ".visionit" / "bench-sqlite.json").read_text(encoding="utf-8"))
+    assert [r["profile"] for r in report["results"]] == ["default", "performance"]
@@ -0,0 +1,94 @@
+"""Tests for VisionIT workspace builds."""
+
+import json
+import os
+import stat
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from visionit.cli import app
+from visionit.workspace import discover_projects, load_workspace, max_jobs, schedule
+
+runner = CliRunner()
+
+# Prints PyInstaller's steps and writes the onefile executable
+FAKE_PYINSTALLER = '''#!{python}
+import json, os, sys
+config = json.load(open("build.json"))
+print("INFO: Running Analysis Analysis-00.toc")
+if config["app_name"] == "broken":
+    print("ERROR: Module not found: missing", file=sys.stderr)
+    sys.exit(1)
+print("INFO: Building PYZ (ZlibArchive) PYZ-00.pyz")
+print("INFO: Building EXE from EXE-00.toc")
+dist = sys.argv[sys.argv.index("--distpath") + 1]
+os.makedirs(dist, exist_ok=True)
+open(f"{{dist}}/{{config['app_name']}}", "w").write("exe")
+'''
+
+
+def make_workspace(root, names):
+    for name in names:
+        project = root / "apps" / name
+        project.mkdir(parents=True)
+        (project / "main.py").write_text("print('hi')\n", encoding="utf-8")
+        (project / "build.json").write_text(json.dumps({"app_name": name, "main_module": "main"}),
+                                            encoding="utf-8")
+    return root
+
+
+def test_discover_and_schedule(tmp_path):
+    """Test project discovery, workspace files, job caps and longest-first order."""
+    root = make_workspace(tmp_path, ["a", "b", "c"])
+    (root / "apps" / "a" / "dist" / "x").mkdir(parents=True)
+    (root / "apps" / "a" / "dist" / "x" / "build.json").write_text("{}", encoding="utf-8")
+    assert [p.name for p in discover_projects(*load_workspace(root))] == ["a", "b", "c"]
+
+    (root / "visionit-workspace.json").write_text(
+        json.dumps({"projects": ["apps/*"], "exclude": ["apps/b"], "mode": "onedir"}), encoding="utf-8")
+    found, workspace = load_workspace(root / "visionit-workspace.json")
+    assert found == root and workspace["mode"] == "onedir"
+    projects = discover_projects(root, workspace)
+    assert [p.name for p in projects] == ["a", "c"]
+
+    previous = {"projects": [{"project": "apps/a", "status": "built", "seconds": 10.0}]}
+    assert [p.name for p in schedule(projects, root, previous)] == ["c", "a"]
+
+    assert max_jobs(None, 1500, cpus=8, memory_mb=4000) == 2
+    assert max_jobs(16, 1500, cpus=8, memory_mb=None) == 8
+    assert max_jobs(3, 1500, cpus=8, memory_mb=100) == 1
+
+
+@pytest.mark.skipif(os.name == "nt", reason="fake pyinstaller is a script")
+def test_workspace_build(tmp_path, monkeypatch):
+    """Test concurrent builds with a failure, then cache hits on the next run."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    script = bin_dir / "pyinstaller"
+    script.write_text(FAKE_PYINSTALLER.format(python=sys.executable), encoding="utf-8")
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    # The builds run `python -m visionit.cli` from each project folder
+    monkeypatch.setenv("PYTHONPATH", str(Path(__file__).resolve().parent.parent))
+
+    root = make_workspace(tmp_path / "ws", ["one", "two", "broken"])
+    args = ["build", "--workspace", str(root), "--jobs", "2"]
+
+    result = runner.invoke(app, args)
+    assert result.exit_code == 1, result.output
+    assert "2 built, 0 cache hits, 1 failed" in result.output
+    assert "apps/one: Analysis..." in result.output
+    assert (root / "apps" / "one" / "dist" / "one").read_text(encoding="utf-8") == "exe"
+    assert "Module not found" in (root / "apps" / "broken" / ".visionit" / "logs" / "build.log").read_text(
+        encoding="utf-8")
+
+    report = json.loads((root / ".visionit" / "workspace-build.json").read_text(encoding="utf-8"))
+    assert report["jobs"] in (1, 2)
+    entry = next(e for e in report["projects"] if e["project"] == "apps/two")
+    assert entry["status"] == "built" and list(entry["phases"]) == ["Analysis", "PYZ", "EXE"]
+
+    result = runner.invoke(app, args)
+    assert "0 built, 2 cache hits, 1 failed" in result.output
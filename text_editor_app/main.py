@@ -177,7 +177,7 @@ if __name__ == "__main__":
     ui.run(
         title=WINDOW_TITLE,
         host="127.0.0.1",
-        port=8080,
+        port=None,  # Port libre choisi par NiceGUI (plusieurs instances possibles)
         reload=False,
         native=True,  # ⭐ MODE FENÊTRE DESKTOP ⭐
         window_size=(WINDOW_WIDTH, WINDOW_HEIGHT),
@@ -0,0 +1,246 @@
+"""VisionIT startup benchmark - time-to-interactive of a project's app."""
+
+import os
+import platform
+import shutil
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Optional
+
+from visionit.build_cache import artifact_path
+
+# Printed (flushed) by the generated main.py once its imports are done
+IMPORT_MARKER = "VISIONIT_BENCH imported"
+
+PHASES = ("spawn", "import", "ready", "render")
+TARGETS = ("onefile", "onedir", "source")
+
+
+def free_port() -> int:
+    """Return a TCP port that is currently free on 127.0.0.1."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def target_command(project_path: Path, config: dict, target: str) -> Optional[list]:
+    """Return the command line that starts target, or None if it is not built."""
+    if target == "source":
+        main_file = project_path / f"{config.get('main_module', 'main')}.py"
+        return [sys.executable, str(main_file.resolve())] if main_file.exists() else None
+
+    artifact = artifact_path(project_path, config, target)
+    if target == "onedir":
+        exe_name = config.get("app_name", "app") + (".exe" if sys.platform == "win32" else "")
+        artifact = artifact / exe_name
+    return [str(artifact.resolve())] if artifact.is_file() else None
+
+
+def available_targets(project_path: Path, config: dict) -> list:
+    """Return the built executables in dist/, or the source entry point if none."""
+    built = [t for t in ("onefile", "onedir") if target_command(project_path, config, t)]
+    return built or ["source"]
+
+
+def _start(command: list, cwd: Path, env: dict) -> subprocess.Popen:
+    kwargs = {}
+    if sys.platform == "win32":
+        kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        # Own process group, so the PyInstaller child is stopped as well
+        kwargs["start_new_session"] = True
+    return subprocess.Popen(
+        command,
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        **kwargs,
+    )
+
+
+def _stop(proc: subprocess.Popen) -> None:
+    if proc.poll() is not None:
+        return
+    if sys.platform == "win32":
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(proc.pid)], capture_output=True)
+    else:
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)
+            proc.wait(5)
+        except subprocess.TimeoutExpired:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    proc.wait()
+
+
+def measure_startup(command: list, cwd: Path, env: dict, port: int, timeout: float = 60.0) -> dict:
+    """Launch the app once and return the elapsed ms at each startup phase.
+
+    ``spawn`` is when the process exists, ``import`` when the app prints the
+    import marker (None if it never does), ``ready`` when the port accepts
+    connections and ``render`` when GET / has returned the full page.
+    """
+    start = time.perf_counter()
+    proc = _start(command, cwd, env)
+    timings = {"spawn": (time.perf_counter() - start) * 1000, "import": None}
+    output = []
+
+    def read_output():
+        for raw in proc.stdout:
+            line = raw.decode("utf-8", errors="replace").rstrip()
+            if IMPORT_MARKER in line and timings["import"] is None:
+                timings["import"] = (time.perf_counter() - start) * 1000
+            output.append(line)
+            del output[:-20]
+
+    reader = threading.Thread(target=read_output, daemon=True)
+    reader.start()
+
+    try:
+        deadline = start + timeout
+        delay = 0.005
+        while True:
+            try:
+                with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                    break
+            except OSError:
+                pass
+            if proc.poll() is not None:
+                reader.join(1)
+                raise RuntimeError(
+                    f"App exited with code {proc.returncode} before it was ready:\n"
+                    + "\n".join(output)
+                )
+            if time.perf_counter() > deadline:
+                raise TimeoutError(f"App not listening on port {port} after {timeout:.0f}s")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.05)
+        timings["ready"] = (time.perf_counter() - start) * 1000
+
+        remaining = max(deadline - time.perf_counter(), 1.0)
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=remaining) as response:
+            response.read()
+        timings["render"] = (time.perf_counter() - start) * 1000
+    finally:
+        _stop(proc)
+        reader.join(1)
+
+    return timings
+
+
+def percentile(values: list, q: float) -> float:
+    """Return the q-th percentile (0-100) with linear interpolation."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(runs: list) -> dict:
+    """Return min/p50/p90/max/mean per phase over a list of runs."""
+    summary = {}
+    for phase in PHASES:
+        values = [run[phase] for run in runs if run.get(phase) is not None]
+        if not values:
+            summary[phase] = None
+            continue
+        summary[phase] = {
+            "min": min(values),
+            "p50": percentile(values, 50),
+            "p90": percentile(values, 90),
+            "max": max(values),
+            "mean": sum(values) / len(values),
+        }
+    return summary
+
+
+def bench_target(
+    project_path: Path,
+    config: dict,
+    target: str,
+    runs: int = 5,
+    timeout: float = 60.0,
+    progress=None,
+) -> dict:
+    """Benchmark cold and warm startups of one target.
+
+    Cold runs get fresh bytecode and extraction cache directories; warm runs
+    share primed ones, after one unrecorded warm-up launch.
+    """
+    command = target_command(project_path, config, target)
+    if command is None:
+        raise FileNotFoundError(f"No {target} build found in {project_path / 'dist'}")
+
+    def env_for(cache_dir: Path) -> dict:
+        env = dict(
+            os.environ,
+            VISIONIT_BENCH="1",
+            VISIONIT_HEADLESS="1",
+            PYTHONPYCACHEPREFIX=str(cache_dir / "pycache"),
+        )
+        # Extraction cache of onefile builds with extract_cache
+        env["LOCALAPPDATA" if sys.platform == "win32" else "XDG_CACHE_HOME"] = str(cache_dir)
+        return env
+
+    results = {"cold": [], "warm": []}
+    with tempfile.TemporaryDirectory(prefix="visionit-bench-") as tmp:
+        tmp = Path(tmp)
+        for i in range(runs):
+            cache_dir = tmp / f"cold-{i}"
+            port = free_port()
+            env = dict(env_for(cache_dir), VISIONIT_PORT=str(port))
+            results["cold"].append(measure_startup(command, project_path, env, port, timeout))
+            shutil.rmtree(cache_dir, ignore_errors=True)
+            if progress:
+                progress(target, "cold", i + 1, runs)
+
+        for i in range(runs + 1):
+            port = free_port()
+            env = dict(env_for(tmp / "warm"), VISIONIT_PORT=str(port))
+            timings = measure_startup(command, project_path, env, port, timeout)
+            if i == 0:
+                continue
+            results["warm"].append(timings)
+            if progress:
+                progress(target, "warm", i, runs)
+
+    if target == "onedir":
+        size = sum(f.stat().st_size for f in Path(command[0]).parent.rglob("*") if f.is_file())
+    else:
+        size = Path(command[-1]).stat().st_size
+
+    return {
+        "target": target,
+        "command": command,
+        "size": size,
+        "runs": results,
+        "cold": summarize(results["cold"]),
+        "warm": summarize(results["warm"]),
+    }
+
+
+def environment_info(config: dict) -> dict:
+    """Return the context needed to compare results between machines and releases."""
+    from visionit import __version__
+
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "visionit": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "build": {
+            key: config.get(key) for key in ("app_name", "upx", "extract_cache", "exclude_modules")
+        },
+    }
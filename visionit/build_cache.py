@@ -0,0 +1,182 @@
+"""VisionIT build cache - skip PyInstaller when build inputs are unchanged."""
+
+import functools
+import hashlib
+import json
+import platform
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import Iterable, Optional
+
+CACHE_FILE = ".visionit-build.json"
+
+# Folders that never contribute to the bundle
+IGNORED_DIRS = {"build", "dist", "__pycache__", ".git", "venv", ".venv", "env", "node_modules"}
+
+
+def iter_files(root: Path) -> Iterable[Path]:
+    """Yield files under root in a stable order, skipping ignored folders."""
+    if root.is_file():
+        yield root
+        return
+    for path in sorted(root.rglob("*")):
+        if path.is_file() and not IGNORED_DIRS.intersection(path.relative_to(root).parts):
+            yield path
+
+
+def read_requirements(project_path: Path) -> list:
+    """Return distribution names listed in package.txt."""
+    package_file = project_path / "package.txt"
+    if not package_file.exists():
+        return []
+    names = []
+    for line in package_file.read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        for sep in ("[", "<", ">", "=", "!", "~", ";", " "):
+            line = line.split(sep, 1)[0]
+        names.append(line.strip())
+    return names
+
+
+def package_versions(names: Iterable[str]) -> dict:
+    """Return installed versions for the given distributions."""
+    versions = {}
+    for name in sorted(set(names)):
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+@functools.lru_cache(maxsize=None)
+def _import_map() -> dict:
+    """Map top-level import names to the distributions that install them."""
+    if hasattr(metadata, "packages_distributions"):
+        return metadata.packages_distributions()
+    # Python 3.9: top_level.txt, else the first part of each installed file
+    mapping = {}
+    for dist in metadata.distributions():
+        top_level = (dist.read_text("top_level.txt") or "").split()
+        if not top_level:
+            top_level = {
+                Path(f.parts[0]).stem
+                for f in dist.files or []
+                if f.parts and not f.parts[0].endswith((".dist-info", ".data", ".egg-info"))
+            }
+        for name in top_level:
+            mapping.setdefault(name, []).append(dist.metadata["Name"])
+    return mapping
+
+
+def bundled_distributions(project_path: Path, config: dict) -> list:
+    """Return the distributions a build bundles: package.txt, PyInstaller, hidden imports.
+
+    Hidden imports are module names (webview); they count as the distribution
+    that installs them (pywebview). Names no distribution installs are kept.
+    """
+    names = set(read_requirements(project_path) + ["pyinstaller"])
+    mapping = _import_map()
+    for imp in config.get("hidden_imports", []):
+        top_level = imp.split(".")[0]
+        names.update(mapping.get(top_level, [top_level]))
+    return sorted(names)
+
+
+def compute_fingerprint(project_path: Path, config: dict, mode: str) -> str:
+    """Hash every input that influences a PyInstaller build."""
+    digest = hashlib.sha256()
+
+    def update(label: str, data: bytes) -> None:
+        digest.update(label.encode("utf-8") + b"\0" + data + b"\0")
+
+    update("mode", mode.encode("utf-8"))
+    update("python", f"{sys.version} {platform.machine()}".encode("utf-8"))
+    update("config", json.dumps(config, sort_keys=True).encode("utf-8"))
+
+    # Project sources, then every add_data tree
+    sources = [p for p in iter_files(project_path) if p.suffix == ".py"]
+    for src, _ in config.get("add_data", []):
+        data_path = project_path / src
+        if data_path.exists():
+            sources.extend(iter_files(data_path))
+
+    for path in sorted(set(sources)):
+        file_hash = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                file_hash.update(chunk)
+        update(path.relative_to(project_path).as_posix(), file_hash.digest())
+
+    # Installed versions of everything that gets bundled
+    versions = package_versions(bundled_distributions(project_path, config))
+    update("packages", json.dumps(versions, sort_keys=True).encode("utf-8"))
+
+    return digest.hexdigest()
+
+
+def mode_fingerprints(project_path: Path, config: dict, modes: list) -> dict:
+    """Return the fingerprint of each build mode, as recorded after a build."""
+    return {
+        mode: compute_fingerprint(project_path, dict(config, onefile=(mode == "onefile")), mode)
+        for mode in modes
+    }
+
+
+def onedir_name(config: dict) -> str:
+    """Return the onedir folder name, distinct from the onefile executable."""
+    return f"{config.get('app_name', 'app')}_onedir"
+
+
+def artifact_path(project_path: Path, config: dict, mode: str) -> Path:
+    """Return the path PyInstaller writes for the given mode."""
+    if mode == "onedir":
+        return project_path / "dist" / onedir_name(config)
+    app_name = config.get("app_name", "app")
+    if sys.platform == "win32":
+        app_name += ".exe"
+    return project_path / "dist" / app_name
+
+
+def _load_cache(project_path: Path) -> dict:
+    cache_file = project_path / "dist" / CACHE_FILE
+    if not cache_file.exists():
+        return {}
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def is_up_to_date(
+    project_path: Path, config: dict, mode: str, fingerprint: Optional[str] = None
+) -> bool:
+    """Check if the last successful build for mode matches the current inputs."""
+    entry = _load_cache(project_path).get(mode)
+    if not entry:
+        return False
+
+    artifact = artifact_path(project_path, config, mode)
+    exists = artifact.is_file() if mode == "onefile" else artifact.is_dir()
+    if not exists:
+        return False
+
+    fingerprint = fingerprint or compute_fingerprint(project_path, config, mode)
+    return entry.get("fingerprint") == fingerprint
+
+
+def record_build(project_path: Path, config: dict, mode: str, fingerprint: str) -> None:
+    """Record the fingerprint of a successful build."""
+    cache = _load_cache(project_path)
+    cache[mode] = {
+        "fingerprint": fingerprint,
+        "artifact": artifact_path(project_path, config, mode).name,
+    }
+    cache_file = project_path / "dist" / CACHE_FILE
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=4)
@@ -0,0 +1,183 @@
+"""VisionIT bundle analysis - per-package size report from PyInstaller's build output."""
+
+import ast
+import html
+import os
+import re
+from collections import deque
+from pathlib import Path
+from typing import Optional
+
+from visionit.build_cache import read_requirements
+
+# TOC typecodes that end up in the bundle
+BUNDLED_TYPES = {"PYMODULE", "PYSOURCE", "EXTENSION", "BINARY", "DATA", "ZIPFILE"}
+
+# Stdlib packages that are safe to exclude from a NiceGUI desktop app
+OPTIONAL_STDLIB = {"tkinter", "unittest", "pydoc_data", "test", "lib2to3", "idlelib", "turtledemo"}
+
+# Third-party packages smaller than this are not worth excluding
+SUGGEST_MIN_SIZE = 1 << 20
+
+SITE_DIRS = {"site-packages", "dist-packages"}
+
+_NODE_RE = re.compile(r'<a name="([^"]+)"></a>')
+_TYPE_RE = re.compile(r'<span class="moduletype">([^<]*)</span>')
+_HREF_RE = re.compile(r'href="#([^"]+)"')
+
+
+def find_workpath(project_path: Path, config: dict) -> Optional[Path]:
+    """Return PyInstaller's work directory for the project, if it was built."""
+    workpath = project_path / "build" / config.get("app_name", "app")
+    if (workpath / "Analysis-00.toc").exists():
+        return workpath
+    return None
+
+
+def _iter_toc_entries(value):
+    """Yield (name, path, typecode) tuples found anywhere in a TOC structure."""
+    if isinstance(value, tuple) and len(value) == 3 and all(isinstance(v, str) for v in value):
+        if value[2] in BUNDLED_TYPES:
+            yield value
+        return
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_toc_entries(item)
+
+
+def read_toc_entries(workpath: Path) -> list:
+    """Read every bundled file recorded by the Analysis step, deduplicated."""
+    entries = {}
+    for toc_file in sorted(workpath.glob("Analysis-*.toc")):
+        toc = ast.literal_eval(toc_file.read_text(encoding="utf-8"))
+        for name, path, typecode in _iter_toc_entries(toc):
+            entries[(name, typecode)] = path
+    return [(name, path, typecode) for (name, typecode), path in entries.items()]
+
+
+def package_of(name: str, typecode: str) -> str:
+    """Return the top-level package a TOC entry belongs to."""
+    if typecode in ("PYMODULE", "PYSOURCE") or (
+        typecode == "EXTENSION" and "/" not in name and os.sep not in name
+    ):
+        return name.split(".")[0]
+    parts = Path(name).parts
+    if parts[0].startswith("python") or parts[0] == "lib-dynload":
+        # Interpreter extension modules, e.g. python3.11/lib-dynload/_ssl.so
+        return Path(parts[-1]).name.split(".")[0]
+    if len(parts) == 1:
+        return Path(parts[0]).name.split(".")[0]
+    return parts[0].split(".")[0]
+
+
+def parse_xref(xref_file: Path) -> tuple:
+    """Parse PyInstaller's xref HTML into (imports graph, script names)."""
+    graph = {}
+    scripts = []
+    content = xref_file.read_text(encoding="utf-8", errors="replace")
+    for block in content.split('<div class="node">')[1:]:
+        match = _NODE_RE.search(block)
+        if not match:
+            continue
+        name = html.unescape(match.group(1))
+        type_match = _TYPE_RE.search(block)
+        if type_match and type_match.group(1).strip() == "Script":
+            scripts.append(name)
+        imports = block.split("imports:", 1)[1].split("</div>", 1)[0] if "imports:" in block else ""
+        graph[name] = [html.unescape(m) for m in _HREF_RE.findall(imports)]
+    return graph, scripts
+
+
+def import_chains(graph: dict, roots: list) -> dict:
+    """Return the shortest import chain from the roots to each top-level package."""
+    chains = {}
+    parents = {root: None for root in roots}
+    queue = deque(roots)
+    while queue:
+        node = queue.popleft()
+        top = node.split(".")[0]
+        if top not in chains and node not in roots:
+            chain = []
+            current = node
+            while current is not None:
+                chain.append(current)
+                current = parents[current]
+            chains[top] = list(reversed(chain))
+        for child in graph.get(node, []):
+            if child not in parents:
+                parents[child] = node
+                queue.append(child)
+    return chains
+
+
+def analyze_bundle(project_path: Path, config: dict, workpath: Path) -> dict:
+    """Build the bundle report: package sizes, import chains and exclude suggestions."""
+    packages = {}
+    for name, path, typecode in read_toc_entries(workpath):
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            continue
+        package = package_of(name, typecode)
+        info = packages.setdefault(
+            package, {"name": package, "size": 0, "files": 0, "types": set(), "third_party": False}
+        )
+        info["size"] += size
+        info["files"] += 1
+        info["types"].add(typecode)
+        if SITE_DIRS.intersection(Path(path).parts):
+            info["third_party"] = True
+
+    xref_file = workpath / f"xref-{config.get('app_name', 'app')}.html"
+    chains, scripts, direct = {}, [], set()
+    if xref_file.exists():
+        graph, scripts = parse_xref(xref_file)
+        chains = import_chains(graph, scripts)
+        for script in scripts:
+            direct.update(m.split(".")[0] for m in graph.get(script, []))
+
+    # Packages the project asks for explicitly are never suggested
+    protected = {n.lower().replace("-", "_") for n in read_requirements(project_path)}
+    protected.update(imp.split(".")[0] for imp in config.get("hidden_imports", []))
+    protected.add(config.get("main_module", "main"))
+    excluded = set(config.get("exclude_modules", []))
+
+    report = []
+    for info in sorted(packages.values(), key=lambda p: p["size"], reverse=True):
+        name = info["name"]
+        report.append(
+            {
+                "name": name,
+                "size": info["size"],
+                "files": info["files"],
+                "types": sorted(info["types"]),
+                "third_party": info["third_party"],
+                "chain": chains.get(name, []),
+            }
+        )
+
+    suggestions = [
+        p["name"]
+        for p in report
+        if p["name"] not in protected
+        and p["name"] not in direct
+        and p["name"] not in excluded
+        and p["chain"]
+        and (p["name"] in OPTIONAL_STDLIB or (p["third_party"] and p["size"] >= SUGGEST_MIN_SIZE))
+    ]
+
+    return {
+        "app_name": config.get("app_name", "app"),
+        "total_size": sum(p["size"] for p in report),
+        "packages": report,
+        "suggested_excludes": suggestions,
+    }
+
+
+def format_size(size: int) -> str:
+    """Format a byte count for display."""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
@@ -0,0 +1 @@
+"""VisionIT CLI command groups, loaded on demand by visionit.cli."""
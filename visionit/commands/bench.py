@@ -0,0 +1,139 @@
+"""VisionIT `bench` commands - startup and database performance measurements."""
+
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+from visionit.bench import (
+    PHASES,
+    TARGETS,
+    available_targets,
+    bench_target,
+    environment_info,
+    percentile,
+)
+from visionit.bundle_analysis import format_size
+from visionit.commands.build import load_build_config
+from visionit.sqlite_tuning import PROFILES, bench_writes
+
+app = typer.Typer(help="Performance benchmark commands", add_completion=False)
+
+
+@app.callback()
+def callback():
+    # Keeps `startup` a subcommand as more benchmarks are added
+    pass
+
+
+@app.command("startup")
+def bench_startup(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    targets: Optional[List[str]] = typer.Option(
+        None,
+        "--target",
+        "-t",
+        help="onefile, onedir or source (repeatable, default: every build in dist/)",
+    ),
+    runs: int = typer.Option(5, "--runs", "-n", min=1, help="Cold and warm launches per target"),
+    timeout: float = typer.Option(60.0, "--timeout", help="Seconds to wait for each launch"),
+    output: str = typer.Option(
+        ".visionit/bench-startup.json", "--output", "-o", help="JSON results file"
+    ),
+):
+    """Measure time from process start to the first rendered page."""
+    path = Path(project_path)
+    config = load_build_config(path)
+
+    if not config:
+        typer.echo("❌ Error: build.json not found. Run 'visionit new' or create build.json")
+        raise typer.Exit(1)
+
+    targets = targets or available_targets(path, config)
+    unknown = [t for t in targets if t not in TARGETS]
+    if unknown:
+        typer.echo(f"❌ Error: unknown target(s): {', '.join(unknown)} (use {', '.join(TARGETS)})")
+        raise typer.Exit(1)
+
+    def progress(target, kind, done, total):
+        typer.echo(f"\r  {kind} {done}/{total}", nl=(kind == "warm" and done == total))
+
+    results = []
+    for target in targets:
+        typer.echo(f"⏱️  Benchmarking {target} ({runs} cold + {runs} warm launches)...")
+        try:
+            results.append(bench_target(path, config, target, runs, timeout, progress))
+        except (FileNotFoundError, RuntimeError, TimeoutError, OSError) as e:
+            typer.echo(f"❌ Error: {e}")
+            raise typer.Exit(1)
+
+    report = dict(environment_info(config), results=results)
+    output_file = path / output
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4)
+
+    for result in results:
+        typer.echo(f"\n📊 {result['target']} ({format_size(result['size'])}), ms since launch")
+        typer.echo(f"  {'':8} {'cold p50':>9} {'cold p90':>9} {'warm p50':>9} {'warm p90':>9}")
+        for phase in PHASES:
+            cells = []
+            for kind in ("cold", "warm"):
+                stats = result[kind][phase]
+                for key in ("p50", "p90"):
+                    cells.append(f"{stats[key]:9.0f}" if stats else f"{'-':>9}")
+            typer.echo(f"  {phase:8} {' '.join(cells)}")
+
+    typer.echo(f"\n✅ Results written to {output_file}")
+
+
+@app.command("sqlite")
+def bench_sqlite(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    profiles: Optional[List[str]] = typer.Option(
+        None, "--profile", help="default or performance (repeatable, default: both)"
+    ),
+    writers: int = typer.Option(8, "--writers", "-w", min=1, help="Concurrent connections writing"),
+    writes: int = typer.Option(
+        200, "--writes", "-n", min=1, help="Write transactions per connection"
+    ),
+    output: str = typer.Option(
+        ".visionit/bench-sqlite.json", "--output", "-o", help="JSON results file"
+    ),
+):
+    """Compare SQLite profiles under concurrent write transactions."""
+    path = Path(project_path)
+    profiles = profiles or list(PROFILES)
+    unknown = [p for p in profiles if p not in PROFILES]
+    if unknown:
+        typer.echo(
+            f"❌ Error: unknown profile(s): {', '.join(unknown)} " f"(use {', '.join(PROFILES)})"
+        )
+        raise typer.Exit(1)
+
+    results = []
+    for profile in profiles:
+        typer.echo(f"⏱️  {profile}: {writers} writers x {writes} transactions...")
+        # Same disk as the project's database
+        results.append(bench_writes(profile, writers, writes, directory=path))
+
+    output_file = path / output
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump({"results": results}, f, indent=4)
+
+    typer.echo(
+        f"\n📊 {'profile':12} {'writes/s':>9} {'committed':>10} {'locked':>7} "
+        f"{'p50 ms':>7} {'p99 ms':>7}"
+    )
+    for result in results:
+        latencies = result["latencies_ms"]
+        p50 = f"{percentile(latencies, 50):7.2f}" if latencies else f"{'-':>7}"
+        p99 = f"{percentile(latencies, 99):7.2f}" if latencies else f"{'-':>7}"
+        typer.echo(
+            f"   {result['profile']:12} {result['writes_per_second']:9.0f} "
+            f"{result['committed']:>10} {result['locked']:>7} {p50} {p99}"
+        )
+
+    typer.echo(f"\n✅ Results written to {output_file}")
@@ -0,0 +1,689 @@
+"""VisionIT `build` commands - PyInstaller executables."""
+
+import json
+import os
+import shutil
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from visionit.build_cache import (
+    artifact_path,
+    is_up_to_date,
+    mode_fingerprints,
+    onedir_name,
+    record_build,
+)
+from visionit.bundle_analysis import analyze_bundle, find_workpath, format_size
+from visionit.extract_cache import (
+    LAUNCHER_EXCLUDES,
+    STRIP_LAUNCHER,
+    attach_payload,
+    is_supported,
+    write_launcher_script,
+)
+from visionit.import_scan import ScanError, compute_hidden_imports
+from visionit.process_runner import (
+    PIP_PHASES,
+    PYINSTALLER_PHASES,
+    log_path,
+    phase_summary,
+    run_streamed,
+)
+from visionit.pyinstaller_cache import (
+    MAX_CACHE_MB,
+    cache_dir,
+    entry_for,
+    evict,
+    in_use,
+    inactive_reason,
+    list_entries,
+    max_cache_bytes,
+    uses_bincache,
+)
+from visionit.workspace import (
+    MEMORY_PER_JOB_MB,
+    MODES,
+    REPORT_FILE,
+    available_memory_mb,
+    build_workspace,
+    discover_projects,
+    load_workspace,
+    max_jobs,
+)
+
+app = typer.Typer(help="Build executable commands", add_completion=False)
+
+
+def load_build_config(project_path: Path) -> dict:
+    """Load build configuration from build.json."""
+    config_file = project_path / "build.json"
+    if not config_file.exists():
+        return None
+    with open(config_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_build_config(project_path: Path, config: dict) -> None:
+    """Write build configuration back to build.json."""
+    with open(project_path / "build.json", "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=4)
+
+
+def scan_hidden_imports(project_path: Path, config: dict) -> bool:
+    """Replace hidden_imports with the scanned set and report whether it changed."""
+    try:
+        hidden = compute_hidden_imports(project_path, config)
+    except ScanError as e:
+        typer.echo(f"❌ Error: cannot scan imports, {e}")
+        raise typer.Exit(1)
+    current = config.get("hidden_imports", [])
+    if hidden == sorted(current):
+        return False
+
+    for name in sorted(set(hidden) - set(current)):
+        typer.echo(f"  + {name}")
+    for name in sorted(set(current) - set(hidden)):
+        typer.echo(f"  - {name}")
+    config["hidden_imports"] = hidden
+    return True
+
+
+def generate_pyinstaller_spec(
+    project_path: Path, config: dict, modes: Optional[list] = None
+) -> Path:
+    """Generate PyInstaller spec file.
+
+    ``modes`` lists the outputs to produce ("onefile", "onedir"); it defaults to
+    the mode in build.json. Every output shares a single Analysis and PYZ.
+    """
+    app_name = config.get("app_name", "app")
+    main_module = config.get("main_module", "main")
+    hidden_imports = config.get("hidden_imports", [])
+    exclude_modules = config.get("exclude_modules", [])
+    add_data = config.get("add_data", [])
+    windowed = config.get("windowed", False)
+    onefile = config.get("onefile", False)
+    icon = config.get("icon")
+    upx = config.get("upx", True)
+    modes = modes or (["onefile"] if onefile else ["onedir"])
+    # With extract_cache, the onefile is a launcher carrying the onedir bundle
+    extract_cache = config.get("extract_cache", False) and "onefile" in modes and is_supported()
+
+    # Format data for PyInstaller
+    data_tuples = []
+    for src, dst in add_data:
+        data_tuples.append(f'("{src}", "{dst}")')
+
+    # Format hidden imports
+    hidden_imports_str = ", ".join(f'"{imp}"' for imp in hidden_imports)
+
+    # Format excluded modules
+    exclude_str = ", ".join(f'"{mod}"' for mod in exclude_modules)
+
+    # Handle icon
+    icon_str = f'"{icon}"' if icon else "None"
+
+    # Options shared by every EXE target
+    exe_options = f"""    name="{app_name}",
+    debug=False,
+    bootloader_ignore_signals=False,
+    console={not windowed},
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon={icon_str},"""
+
+    spec_content = f"""# -*- mode: python ; coding: utf-8 -*-
+
+block_cipher = None
+
+a = Analysis(
+    ["{main_module}.py"],
+    pathex=[],
+    binaries=[],
+    datas=[{", ".join(data_tuples)}],
+    hiddenimports=[{hidden_imports_str}],
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes=[{exclude_str}],
+    win_no_prefer_redirects=False,
+    win_private_assemblies=False,
+    cipher=block_cipher,
+    noarchive=False,
+)
+
+pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
+"""
+
+    if "onefile" in modes and not extract_cache:
+        spec_content += f"""
+exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    [],
+{exe_options}
+    strip=False,
+    upx={upx},
+    upx_exclude=[],
+    runtime_tmpdir=None,
+)
+"""
+
+    if "onedir" in modes or extract_cache:
+        spec_content += f"""
+exe_onedir = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+{exe_options}
+    strip=False,
+    upx={upx},
+)
+
+coll = COLLECT(
+    exe_onedir,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx={upx},
+    upx_exclude=[],
+    name="{onedir_name(config)}",
+)
+"""
+
+    if extract_cache:
+        launcher = write_launcher_script(project_path).relative_to(project_path).as_posix()
+        launcher_excludes = ", ".join(f'"{mod}"' for mod in LAUNCHER_EXCLUDES)
+        spec_content += f"""
+# Small launcher: the onedir bundle is appended to it after the build.
+# PyInstaller unpacks it on every launch, so it carries as little as possible.
+launcher = Analysis(
+    ["{launcher}"],
+    pathex=[],
+    binaries=[],
+    datas=[],
+    hiddenimports=[],
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes=[{launcher_excludes}],
+    noarchive=False,
+)
+
+launcher_pyz = PYZ(launcher.pure)
+
+exe = EXE(
+    launcher_pyz,
+    launcher.scripts,
+    launcher.binaries,
+    launcher.datas,
+    [],
+{exe_options}
+    strip={STRIP_LAUNCHER},
+    upx=False,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+)
+"""
+
+    spec_path = project_path / f"{app_name}.spec"
+    with open(spec_path, "w", encoding="utf-8") as f:
+        f.write(spec_content)
+
+    return spec_path
+
+
+def run_workspace(
+    path: Path,
+    mode: Optional[str],
+    jobs: Optional[int],
+    memory_per_job: Optional[int],
+    clean: bool,
+    force: bool,
+) -> None:
+    """Build every project of a workspace concurrently and print the summary."""
+    if not path.exists():
+        typer.echo(f"❌ Error: workspace not found at {path}")
+        raise typer.Exit(1)
+    try:
+        root, workspace = load_workspace(path)
+    except ValueError as e:
+        typer.echo(f"❌ Error: invalid workspace file: {e}")
+        raise typer.Exit(1)
+
+    mode = mode or workspace.get("mode", "onefile")
+    if mode not in MODES:
+        typer.echo(f"❌ Error: unknown mode '{mode}' (use {', '.join(MODES)})")
+        raise typer.Exit(1)
+    projects = discover_projects(root, workspace)
+    if not projects:
+        typer.echo(f"❌ Error: no project with a build.json under {root}")
+        raise typer.Exit(1)
+
+    memory = available_memory_mb()
+    jobs = max_jobs(
+        jobs or workspace.get("jobs"),
+        memory_per_job or workspace.get("memory_per_job_mb", MEMORY_PER_JOB_MB),
+        memory_mb=memory,
+    )
+    memory_note = f", {memory} MB free" if memory is not None else ""
+    typer.echo(
+        f"🔨 Building {len(projects)} projects ({mode}) with {jobs} jobs "
+        f"({os.cpu_count()} cores{memory_note})...\n"
+    )
+
+    def on_phase(name: str, phase: str) -> None:
+        typer.echo(f"   ⏳ {name}: {phase}...")
+
+    def on_finish(entry: dict) -> None:
+        if entry["status"] == "cached":
+            typer.echo(f"   ⚡ {entry['project']} is up to date")
+        elif entry["status"] == "built":
+            typer.echo(f"   ✓ {entry['project']} built in {entry['seconds']:.1f}s")
+        else:
+            typer.echo(f"   ✗ {entry['project']}: {entry['error']}")
+
+    report = build_workspace(root, projects, mode, jobs, force, clean, on_phase, on_finish)
+
+    typer.echo("\n📊 Summary:")
+    width = max(len(entry["project"]) for entry in report["projects"])
+    for entry in report["projects"]:
+        phases = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in entry["phases"].items())
+        typer.echo(
+            f"   {entry['project']:<{width}}  {entry['status']:<6}  {entry['seconds']:7.1f}s"
+            f"  {phases}".rstrip()
+        )
+    counts = {
+        status: sum(1 for entry in report["projects"] if entry["status"] == status)
+        for status in ("built", "cached", "failed")
+    }
+    total = sum(entry["seconds"] for entry in report["projects"])
+    typer.echo(
+        f"\n   {counts['built']} built, {counts['cached']} cache hits, "
+        f"{counts['failed']} failed in {report['seconds']:.1f}s ({total:.1f}s of builds)"
+    )
+    typer.echo(f"📄 Report: {root / REPORT_FILE}")
+
+    failed = [entry for entry in report["projects"] if entry["status"] == "failed"]
+    for entry in failed:
+        typer.echo(f"❌ {entry['project']}: {entry['error']}")
+        if entry["log"]:
+            typer.echo(f"   Full log: {entry['log']}")
+    if failed:
+        raise typer.Exit(1)
+    typer.echo("\n✅ Workspace build completed!")
+
+
+@app.callback(invoke_without_command=True)
+def build_callback(
+    ctx: typer.Context,
+    workspace: Optional[str] = typer.Option(
+        None,
+        "--workspace",
+        "-W",
+        help="Build every project of a folder or visionit-workspace.json",
+    ),
+    mode: Optional[str] = typer.Option(
+        None, "--mode", "-m", help="With --workspace: onefile, onedir or all"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", help="With --workspace: builds at a time"
+    ),
+    memory_per_job: Optional[int] = typer.Option(
+        None, "--memory-per-job", help="With --workspace: MB of memory each build needs"
+    ),
+    clean: bool = typer.Option(
+        False, "--clean", "-c", help="With --workspace: clean build artifacts"
+    ),
+    force: bool = typer.Option(False, "--force", "-f", help="With --workspace: rebuild everything"),
+):
+    # Subcommands build one project; --workspace builds a whole monorepo
+    if ctx.invoked_subcommand is not None:
+        return
+    if workspace is None:
+        typer.echo(ctx.get_help())
+        raise typer.Exit()
+    run_workspace(Path(workspace), mode, jobs, memory_per_job, clean, force)
+
+
+@app.command("config")
+def build_config(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+):
+    """Show current build configuration."""
+    path = Path(project_path)
+    config = load_build_config(path)
+
+    if not config:
+        typer.echo("❌ Error: build.json not found. Run 'visionit new' or create build.json")
+        raise typer.Exit(1)
+
+    typer.echo("📋 Build Configuration:\n")
+    typer.echo(json.dumps(config, indent=2))
+
+
+@app.command("spec")
+def build_spec(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+):
+    """Generate PyInstaller spec file."""
+    path = Path(project_path)
+    config = load_build_config(path)
+
+    if not config:
+        typer.echo("❌ Error: build.json not found. Run 'visionit new' or create build.json")
+        raise typer.Exit(1)
+
+    typer.echo("📝 Generating PyInstaller spec file...\n")
+    spec_path = generate_pyinstaller_spec(path, config)
+    typer.echo(f"✅ Spec file created: {spec_path}")
+
+
+def run_build(
+    path: Path, config: dict, modes: list, clean: bool = False, force: bool = False
+) -> None:
+    """Build the given modes with PyInstaller from the generated spec file."""
+    if config.get("extract_cache") and "onefile" in modes and not is_supported():
+        typer.echo(
+            "⚠️  extract_cache is not supported on macOS (the payload would break the "
+            "code signature): building a standard onefile."
+        )
+        config = dict(config, extract_cache=False)
+    fingerprints = mode_fingerprints(path, config, modes)
+
+    # Skip PyInstaller when nothing changed since the last successful build
+    if not (force or clean) and all(
+        is_up_to_date(path, config, mode, fingerprints[mode]) for mode in modes
+    ):
+        for mode in modes:
+            typer.echo(f"⚡ Build is up to date: {artifact_path(path, config, mode)}")
+        typer.echo("   Use --force to rebuild.")
+        return
+
+    # One spec, one Analysis: every output shares the dependency scan
+    spec_path = generate_pyinstaller_spec(path, config, modes)
+
+    # PyInstaller's --clean would also empty its binary cache: only drop this spec's work files
+    if clean:
+        shutil.rmtree(path / "build" / spec_path.stem, ignore_errors=True)
+    # UPX-compressed or re-signed binaries are shared by the projects on the same stack
+    cache_entry = entry_for(path, config) if uses_bincache(config) else None
+    if cache_entry is None:
+        typer.echo(
+            f"💡 Shared PyInstaller cache inactive: {inactive_reason(config)} "
+            "(PyInstaller only caches binaries it compresses with UPX or re-signs on macOS)"
+        )
+
+    # Explicit work and dist paths keep concurrent workspace builds apart
+    cmd = [
+        "pyinstaller",
+        "--noconfirm",
+        "--workpath",
+        str((path / "build").resolve()),
+        "--distpath",
+        str((path / "dist").resolve()),
+        spec_path.name,
+    ]
+
+    try:
+        with in_use(cache_entry) if cache_entry else nullcontext():
+            result = run_streamed(
+                cmd,
+                log_path(path, "build"),
+                cwd=path,
+                phases=PYINSTALLER_PHASES,
+                on_phase=lambda phase: typer.echo(f"   ⏳ {phase}..."),
+                env={"PYINSTALLER_CONFIG_DIR": str(cache_entry)} if cache_entry else None,
+            )
+    except FileNotFoundError:
+        typer.echo("❌ Error: PyInstaller not found. Install it with:")
+        typer.echo("   pip install pyinstaller")
+        raise typer.Exit(1)
+
+    if result["returncode"] != 0:
+        typer.echo("❌ Error building executable:")
+        typer.echo("\n".join(result["tail"]))
+        typer.echo(f"   Full log: {result['log']}")
+        raise typer.Exit(1)
+
+    if config.get("extract_cache") and "onefile" in modes:
+        bundle_dir = artifact_path(path, config, "onedir")
+        attach_payload(artifact_path(path, config, "onefile"), bundle_dir)
+        if "onedir" not in modes:
+            shutil.rmtree(bundle_dir)
+    for mode in modes:
+        record_build(path, config, mode, fingerprints[mode])
+    typer.echo(f"✅ Executable built successfully in {result['seconds']:.1f}s!")
+    typer.echo(f"   {phase_summary(result)}")
+    for mode in modes:
+        suffix = "/" if mode == "onedir" else ""
+        typer.echo(f"📦 Output: {artifact_path(path, config, mode)}{suffix}")
+    typer.echo(f"📄 Log: {result['log']}")
+    if cache_entry:
+        typer.echo(f"♻️  Shared binary cache: {cache_entry}")
+        for entry in evict(max_cache_bytes(), keep=cache_entry):
+            typer.echo(
+                f"   Evicted {entry['path'].name} ({format_size(entry['size'])}, "
+                "least recently used)"
+            )
+
+
+@app.command("onefile")
+def build_onefile(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    clean: bool = typer.Option(False, "--clean", "-c", help="Clean build artifacts"),
+    force: bool = typer.Option(False, "--force", "-f", help="Rebuild even if inputs are unchanged"),
+):
+    """Build a single executable file (onefile mode)."""
+    path = Path(project_path)
+    config = load_build_config(path)
+
+    if not config:
+        typer.echo("❌ Error: build.json not found. Run 'visionit new' or create build.json")
+        raise typer.Exit(1)
+
+    # Update config for onefile mode
+    config["onefile"] = True
+    if config.get("scan_imports"):
+        scan_hidden_imports(path, config)
+    save_build_config(path, config)
+
+    typer.echo("🔨 Building executable (onefile mode)...\n")
+    run_build(path, config, ["onefile"], clean, force)
+
+
+@app.command("onedir")
+def build_onedir(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    clean: bool = typer.Option(False, "--clean", "-c", help="Clean build artifacts"),
+    force: bool = typer.Option(False, "--force", "-f", help="Rebuild even if inputs are unchanged"),
+):
+    """Build an executable with separate directory (onedir mode)."""
+    path = Path(project_path)
+    config = load_build_config(path)
+
+    if not config:
+        typer.echo("❌ Error: build.json not found. Run 'visionit new' or create build.json")
+        raise typer.Exit(1)
+
+    # Update config for onedir mode
+    config["onefile"] = False
+    if config.get("scan_imports"):
+        scan_hidden_imports(path, config)
+    save_build_config(path, config)
+
+    typer.echo("🔨 Building executable (onedir mode)...\n")
+    run_build(path, config, ["onedir"], clean, force)
+
+
+@app.command("all")
+def build_all(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    clean: bool = typer.Option(False, "--clean", "-c", help="Clean build artifacts"),
+    force: bool = typer.Option(False, "--force", "-f", help="Rebuild even if inputs are unchanged"),
+):
+    """Build executables for current platform with all modes."""
+    path = Path(project_path)
+    config = load_build_config(path)
+
+    if not config:
+        typer.echo("❌ Error: build.json not found. Run 'visionit new' or create build.json")
+        raise typer.Exit(1)
+
+    # build.json is left untouched unless scanned imports changed: the spec carries both modes
+    if config.get("scan_imports") and scan_hidden_imports(path, config):
+        save_build_config(path, config)
+
+    typer.echo("🔨 Building executables (onefile + onedir)...\n")
+    run_build(path, config, ["onefile", "onedir"], clean, force)
+
+    typer.echo("\n✅ All builds completed!")
+
+
+@app.command("deps-scan")
+def build_deps_scan(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show changes without writing build.json"
+    ),
+):
+    """Compute hidden_imports from the imports of main.py and actions/."""
+    path = Path(project_path)
+    config = load_build_config(path)
+
+    if not config:
+        typer.echo("❌ Error: build.json not found. Run 'visionit new' or create build.json")
+        raise typer.Exit(1)
+
+    typer.echo("🔍 Scanning project imports...\n")
+    if not scan_hidden_imports(path, config):
+        typer.echo("✅ hidden_imports is up to date")
+        return
+
+    if dry_run:
+        typer.echo("\n💡 Dry run: build.json not modified")
+        return
+    save_build_config(path, config)
+    typer.echo("\n✅ build.json updated")
+
+
+@app.command("analyze")
+def build_analyze(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    top: int = typer.Option(15, "--top", "-n", help="Number of packages to show"),
+    json_output: bool = typer.Option(False, "--json", help="Print the report as JSON"),
+):
+    """Report the size each package adds to the bundle and why it is included."""
+    path = Path(project_path)
+    config = load_build_config(path)
+
+    if not config:
+        typer.echo("❌ Error: build.json not found. Run 'visionit new' or create build.json")
+        raise typer.Exit(1)
+
+    workpath = find_workpath(path, config)
+    if workpath is None:
+        typer.echo("❌ Error: no PyInstaller analysis found. Run 'visionit build onedir' first.")
+        raise typer.Exit(1)
+
+    report = analyze_bundle(path, config, workpath)
+
+    if json_output:
+        typer.echo(json.dumps(report, indent=2))
+        return
+
+    typer.echo(f"📊 Bundle analysis: {report['app_name']} ({format_size(report['total_size'])})\n")
+    for package in report["packages"][:top]:
+        size = format_size(package["size"])
+        typer.echo(f"  {size:>10}  {package['name']:25} {package['files']} files")
+        if len(package["chain"]) > 1:
+            typer.echo(f"              ↳ {' → '.join(package['chain'])}")
+
+    if report["suggested_excludes"]:
+        typer.echo("\n💡 Suggested exclude_modules for build.json (review before adding):")
+        for name in report["suggested_excludes"]:
+            typer.echo(f"   - {name}")
+
+
+@app.command("clean")
+def build_clean(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    keep_cache: bool = typer.Option(
+        False, "--keep-cache", "-k", help="Keep build/ and __pycache__ for the next build"
+    ),
+    cache_max_mb: Optional[int] = typer.Option(
+        None,
+        "--cache-max-mb",
+        help=f"Shrink the shared PyInstaller cache to this size (default {MAX_CACHE_MB})",
+    ),
+):
+    """Clean build artifacts (build, dist folders)."""
+    path = Path(project_path)
+
+    typer.echo("🧹 Cleaning build artifacts...\n")
+
+    # build/ holds PyInstaller's work files, which a rebuild reuses when unchanged
+    folders_to_remove = ["dist"] if keep_cache else ["build", "dist", "__pycache__"]
+    for folder in folders_to_remove:
+        folder_path = path / folder
+        if folder_path.exists():
+            shutil.rmtree(folder_path)
+            typer.echo(f"  ✓ Removed: {folder}/")
+
+    # Remove spec files
+    for spec_file in path.glob("*.spec"):
+        spec_file.unlink()
+        typer.echo(f"  ✓ Removed: {spec_file.name}")
+
+    # The shared cache is never wiped, only kept under its size cap
+    max_bytes = max_cache_bytes(cache_max_mb)
+    for entry in evict(max_bytes):
+        typer.echo(f"  ✓ Evicted cache entry {entry['path'].name} ({format_size(entry['size'])})")
+    entries = list_entries()
+    size = sum(entry["size"] for entry in entries)
+    typer.echo(
+        f"\n♻️  Shared PyInstaller cache: {len(entries)} entries, {format_size(size)} "
+        f"(cap {format_size(max_bytes)}) in {cache_dir()}"
+    )
+
+    typer.echo("\n✅ Clean completed!")
+
+
+@app.command("deps")
+def build_deps(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+):
+    """Install build dependencies (PyInstaller)."""
+    typer.echo("📦 Installing build dependencies...\n")
+
+    cmd = ["pip", "install", "pyinstaller>=6.0.0"]
+    try:
+        result = run_streamed(
+            cmd,
+            log_path(Path(project_path), "build-deps"),
+            phases=PIP_PHASES,
+            on_phase=lambda phase: typer.echo(f"   ⏳ {phase}..."),
+        )
+    except FileNotFoundError as e:
+        typer.echo(f"❌ Error: {e}")
+        raise typer.Exit(1)
+
+    if result["returncode"] != 0:
+        typer.echo("❌ Error installing dependencies:")
+        typer.echo("\n".join(result["tail"]))
+        typer.echo(f"   Full log: {result['log']}")
+        raise typer.Exit(1)
+    typer.echo("✅ Build dependencies installed!")
+    typer.echo("   - PyInstaller")
+    typer.echo(f"📄 Log: {result['log']}")
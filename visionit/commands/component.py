@@ -0,0 +1,231 @@
+"""VisionIT `component` commands - HTML component templates."""
+
+from pathlib import Path
+
+import typer
+
+app = typer.Typer(help="Component generation commands", add_completion=False)
+
+
+# Component templates
+COMPONENT_TEMPLATES = {
+    "navbar": """<!-- Navigation Bar -->
+<nav class="bg-white shadow-lg">
+    <div class="container mx-auto px-4">
+        <div class="flex justify-between items-center py-4">
+            <a href="/" class="text-xl font-bold text-gray-800">{{ app_name }}</a>
+            <div class="hidden md:flex space-x-6">
+                {% for item in nav_items %}
+                <a href="{{ item.url }}" class="text-gray-600 hover:text-blue-600">{{ item.label }}</a>
+                {% endfor %}
+            </div>
+        </div>
+    </div>
+</nav>
+""",
+    "footer": """<!-- Footer -->
+<footer class="bg-gray-800 text-white py-8 mt-16">
+    <div class="container mx-auto px-4 text-center">
+        <p>&copy; {{ year }} {{ copyright_owner }}. Tous droits réservés.</p>
+    </div>
+</footer>
+""",
+    "card": """<!-- Card Component -->
+<div class="bg-white rounded-lg shadow-md p-6 {{ card_class }}">
+    <h3 class="text-xl font-semibold text-gray-800 mb-2">{{ card_title }}</h3>
+    <p class="text-gray-600 mb-4">{{ card_description }}</p>
+    <a href="{{ card_link }}" class="text-blue-600 hover:text-blue-800">En savoir plus →</a>
+</div>
+""",
+    "button": """<!-- Button Component -->
+<button class="px-4 py-2 bg-blue-600 text-white rounded-lg hover:bg-blue-700 transition-colors">
+    {{ button_text }}
+</button>
+""",
+    "input": """<!-- Input Component -->
+<div class="mb-4">
+    <label for="{{ input_id }}" class="block text-sm font-medium text-gray-700 mb-2">{{ label }}</label>
+    <input type="{{ input_type|default('text') }}" 
+           id="{{ input_id }}" 
+           name="{{ input_name }}"
+           class="w-full px-4 py-2 border border-gray-300 rounded-lg focus:ring-2 focus:ring-blue-500">
+</div>
+""",
+    "alert": """<!-- Alert Component -->
+<div class="border-l-4 rounded-md p-4 bg-{{ alert_type }}-50 border-{{ alert_type }}-200 text-{{ alert_type }}-800">
+    <p class="font-medium">{{ alert_title }}</p>
+    <p class="text-sm">{{ message }}</p>
+</div>
+""",
+    "modal": """<!-- Modal Component -->
+<div id="{{ modal_id }}" class="hidden fixed inset-0 z-50 overflow-y-auto">
+    <div class="flex items-center justify-center min-h-screen px-4">
+        <div class="fixed inset-0 bg-gray-900 bg-opacity-75"></div>
+        <div class="bg-white rounded-lg shadow-xl p-6 z-10 max-w-md w-full">
+            <h3 class="text-lg font-medium mb-4">{{ modal_title }}</h3>
+            <p class="text-gray-600 mb-4">{{ modal_content }}</p>
+            <div class="flex justify-end space-x-2">
+                <button onclick="document.getElementById('{{ modal_id }}').classList.add('hidden')"
+                        class="px-4 py-2 text-gray-600 hover:text-gray-800">Fermer</button>
+                <button class="px-4 py-2 bg-blue-600 text-white rounded-lg">{{ modal_confirm }}</button>
+            </div>
+        </div>
+    </div>
+</div>
+""",
+    "hero": """<!-- Hero Section -->
+<section class="bg-gradient-to-r from-blue-600 to-purple-600 text-white py-20">
+    <div class="container mx-auto px-4 text-center">
+        <h1 class="text-5xl font-bold mb-4">{{ hero_title }}</h1>
+        <p class="text-xl mb-8">{{ hero_subtitle }}</p>
+        <a href="{{ hero_cta_link }}" class="inline-block px-8 py-3 bg-white text-blue-600 rounded-lg font-semibold hover:bg-gray-100">
+            {{ hero_cta_text }}
+        </a>
+    </div>
+</section>
+""",
+    "feature": """<!-- Feature Item -->
+<div class="text-center p-6">
+    <div class="w-16 h-16 mx-auto mb-4 bg-blue-100 rounded-full flex items-center justify-center">
+        <svg class="w-8 h-8 text-blue-600" fill="none" stroke="currentColor" viewBox="0 0 24 24">
+            {{ feature_icon }}
+        </svg>
+    </div>
+    <h3 class="text-xl font-semibold mb-2">{{ feature_title }}</h3>
+    <p class="text-gray-600">{{ feature_description }}</p>
+</div>
+""",
+    "testimonial": """<!-- Testimonial -->
+<div class="bg-gray-50 rounded-lg p-6">
+    <p class="text-gray-700 italic mb-4">"{{ testimonial_text }}"</p>
+    <div class="flex items-center">
+        <img src="{{ author_avatar }}" alt="{{ author_name }}" class="w-12 h-12 rounded-full mr-4">
+        <div>
+            <p class="font-semibold">{{ author_name }}</p>
+            <p class="text-sm text-gray-500">{{ author_title }}</p>
+        </div>
+    </div>
+</div>
+""",
+}
+
+
+@app.command("list")
+def component_list():
+    """List available component templates."""
+    typer.echo("📦 Available Component Templates:\n")
+
+    for name, description in [
+        ("navbar", "Navigation bar with responsive menu"),
+        ("footer", "Footer with links and copyright"),
+        ("card", "Content card with image and link"),
+        ("button", "Styled button with variants"),
+        ("input", "Form input with label and validation"),
+        ("alert", "Alert/notification message"),
+        ("modal", "Modal dialog/popup"),
+        ("hero", "Hero section for landing pages"),
+        ("feature", "Feature item for product sections"),
+        ("testimonial", "Customer testimonial card"),
+    ]:
+        typer.echo(f"  • {name:15} - {description}")
+
+    typer.echo("\n💡 Usage: visionit component create <name> [output_path]")
+
+
+@app.command("create")
+def component_create(
+    component_name: str = typer.Argument(..., help="Name of the component to create"),
+    output_path: str = typer.Argument("templates/components", help="Output path for the component"),
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+):
+    """Create a new HTML component from template."""
+    path = Path(project_path)
+    output_dir = path / output_path
+
+    # Check if component template exists
+    if component_name not in COMPONENT_TEMPLATES:
+        typer.echo(f"❌ Component '{component_name}' not found.")
+        typer.echo(f"   Available components: {', '.join(COMPONENT_TEMPLATES.keys())}")
+        raise typer.Exit(1)
+
+    # Create output directory if it doesn't exist
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Write component file
+    component_file = output_dir / f"{component_name}.html"
+    template_content = COMPONENT_TEMPLATES[component_name]
+
+    with open(component_file, "w", encoding="utf-8") as f:
+        f.write(template_content)
+
+    typer.echo(f"✅ Component '{component_name}' created: {component_file}")
+
+
+@app.command("new")
+def component_new(
+    component_name: str = typer.Argument(..., help="Name of the new custom component"),
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+):
+    """Create a new custom component from scratch."""
+    path = Path(project_path)
+    output_dir = path / "templates" / "components"
+
+    # Create output directory if it doesn't exist
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Create component file
+    component_file = output_dir / f"{component_name}.html"
+
+    template_content = f"""<!-- {component_name} Component -->
+<!-- Created with VisionIT Framework -->
+
+<div class="{{{{ {component_name}_class|default('') }}}}">
+    <h3 class="{{{{ {component_name}_title_class|default('text-xl font-semibold') }}}}"">
+        {{{{ {component_name}_title }}}}
+    </h3>
+    <p class="{{{{ {component_name}_content_class|default('text-gray-600') }}}}"">
+        {{{{ {component_name}_content }}}}
+    </p>
+</div>
+
+<!-- Usage example:
+{{% include 'components/{component_name}.html' with {{
+    {component_name}_title: 'My Component',
+    {component_name}_content: 'Component content here'
+}} %}}
+-->
+"""
+
+    with open(component_file, "w", encoding="utf-8") as f:
+        f.write(template_content)
+
+    typer.echo(f"✅ Custom component '{component_name}' created: {component_file}")
+    typer.echo(f"\n📝 Edit the component at: {component_file}")
+
+
+@app.command("install")
+def component_install(
+    component_name: str = typer.Argument(..., help="Name of the component to install"),
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+):
+    """Install a component from the VisionIT library to your project."""
+    path = Path(project_path)
+    output_dir = path / "templates" / "components"
+
+    # Create output directory if it doesn't exist
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Check if component template exists
+    if component_name not in COMPONENT_TEMPLATES:
+        typer.echo(f"❌ Component '{component_name}' not found.")
+        typer.echo(f"   Available: {', '.join(COMPONENT_TEMPLATES.keys())}")
+        raise typer.Exit(1)
+
+    # Copy component from framework templates
+    component_file = output_dir / f"{component_name}.html"
+    template_content = COMPONENT_TEMPLATES[component_name]
+
+    with open(component_file, "w", encoding="utf-8") as f:
+        f.write(template_content)
+
+    typer.echo(f"✅ Component '{component_name}' installed to: {component_file}")
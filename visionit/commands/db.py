@@ -0,0 +1,589 @@
+"""VisionIT `db` commands - Prisma database management."""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+from visionit.db_analysis import (
+    apply_proposals,
+    check_query_plans,
+    default_queries,
+    find_missing_indexes,
+    find_query_file,
+    load_queries,
+    propose_indexes,
+    schema_diff,
+)
+from visionit.db_export import (
+    CHUNK_ROWS,
+    FORMATS,
+    PAGE_SIZE,
+    connect_readonly,
+    export_target,
+    resolve_targets,
+    split_filters,
+)
+from visionit.db_seed import BATCH_SIZE, seed_file, seed_files
+from visionit.prisma_cache import (
+    database_file,
+    generate_fingerprint,
+    is_up_to_date,
+    push_fingerprint,
+    record,
+)
+from visionit.prisma_schema import SchemaError, format_attribute, get_model, load_schema
+from visionit.process_runner import log_path, run_streamed
+from visionit.sqlite_tuning import (
+    PROFILES,
+    TUNING_FILE,
+    apply_profile,
+    connection_url,
+    current_profile,
+    read_settings,
+    set_datasource_url,
+    tuning_module,
+)
+
+app = typer.Typer(help="Database management commands", add_completion=False)
+
+
+def find_schema(path: Path) -> Path:
+    """Return db/schema.prisma, exiting with an error if it is missing."""
+    schema_path = path / "db" / "schema.prisma"
+    if not schema_path.exists():
+        typer.echo(f"❌ Error: schema.prisma not found at {schema_path}")
+        raise typer.Exit(1)
+    return schema_path
+
+
+def run_prisma(args: list, path: Path, error: str, log_name: str) -> None:
+    """Run the Prisma CLI, streaming its output and exiting on failure."""
+    try:
+        result = run_streamed(
+            ["prisma"] + args,
+            log_path(path, log_name),
+            cwd=path,
+            on_line=lambda line: typer.echo(f"   {line}"),
+        )
+    except FileNotFoundError:
+        typer.echo("❌ Error: Prisma CLI not found. Install it with:")
+        typer.echo("   pip install prisma")
+        raise typer.Exit(1)
+
+    if result["returncode"] != 0:
+        typer.echo(f"❌ Error {error} (log: {result['log']})")
+        raise typer.Exit(1)
+
+
+def push_schema(path: Path, schema_path: Path, generate: bool) -> None:
+    """Run `prisma db push`, which also generates the client unless told not to."""
+    args = ["db", "push", "--schema", str(schema_path)]
+    if not generate:
+        args.append("--skip-generate")
+    run_prisma(args, path, "syncing database", "prisma-push")
+    record(path, "push", push_fingerprint(schema_path))
+    if generate:
+        record(path, "generate", generate_fingerprint(schema_path))
+
+
+def generate_client(path: Path, schema_path: Path) -> None:
+    """Run `prisma generate` and record it."""
+    run_prisma(
+        ["generate", "--schema", str(schema_path)],
+        path,
+        "generating Prisma client",
+        "prisma-generate",
+    )
+    record(path, "generate", generate_fingerprint(schema_path))
+
+
+@app.command("sync")
+def db_sync(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    generate: bool = typer.Option(
+        False, "--generate", "-g", help="Also regenerate a stale Prisma client"
+    ),
+    force: bool = typer.Option(False, "--force", "-f", help="Run Prisma even if nothing changed"),
+):
+    """Synchronize database with Prisma schema."""
+    path = Path(project_path)
+    schema_path = find_schema(path)
+
+    push_needed = force or not is_up_to_date(
+        path, "push", push_fingerprint(schema_path), schema_path
+    )
+    generate_needed = force or not is_up_to_date(
+        path, "generate", generate_fingerprint(schema_path), schema_path
+    )
+
+    if push_needed:
+        typer.echo("🔄 Syncing database with Prisma...\n")
+        # A single `db push` also generates the client when that is needed
+        push_schema(path, schema_path, generate_needed)
+        if generate_needed:
+            typer.echo("✅ Database synced and Prisma client generated!")
+        else:
+            typer.echo("✅ Database synced successfully!")
+    else:
+        typer.echo("⚡ Database is up to date (use --force to push again)")
+
+    if generate and generate_needed and not push_needed:
+        typer.echo("🔄 Generating Prisma client...\n")
+        generate_client(path, schema_path)
+        typer.echo("✅ Prisma client generated successfully!")
+    elif generate and not generate_needed:
+        typer.echo("⚡ Prisma client is up to date")
+
+
+@app.command("generate")
+def db_generate(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    force: bool = typer.Option(
+        False, "--force", "-f", help="Regenerate even if the schema is unchanged"
+    ),
+):
+    """Generate Prisma client."""
+    path = Path(project_path)
+    schema_path = find_schema(path)
+
+    fingerprint = generate_fingerprint(schema_path)
+    if not force and is_up_to_date(path, "generate", fingerprint, schema_path):
+        typer.echo("⚡ Prisma client is up to date (use --force to regenerate)")
+        return
+
+    typer.echo("🔄 Generating Prisma client...\n")
+    generate_client(path, schema_path)
+    typer.echo("✅ Prisma client generated successfully!")
+
+
+@app.command("inspect")
+def db_inspect(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    model_name: Optional[str] = typer.Option(None, "--model", "-m", help="Show a single model"),
+    json_output: bool = typer.Option(False, "--json", help="Print the parsed schema as JSON"),
+):
+    """Show the models, fields, indexes and relations of schema.prisma."""
+    path = Path(project_path)
+    schema_path = find_schema(path)
+
+    try:
+        schema = load_schema(path, schema_path)
+    except SchemaError as e:
+        typer.echo(f"❌ Error: invalid schema.prisma: {e}")
+        raise typer.Exit(1)
+
+    models = schema["models"]
+    if model_name:
+        model = get_model(schema, model_name)
+        if model is None:
+            typer.echo(f"❌ Error: model '{model_name}' not found in {schema_path}")
+            raise typer.Exit(1)
+        models = [model]
+
+    if json_output:
+        typer.echo(json.dumps(models[0] if model_name else schema, indent=2))
+        return
+
+    providers = ", ".join(str(ds.get("provider")) for ds in schema["datasources"])
+    providers = providers or "no datasource"
+    typer.echo(
+        f"🗄️  {schema_path} ({providers}, {len(schema['models'])} models, "
+        f"{len(schema['enums'])} enums)"
+    )
+
+    for model in models:
+        typer.echo(f"\n📋 {model['name']}")
+        width = max((len(field["name"]) for field in model["fields"]), default=0)
+        for field in model["fields"]:
+            type_name = (
+                field["type"] + ("[]" if field["list"] else "") + ("?" if field["optional"] else "")
+            )
+            attributes = " ".join(format_attribute(a) for a in field["attributes"])
+            typer.echo(f"   {field['name']:{width}}  {type_name:12} {attributes}".rstrip())
+        for field in model["fields"]:
+            relation = field["relation"]
+            if relation and relation["fields"]:
+                typer.echo(
+                    f"   🔗 {', '.join(relation['fields'])} → "
+                    f"{relation['model']}.{', '.join(relation['references'])}"
+                )
+        for unique in model["unique"]:
+            typer.echo(f"   🔑 unique({', '.join(unique)})")
+        for index in model["indexes"]:
+            typer.echo(f"   📇 index({', '.join(index['fields'])})")
+
+    if not model_name:
+        for enum in schema["enums"]:
+            typer.echo(f"\n🏷️  enum {enum['name']}: {', '.join(enum['values'])}")
+
+
+@app.command("analyze")
+def db_analyze(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    queries_path: Optional[str] = typer.Option(
+        None,
+        "--queries",
+        "-q",
+        help="Query set (.sql or .json, default: db/queries.json or db/queries.sql)",
+    ),
+    database_path: Optional[str] = typer.Option(
+        None, "--database", "-d", help="SQLite database (default: the datasource of schema.prisma)"
+    ),
+    apply: bool = typer.Option(
+        False, "--apply", help="Write the proposed @@index lines to schema.prisma"
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Print the analysis as JSON"),
+):
+    """Find missing indexes and full-table scans, and propose @@index edits."""
+    path = Path(project_path)
+    schema_path = find_schema(path)
+
+    try:
+        schema = load_schema(path, schema_path)
+    except SchemaError as e:
+        typer.echo(f"❌ Error: invalid schema.prisma: {e}")
+        raise typer.Exit(1)
+
+    query_file = Path(queries_path) if queries_path else find_query_file(schema_path)
+    try:
+        queries = load_queries(query_file) if query_file else default_queries(schema)
+    except (OSError, ValueError) as e:
+        typer.echo(f"❌ Error: cannot read query set {query_file}: {e}")
+        raise typer.Exit(1)
+
+    findings = find_missing_indexes(schema, queries)
+
+    database = Path(database_path) if database_path else database_file(schema_path)
+    plans = []
+    if database and database.exists():
+        try:
+            plans = check_query_plans(schema, database, queries)
+        except ValueError as e:
+            typer.echo(f"❌ Error: {e}")
+            raise typer.Exit(1)
+
+    proposals = propose_indexes(schema, findings, plans)
+    original = schema_path.read_text(encoding="utf-8")
+    updated = apply_proposals(original, proposals)
+
+    if json_output:
+        typer.echo(
+            json.dumps(
+                {
+                    "missing_indexes": findings,
+                    "query_plans": plans,
+                    "proposed_indexes": proposals,
+                },
+                indent=2,
+            )
+        )
+    else:
+        typer.echo(f"🔍 Missing indexes ({len(findings)})")
+        for finding in findings:
+            fields = ", ".join(finding["fields"])
+            typer.echo(f"   ⚠️  {finding['model']}({fields}): {finding['reason']}")
+
+        if database is None:
+            typer.echo("\n⚠️  Query plans skipped: the datasource is not SQLite")
+        elif not database.exists():
+            typer.echo(f"\n⚠️  Query plans skipped: {database} not found (run 'visionit db sync')")
+        else:
+            scans = [plan for plan in plans if plan["full_scan"] or plan["error"]]
+            typer.echo(f"\n📊 Query plans ({len(plans)} queries, {len(scans)} full-table scans)")
+            for plan in plans:
+                if plan["error"]:
+                    mark = "❌"
+                elif plan["full_scan"]:
+                    mark = "🐢"
+                else:
+                    mark = "✅"
+                typer.echo(f"   {mark} {' '.join(plan['sql'].split())}")
+                for step in plan["plan"]:
+                    typer.echo(f"        {step}")
+                if plan["temp_sort"]:
+                    typer.echo(
+                        "        ⚠️  sorted in a temporary B-tree: no index matches ORDER BY"
+                    )
+                if plan["error"]:
+                    typer.echo(f"        {plan['error']}")
+
+        if not proposals:
+            typer.echo("\n✅ No index to add")
+        else:
+            typer.echo("\n💡 Proposed schema edits:\n")
+            typer.echo(schema_diff(schema_path, original, updated))
+
+    if apply and proposals:
+        schema_path.write_text(updated, encoding="utf-8")
+        added = sum(len(lines) for lines in proposals.values())
+        typer.echo(
+            f"✅ {added} index(es) added to {schema_path}"
+            " - run 'visionit db sync' to apply them",
+            err=json_output,
+        )
+
+
+@app.command("tune")
+def db_tune(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    profile: Optional[str] = typer.Option(
+        None,
+        "--profile",
+        help="Switch to a profile: default or performance (WAL, busy timeout)",
+    ),
+):
+    """Show or change the SQLite performance profile of the project."""
+    path = Path(project_path)
+    schema_path = find_schema(path)
+    database = database_file(schema_path)
+
+    if database is None:
+        typer.echo('❌ Error: db tune only applies to a SQLite datasource (url = "file:...")')
+        raise typer.Exit(1)
+
+    if profile is not None:
+        if profile not in PROFILES:
+            typer.echo(f"❌ Error: unknown profile '{profile}' (use {', '.join(PROFILES)})")
+            raise typer.Exit(1)
+
+        text = schema_path.read_text(encoding="utf-8")
+        url = load_schema(path, schema_path)["datasources"][0].get("url")
+        database_path = url[len("file:") :].split("?", 1)[0] if isinstance(url, str) else ""
+        try:
+            updated = set_datasource_url(text, connection_url(profile, database_path))
+        except ValueError as e:
+            typer.echo(f"❌ Error: {e}")
+            raise typer.Exit(1)
+        schema_path.write_text(updated, encoding="utf-8")
+
+        tuning_file = path / TUNING_FILE
+        (tuning_file.parent / "__init__.py").touch()
+        tuning_file.write_text(tuning_module(profile), encoding="utf-8")
+        if database.exists():
+            apply_profile(database, profile)
+
+        typer.echo(f"✅ SQLite profile '{profile}' written to {schema_path} and {tuning_file}")
+        main_file = path / "main.py"
+        main_code = main_file.read_text(encoding="utf-8") if main_file.exists() else ""
+        if main_file.exists() and "db.tuning" not in main_code and "db.client" not in main_code:
+            typer.echo("⚠️  main.py does not load the profile yet. Add:")
+            typer.echo("   from db.tuning import tune_database")
+            typer.echo("   app.on_startup(tune_database)")
+        typer.echo("   Run 'visionit db sync --generate' so the Prisma client uses the new URL")
+
+    current = current_profile(path)
+    typer.echo(f"\n🗄️  {database} (profile: {current or 'unknown'})")
+    for name, value in PROFILES.get(current, {}).items():
+        typer.echo(f"   {name:13} {value}")
+    if database.exists():
+        # Only the journal mode is stored in the file; the busy timeout is in the URL
+        journal_mode = read_settings(database, ["journal_mode"])["journal_mode"]
+        typer.echo(f"   journal_mode in the file: {journal_mode}")
+    else:
+        typer.echo("   Database not created yet (run 'visionit db sync')")
+
+
+@app.command("seed")
+def db_seed(
+    files: Optional[List[Path]] = typer.Argument(
+        None, help="CSV or JSONL files (default: db/seed/*)"
+    ),
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    model_name: Optional[str] = typer.Option(
+        None, "--model", "-m", help="Target model (default: from the file name, e.g. User.csv)"
+    ),
+    batch_size: int = typer.Option(
+        BATCH_SIZE, "--batch-size", "-b", min=1, help="Rows per transaction"
+    ),
+    database_path: Optional[str] = typer.Option(
+        None, "--database", "-d", help="SQLite database (default: the datasource of schema.prisma)"
+    ),
+    skip_invalid: bool = typer.Option(
+        False, "--skip-invalid", help="Skip rows that do not match the schema"
+    ),
+):
+    """Stream CSV or JSONL rows into the database, in batched transactions."""
+    path = Path(project_path)
+    schema_path = find_schema(path)
+
+    try:
+        schema = load_schema(path, schema_path)
+    except SchemaError as e:
+        typer.echo(f"❌ Error: invalid schema.prisma: {e}")
+        raise typer.Exit(1)
+
+    if model_name and get_model(schema, model_name) is None:
+        typer.echo(f"❌ Error: model '{model_name}' not found in {schema_path}")
+        raise typer.Exit(1)
+
+    database = Path(database_path) if database_path else database_file(schema_path)
+    if database is None:
+        typer.echo('❌ Error: db seed only supports a SQLite datasource (url = "file:...")')
+        raise typer.Exit(1)
+    if not database.exists():
+        typer.echo(f"❌ Error: {database} not found. Run 'visionit db sync' first")
+        raise typer.Exit(1)
+
+    files = files or seed_files(path)
+    if not files:
+        typer.echo("❌ Error: no seed file given and db/seed/ has no .csv or .jsonl file")
+        raise typer.Exit(1)
+
+    grand_total, start = 0, time.perf_counter()
+    for seed_path in files:
+        errors = {"count": 0, "messages": []} if skip_invalid else None
+        file_start = time.perf_counter()
+        inserted = 0
+
+        def progress(total):
+            nonlocal inserted
+            inserted = total
+            rate = total / max(time.perf_counter() - file_start, 1e-9)
+            typer.echo(f"\r   {total:,} rows ({rate:,.0f} rows/s)", nl=False)
+
+        typer.echo(f"🌱 Seeding {seed_path}")
+        try:
+            result = seed_file(
+                schema, database, seed_path, model_name, batch_size, errors, progress
+            )
+        except (OSError, ValueError, sqlite3.Error) as e:
+            if inserted:
+                typer.echo("")
+            kept = f" ({inserted:,} rows of earlier batches kept)" if inserted else ""
+            # SeedError is a ValueError that already names the line
+            reason = "database rejected a batch: " if isinstance(e, sqlite3.Error) else ""
+            typer.echo(f"❌ Error: {seed_path.name}: {reason}{e}{kept}")
+            raise typer.Exit(1)
+        if result["rows"]:
+            typer.echo("")
+
+        rate = result["rows"] / result["seconds"] if result["seconds"] else 0.0
+        typer.echo(
+            f"✅ {result['model']}: {result['rows']:,} rows in {result['seconds']:.2f}s "
+            f"({rate:,.0f} rows/s)"
+        )
+        if errors and errors["count"]:
+            typer.echo(f"⚠️  {errors['count']:,} invalid rows skipped:")
+            for message in errors["messages"][:10]:
+                typer.echo(f"   {message}")
+        grand_total += result["rows"]
+
+    if len(files) > 1:
+        elapsed = time.perf_counter() - start
+        typer.echo(f"\n✅ {grand_total:,} rows from {len(files)} files in {elapsed:.2f}s")
+
+
+@app.command("export")
+def db_export(
+    names: Optional[List[str]] = typer.Argument(
+        None, help="Models or tables (default: every model)"
+    ),
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    output: str = typer.Option(
+        "export", "--output", "-o", help="Output directory ('-' for stdout)"
+    ),
+    file_format: str = typer.Option("jsonl", "--format", "-f", help="jsonl, csv or csv-chunks"),
+    compress: bool = typer.Option(False, "--gzip", "-z", help="Compress the files with gzip"),
+    filters: Optional[List[str]] = typer.Option(
+        None,
+        "--where",
+        "-w",
+        help="SQL condition, or 'Model: condition' for one model (repeatable)",
+    ),
+    page_size: int = typer.Option(PAGE_SIZE, "--page-size", min=1, help="Rows read per query"),
+    chunk_rows: int = typer.Option(
+        CHUNK_ROWS, "--chunk-rows", min=1, help="Rows per file with csv-chunks"
+    ),
+    database_path: Optional[str] = typer.Option(
+        None, "--database", "-d", help="SQLite database (default: the datasource of schema.prisma)"
+    ),
+):
+    """Stream models or tables to JSONL or CSV files in constant memory."""
+    path = Path(project_path)
+    err = output == "-"
+    if file_format not in FORMATS:
+        typer.echo(f"❌ Error: unknown format '{file_format}' (use {', '.join(FORMATS)})", err=True)
+        raise typer.Exit(1)
+
+    # A customer database can be exported without its project
+    schema = {"models": [], "enums": []}
+    schema_path = path / "db" / "schema.prisma"
+    if schema_path.exists() or not database_path:
+        schema_path = find_schema(path)
+        try:
+            schema = load_schema(path, schema_path)
+        except SchemaError as e:
+            typer.echo(f"❌ Error: invalid schema.prisma: {e}", err=True)
+            raise typer.Exit(1)
+
+    database = Path(database_path) if database_path else database_file(schema_path)
+    if database is None or not database.exists():
+        typer.echo(
+            f"❌ Error: SQLite database not found ({database or 'not a SQLite datasource'})",
+            err=True,
+        )
+        raise typer.Exit(1)
+
+    connection = connect_readonly(database)
+    try:
+        try:
+            targets = resolve_targets(schema, connection, names)
+        except ValueError as e:
+            typer.echo(f"❌ Error: {e}", err=True)
+            raise typer.Exit(1)
+        if err and len(targets) != 1:
+            typer.echo("❌ Error: --output - needs exactly one model or table", err=True)
+            raise typer.Exit(1)
+        where = split_filters(filters, targets)
+
+        total, start = 0, time.perf_counter()
+        for target in targets:
+            target_start = time.perf_counter()
+            shown = False
+
+            def progress(count):
+                nonlocal shown
+                shown = True
+                rate = count / max(time.perf_counter() - target_start, 1e-9)
+                typer.echo(f"\r   {count:,} rows ({rate:,.0f} rows/s)", nl=False, err=err)
+
+            typer.echo(f"📤 Exporting {target['name']}", err=err)
+            try:
+                result = export_target(
+                    connection,
+                    target,
+                    Path(output),
+                    file_format,
+                    compress,
+                    where[target["name"]],
+                    page_size,
+                    chunk_rows,
+                    progress,
+                )
+            except (OSError, sqlite3.Error) as e:
+                typer.echo(f"\n❌ Error: {target['name']}: {e}", err=True)
+                raise typer.Exit(1)
+            if shown:
+                typer.echo("", err=err)
+            rate = result["rows"] / result["seconds"] if result["seconds"] else 0.0
+            destination = (
+                result["files"][0]
+                if len(result["files"]) == 1
+                else f"{len(result['files'])} files in {Path(result['files'][0]).parent}"
+            )
+            typer.echo(
+                f"✅ {target['name']}: {result['rows']:,} rows → {destination} "
+                f"({rate:,.0f} rows/s)",
+                err=err,
+            )
+            total += result["rows"]
+    finally:
+        connection.close()
+
+    if len(targets) > 1:
+        elapsed = time.perf_counter() - start
+        typer.echo(f"\n✅ {total:,} rows from {len(targets)} models in {elapsed:.2f}s", err=err)
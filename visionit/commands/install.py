@@ -0,0 +1,194 @@
+"""VisionIT `install`, `lock` and `wheelhouse` commands - project dependencies."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from visionit.dependency_lock import (
+    LOCK_FILE,
+    PACKAGE_FILE,
+    WHEELHOUSE_DIR,
+    environment_name,
+    format_lock,
+    install_command,
+    installed_versions,
+    load_report,
+    lock_entries,
+    read_lock,
+    requirements_hash,
+    resolve_command,
+    unsatisfied,
+    wheel_command,
+    wheelhouse_missing,
+)
+from visionit.process_runner import PIP_PHASES, log_path, phase_summary, run_streamed
+
+app = typer.Typer(add_completion=False)
+lock_app = typer.Typer(add_completion=False)
+wheelhouse_app = typer.Typer(add_completion=False)
+
+
+def find_package_file(path: Path) -> Path:
+    """Return package.txt, exiting with an error if it is missing."""
+    package_file = path / PACKAGE_FILE
+    if not package_file.exists():
+        typer.echo(f"❌ Error: package.txt not found at {package_file}")
+        raise typer.Exit(1)
+    return package_file
+
+
+def current_lock(path: Path, package_file: Path) -> Optional[dict]:
+    """Return the parsed package.lock, or None if there is none or it is stale."""
+    lock_file = path / LOCK_FILE
+    if not lock_file.exists():
+        return None
+    lock = read_lock(lock_file)
+    if lock["source"] != requirements_hash(package_file):
+        typer.echo(
+            "⚠️  package.lock is older than package.txt and is ignored. Run 'visionit lock'."
+        )
+        return None
+    return lock
+
+
+def run_pip(cmd: list, path: Path, log_name: str, error: str) -> dict:
+    """Run pip with streamed progress, exiting with the end of its log on failure."""
+    try:
+        result = run_streamed(
+            cmd,
+            log_path(path, log_name),
+            phases=PIP_PHASES,
+            on_phase=lambda phase: typer.echo(f"   ⏳ {phase}..."),
+        )
+    except FileNotFoundError as e:
+        typer.echo(f"❌ Error: {e}")
+        raise typer.Exit(1)
+
+    if result["returncode"] != 0:
+        typer.echo(f"❌ Error {error}:")
+        typer.echo("\n".join(result["tail"]))
+        typer.echo(f"   Full log: {result['log']}")
+        raise typer.Exit(1)
+    return result
+
+
+@app.command("install")
+def install_deps(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    upgrade: bool = typer.Option(False, "--upgrade/-U", help="Upgrade dependencies"),
+    offline: bool = typer.Option(False, "--offline", help="Install only from the wheelhouse"),
+    wheelhouse_dir: str = typer.Option(
+        WHEELHOUSE_DIR, "--wheelhouse", "-w", help="Wheelhouse directory, relative to the project"
+    ),
+    force: bool = typer.Option(
+        False, "--force", "-f", help="Run pip even if the lock is satisfied"
+    ),
+):
+    """Install project dependencies from package.txt."""
+    path = Path(project_path)
+    package_file = find_package_file(path)
+    # --upgrade asks for newer versions than the pins
+    lock = None if upgrade else current_lock(path, package_file)
+
+    # The lock is already installed: no pip, no index
+    if lock is not None and not force:
+        missing = unsatisfied(lock["packages"], installed_versions())
+        if not missing:
+            typer.echo(f"⚡ Dependencies are up to date ({len(lock['packages'])} locked packages).")
+            typer.echo("   Use --force to reinstall.")
+            return
+
+    wheelhouse = None
+    if offline:
+        wheelhouse = path / wheelhouse_dir
+        if not wheelhouse.is_dir():
+            typer.echo(f"❌ Error: wheelhouse not found at {wheelhouse}")
+            typer.echo("   Run 'visionit wheelhouse' where the package index is reachable.")
+            raise typer.Exit(1)
+        missing = wheelhouse_missing(lock["packages"], wheelhouse) if lock else []
+        if missing:
+            typer.echo(f"❌ Error: no wheel in {wheelhouse} for {', '.join(missing)}")
+            typer.echo("   Run 'visionit wheelhouse' again.")
+            raise typer.Exit(1)
+
+    source = LOCK_FILE if lock else PACKAGE_FILE
+    typer.echo(
+        f"📦 Installing dependencies from {source}" f"{' (offline)' if offline else ''}...\n"
+    )
+
+    cmd = install_command(lock, package_file, path / LOCK_FILE, wheelhouse)
+    if upgrade:
+        cmd.append("--upgrade")
+
+    result = run_pip(cmd, path, "install", "installing dependencies")
+    typer.echo(f"✅ Dependencies installed successfully in {result['seconds']:.1f}s!")
+    typer.echo(f"   {phase_summary(result)}")
+    typer.echo(f"📄 Log: {result['log']}")
+
+
+@lock_app.command("lock")
+def lock_deps(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+):
+    """Pin package.txt and its dependencies, with hashes, into package.lock."""
+    path = Path(project_path)
+    package_file = find_package_file(path)
+    report = path / ".visionit" / "pip-report.json"
+    report.parent.mkdir(parents=True, exist_ok=True)
+
+    typer.echo("🔒 Resolving package.txt...\n")
+    run_pip(resolve_command(package_file, report), path, "lock", "resolving dependencies")
+    try:
+        entries = lock_entries(load_report(report))
+    except ValueError as e:
+        typer.echo(f"❌ Error: {e}")
+        raise typer.Exit(1)
+    finally:
+        report.unlink(missing_ok=True)
+
+    lock_file = path / LOCK_FILE
+    lock_file.write_text(
+        format_lock(entries, requirements_hash(package_file), environment_name()), encoding="utf-8"
+    )
+    typer.echo(f"✅ Locked {len(entries)} packages in {lock_file}")
+    typer.echo(f"   Resolved for {environment_name()}: lock again on other platforms.")
+
+
+@wheelhouse_app.command("wheelhouse")
+def build_wheelhouse(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    output: str = typer.Option(
+        WHEELHOUSE_DIR, "--output", "-o", help="Wheelhouse directory, relative to the project"
+    ),
+):
+    """Download or build a wheel of every locked dependency, for offline installs."""
+    path = Path(project_path)
+    package_file = find_package_file(path)
+    lock = current_lock(path, package_file)
+    if lock is None:
+        typer.echo(
+            "⚠️  No package.lock: wheels follow package.txt. " "Run 'visionit lock' to pin them."
+        )
+
+    wheelhouse = path / output
+    wheelhouse.mkdir(parents=True, exist_ok=True)
+    requirements = path / LOCK_FILE if lock else package_file
+    typer.echo(f"🛞 Filling {wheelhouse} from {requirements.name}...\n")
+    result = run_pip(
+        wheel_command(requirements, wheelhouse, lock is not None),
+        path,
+        "wheelhouse",
+        "building the wheelhouse",
+    )
+
+    if lock is not None:
+        missing = wheelhouse_missing(lock["packages"], wheelhouse)
+        if missing:
+            typer.echo(f"⚠️  No wheel named after {', '.join(missing)}")
+    wheels = list(wheelhouse.glob("*.whl"))
+    size = sum(wheel.stat().st_size for wheel in wheels) / (1024 * 1024)
+    typer.echo(
+        f"✅ {len(wheels)} wheels ({size:.1f} MB) in {wheelhouse} " f"in {result['seconds']:.1f}s"
+    )
+    typer.echo("   Install them with: visionit install --offline")
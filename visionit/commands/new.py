@@ -0,0 +1,838 @@
+"""VisionIT `new` command - project scaffolding."""
+
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from visionit.scaffold import (
+    add_dir,
+    add_file,
+    add_to_zip,
+    new_plan,
+    write_plan,
+    write_zip,
+    zip_output,
+)
+from visionit.sqlite_tuning import DEFAULT_PROFILE, PROFILES, connection_url, tuning_module
+
+app = typer.Typer(add_completion=False)
+
+# Answers used by --no-interactive and for fields missing from a --batch manifest
+DEFAULT_ANSWERS = {
+    "author": "Vision IT",
+    "version": "1.0.0",
+    "orm": "Prisma",
+    "db_type": "SQLite",
+    "db_profile": DEFAULT_PROFILE,
+}
+
+
+def get_template_path() -> Path:
+    """Get the path to the templates directory."""
+    return Path(__file__).parent.parent / "templates"
+
+
+def create_project_structure(plan: dict) -> None:
+    """Add the basic project folder structure."""
+    folders = ["db", "templates", "static/css", "static/js", "actions"]
+    for folder in folders:
+        add_dir(plan, folder)
+
+
+def generate_info_json(
+    plan: dict, project_name: str, author: str, version: str, orm: str, db_type: str
+) -> None:
+    """Generate info.json with project metadata."""
+    info = {
+        "project_name": project_name,
+        "author": author,
+        "version": version,
+        "orm": orm,
+        "database": db_type,
+    }
+    add_file(plan, "info.json", json.dumps(info, indent=4))
+
+
+def generate_package_txt(plan: dict) -> None:
+    """Generate package.txt with default dependencies."""
+    dependencies = [
+        "nicegui>=1.4.0",
+        "prisma>=0.11.0",
+        "pywebview>=4.4.0",  # Pour les fenêtres desktop natives
+        "uvicorn>=0.24.0",
+    ]
+    add_file(plan, "package.txt", "\n".join(dependencies) + "\n")
+
+
+def generate_build_config(plan: dict, project_name: str) -> None:
+    """Generate build configuration file for PyInstaller."""
+    config = {
+        "app_name": project_name,
+        "main_module": "main",
+        "icon": None,
+        "onefile": True,
+        "windowed": False,
+        "scan_imports": True,
+        "hidden_imports": [
+            "nicegui",
+            "nicegui.elements",
+            "nicegui.page",
+            "uvicorn",
+            "webview",
+        ],
+        "exclude_modules": [
+            "matplotlib",
+            "numpy",
+            "pandas",
+            "scipy",
+        ],
+        "add_data": [
+            ("templates", "templates"),
+            ("static", "static"),
+            ("db", "db"),
+        ],
+    }
+    add_file(plan, "build.json", json.dumps(config, indent=4))
+
+
+def generate_icon_placeholder(plan: dict) -> None:
+    """Add icon placeholder directory and instructions."""
+
+    # Create README for icons
+    readme_content = """# Icons Directory
+
+Place your app icons here for building executables.
+
+## Recommended Icon Sizes
+
+- `icon_16.png` - 16x16px (favicon small)
+- `icon_32.png` - 32x32px (favicon)
+- `icon_128.png` - 128x128px (macOS)
+- `icon_256.png` - 256x256px (macOS, Windows)
+- `icon_512.png` - 512x512px (high DPI)
+- `icon_1024.png` - 1024x1024px (app store)
+
+## For Windows (.ico)
+Create a multi-size .ico file containing:
+16x16, 32x32, 48x48, 256x256 pixels
+
+## For macOS (.icns)
+Use iconutil to create .icns from iconset:
+```bash
+mkdir icon.iconset
+# Copy icons as icon_16x16.png, icon_32x32.png, etc.
+iconutil -c icns icon.iconset
+```
+
+## Update build.json
+After adding your icon, update build.json:
+```json
+{
+  "icon": "static/icons/icon_256.png"
+}
+```
+"""
+    add_file(plan, "static/icons/README.md", readme_content, announce=False)
+    plan["messages"].append("static/icons/ (placeholder)")
+
+
+def generate_components(plan: dict) -> None:
+    """Copy component templates to the project."""
+    framework_components = get_template_path() / "components"
+
+    if framework_components.exists():
+        components = sorted(framework_components.glob("*.html"))
+        add_dir(plan, "templates/components", announce=False)
+
+        # Copy each component template
+        for component_file in components:
+            add_file(
+                plan,
+                f"templates/components/{component_file.name}",
+                component_file.read_text(encoding="utf-8"),
+                announce=False,
+            )
+
+        plan["messages"].append(f"templates/components/ ({len(components)} components)")
+
+
+def generate_prisma_schema(
+    plan: dict, db_type: str = "sqlite", db_profile: str = DEFAULT_PROFILE
+) -> None:
+    """Generate Prisma schema.prisma file."""
+    schema = f"""datasource db {{
+  provider = "sqlite"
+  url      = "{connection_url(db_profile)}"
+}}
+
+generator client {{
+  provider = "prisma-client-py"
+}}
+
+model User {{
+  id        Int      @id @default(autoincrement())
+  email     String   @unique
+  name      String?
+  createdAt DateTime @default(now())
+  updatedAt DateTime @updatedAt
+}}
+"""
+    add_file(plan, "db/schema.prisma", schema)
+
+
+def generate_db_tuning(plan: dict, db_profile: str = DEFAULT_PROFILE) -> None:
+    """Generate the db package with the SQLite profile startup hook."""
+    add_file(plan, "db/__init__.py", "", announce=False)
+    add_file(plan, "db/tuning.py", tuning_module(db_profile))
+
+
+def generate_db_client(plan: dict) -> None:
+    """Generate db/client.py with the process-wide Prisma client."""
+    client_code = '''"""Client Prisma partagé - generated by VisionIT.
+
+Un seul client pour tout le processus : il se connecte au démarrage, pendant
+que la fenêtre s'ouvre, et se déconnecte à l'arrêt. Les pages et les actions
+l'obtiennent avec `db = await get_db()` au lieu de créer leur propre client.
+"""
+
+import asyncio
+import functools
+import os
+from contextlib import asynccontextmanager
+
+from db.tuning import CONNECTION_LIMIT, tune_database
+
+# Requêtes Prisma simultanées : une par connexion du pool (connection_limit de
+# l'URL, sinon le pool par défaut de Prisma). Au-delà, elles attendent leur
+# tour ici plutôt que dans le pool, qui abandonne après 10 s (pool_timeout)
+MAX_CONCURRENT_QUERIES = CONNECTION_LIMIT or (os.cpu_count() or 1) * 2 + 1
+
+_client = None
+_connection = None
+_semaphore = None
+
+
+def get_client():
+    """Return the process-wide Prisma client, created on first use."""
+    global _client
+    if _client is None:
+        # Import différé : le client généré est lourd à importer
+        from prisma import Prisma
+        _client = Prisma()
+    return _client
+
+
+async def _connect():
+    client = get_client()
+    # Passe le fichier en WAL avant que Prisma ne l'ouvre (profil SQLite)
+    await asyncio.to_thread(tune_database)
+    if not client.is_connected():
+        await client.connect()
+    return client
+
+
+async def connect_db():
+    """Connect the shared client; concurrent callers share the same attempt."""
+    global _connection
+    if _connection is None or (
+        _connection.done() and (_connection.cancelled() or _connection.exception())
+    ):
+        _connection = asyncio.ensure_future(_connect())
+    # shield: a cancelled page must not cancel the connection of the others
+    return await asyncio.shield(_connection)
+
+
+async def disconnect_db():
+    """Disconnect the shared client at shutdown."""
+    global _connection
+    if _client is not None and _client.is_connected():
+        await _client.disconnect()
+    _connection = None
+
+
+async def get_db():
+    """Return the connected client, waiting for the startup connection if needed."""
+    return await connect_db()
+
+
+@asynccontextmanager
+async def db_slot():
+    """Wait for one of the MAX_CONCURRENT_QUERIES query slots."""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+    async with _semaphore:
+        yield await get_db()
+
+
+def limited(func):
+    """Run an async function in a query slot (decorator)."""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        async with db_slot():
+            return await func(*args, **kwargs)
+    return wrapper
+'''
+    add_file(plan, "db/client.py", client_code)
+
+
+def generate_main_py(plan: dict, project_name: str) -> None:
+    """Generate the main.py entry point with NiceGUI boilerplate."""
+    main_code = f'''"""{project_name} - Application Desktop.
+
+Generated by VisionIT Framework
+Application desktop avec fenêtre native
+"""
+
+from nicegui import ui, app
+from pathlib import Path
+import json
+import os
+import socket
+import sys
+
+# === CONFIGURATION DE LA FENÊTRE ===
+WINDOW_TITLE = "{project_name}"
+WINDOW_WIDTH = 1000
+WINDOW_HEIGHT = 800
+
+# Sans fenêtre ni navigateur (visionit bench, CI)
+HEADLESS = os.environ.get("VISIONIT_HEADLESS") == "1"
+
+
+# Port du serveur : VISIONIT_PORT ("8080" ou plage "8100-8199"), sinon un port libre
+def bind_server_socket() -> socket.socket:
+    """Bind the first free port of VISIONIT_PORT, or one chosen by the OS.
+
+    The socket stays open until uvicorn serves it, so no other instance can
+    take the port in between.
+    """
+    value = os.environ.get("VISIONIT_PORT", "")
+    first, _, last = value.partition("-")
+    candidates = range(int(first), int(last or first) + 1) if first else [0]
+    for port in candidates:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.bind(("127.0.0.1", port))
+        except OSError:
+            sock.close()
+            continue
+        return sock
+    raise RuntimeError(f"Aucun port libre : VISIONIT_PORT={{value}}")
+
+
+# Helper pour les ressources (compatible PyInstaller)
+def get_resource_path(relative_path: str) -> Path:
+    """Get absolute path to resource, works for dev and PyInstaller."""
+    if hasattr(sys, "_MEIPASS"):
+        base_path = Path(sys._MEIPASS)
+    else:
+        base_path = Path(__file__).parent
+    return base_path / relative_path
+
+
+# Base de données : un client Prisma partagé (db/client.py). La connexion se fait
+# en tâche de fond pendant l'ouverture de la fenêtre, et se ferme à l'arrêt.
+# Imports différés : l'application démarre même avant `prisma generate`
+async def connect_db():
+    """Connect the shared Prisma client, if it has been generated."""
+    from db.client import connect_db as connect
+    try:
+        await connect()
+    except (ImportError, RuntimeError) as e:
+        print(f"⚠️  Base de données indisponible ({{e}}) : lancez `visionit setup`")
+
+
+async def disconnect_db():
+    """Disconnect the shared Prisma client."""
+    from db.client import disconnect_db as disconnect
+    await disconnect()
+
+
+app.on_startup(connect_db)
+app.on_shutdown(disconnect_db)
+
+
+# Chargement des infos projet
+INFO_FILE = get_resource_path("info.json")
+with open(INFO_FILE, "r", encoding="utf-8") as f:
+    project_info = json.load(f)
+
+
+@ui.page("/")
+def index():
+    """Page d'accueil."""
+    
+    # Configuration des couleurs
+    ui.colors(primary='#2563eb', secondary='#64748b', accent='#8b5cf6')
+    
+    # En-tête
+    with ui.header().classes('w-full bg-blue-600 text-white'):
+        with ui.row().classes('w-full items-center px-4 py-2'):
+            ui.icon("home", size="28px")
+            ui.label("{project_name}").classes("text-xl font-bold ml-2")
+            ui.label(f"v{{project_info.get('version', '1.0.0')}}").classes("text-sm ml-4 opacity-90")
+    
+    # Contenu principal
+    with ui.column().classes('w-full p-6 gap-6'):
+        
+        # Message de bienvenue
+        with ui.card().classes('w-full p-6 bg-green-50 border-l-4 border-green-500'):
+            ui.label("✅ Application Démarrée avec Succès !").classes("text-2xl font-bold text-green-700")
+            ui.label("Votre application desktop VisionIT est fonctionnelle.").classes("text-gray-700 mt-2")
+        
+        # Informations du projet
+        with ui.card().classes('w-full p-6'):
+            ui.label("📋 Informations du Projet").classes("text-xl font-semibold mb-4")
+            
+            with ui.grid().classes('grid-cols-3 gap-4'):
+                with ui.card().classes('p-4 bg-blue-50'):
+                    ui.label("Application").classes("text-gray-600 text-sm")
+                    ui.label(project_info.get('project_name', 'N/A')).classes("text-lg font-bold text-blue-600")
+                
+                with ui.card().classes('p-4 bg-green-50'):
+                    ui.label("Auteur").classes("text-gray-600 text-sm")
+                    ui.label(project_info.get('author', 'N/A')).classes("text-lg font-bold text-green-600")
+                
+                with ui.card().classes('p-4 bg-purple-50'):
+                    ui.label("Version").classes("text-gray-600 text-sm")
+                    ui.label(project_info.get('version', '1.0.0')).classes("text-lg font-bold text-purple-600")
+        
+        # Section interactive
+        with ui.card().classes('w-full p-6'):
+            ui.label("🎮 Interactive").classes("text-xl font-semibold mb-4")
+            
+            with ui.row().classes('gap-4 flex-wrap'):
+                ui.button("👍 Test", color="primary") \\
+                  .on('click', lambda: ui.notify("✅ Ça fonctionne !", color="positive", position="top"))
+                
+                ui.button("✅ Succès", color="positive") \\
+                  .on('click', lambda: ui.notify("🎉 Réussi !", color="positive"))
+                
+                ui.button("⚠️ Warning", color="warning") \\
+                  .on('click', lambda: ui.notify("⚠️ Attention !", color="warning"))
+            
+            with ui.row().classes('w-full mt-4 gap-4'):
+                ui.input("Nom", placeholder="Votre nom").classes('flex-1')
+                ui.input("Email", placeholder="email@exemple.com").classes('flex-1')
+        
+        # Features
+        with ui.row().classes('w-full gap-4'):
+            with ui.card().classes('flex-1 p-6 text-center'):
+                ui.icon("desktop_windows", size="64px").classes("text-blue-600")
+                ui.label("Fenêtre Native").classes("text-lg font-semibold mt-2")
+            
+            with ui.card().classes('flex-1 p-6 text-center'):
+                ui.icon("palette", size="64px").classes("text-green-600")
+                ui.label("UI Moderne").classes("text-lg font-semibold mt-2")
+            
+            with ui.card().classes('flex-1 p-6 text-center'):
+                ui.icon("build", size="64px").classes("text-purple-600")
+                ui.label("Exécutable").classes("text-lg font-semibold mt-2")
+    
+    # Pied de page
+    with ui.footer().classes('w-full bg-gray-100'):
+        with ui.row().classes('w-full justify-between px-4 py-2'):
+            ui.label(f"© 2024 {{project_info.get('author', 'VisionIT')}}").classes('text-gray-600 text-sm')
+            ui.label("✅ VisionIT Framework").classes('text-green-600 font-bold text-sm')
+
+
+if __name__ == "__main__":
+    if os.environ.get("VISIONIT_BENCH"):
+        print("VISIONIT_BENCH imported", flush=True)
+
+    server_socket = bind_server_socket()
+    PORT = server_socket.getsockname()[1]
+    if sys.platform == "win32":
+        # uvicorn ne reprend pas un socket sous Windows : le port reste réservé
+        # jusqu'à la fin du démarrage, et uvicorn l'ouvre aussitôt après
+        app.on_startup(server_socket.close)
+        server_options = {{}}
+    else:
+        server_options = {{"fd": server_socket.fileno()}}
+    
+    print("\\n" + "="*60)
+    print(f"🚀 LANCEMENT DE {project_name}")
+    print("="*60)
+    print(f"📝 Titre: {{WINDOW_TITLE}}")
+    print(f"📐 Taille: {{WINDOW_WIDTH}}x{{WINDOW_HEIGHT}}")
+    print(f"🌐 Port: {{PORT}}")
+    print(f"🖥️  Mode: Fenêtre Desktop Native")
+    print("="*60)
+    print("\\n⏳ Ouverture de la fenêtre...\\n")
+    
+    # Configuration native
+    app.native.title = WINDOW_TITLE
+    app.native.width = WINDOW_WIDTH
+    app.native.height = WINDOW_HEIGHT
+    
+    # Lancement avec fenêtre native
+    ui.run(
+        title=WINDOW_TITLE,
+        host="127.0.0.1",
+        port=PORT,
+        reload=False,
+        show=not HEADLESS,
+        native=not HEADLESS,  # ⭐ FENÊTRE DESKTOP ⭐
+        # window_size active aussi le mode natif
+        window_size=None if HEADLESS else (WINDOW_WIDTH, WINDOW_HEIGHT),
+        fullscreen=False,
+        frameless=False,
+        **server_options,
+    )
+'''
+    add_file(plan, "main.py", main_code)
+
+
+def generate_gitignore(plan: dict) -> None:
+    """Generate .gitignore file."""
+    gitignore = """# Python
+__pycache__/
+*.py[cod]
+*$py.class
+*.so
+.Python
+env/
+venv/
+ENV/
+*.egg-info/
+dist/
+build/
+
+# Database
+*.db
+*.sqlite
+*.sqlite3
+
+# Prisma
+prisma/schema.prisma
+!db/schema.prisma
+
+# IDE
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# OS
+.DS_Store
+Thumbs.db
+
+# Project specific
+info.json
+.visionit/
+"""
+    add_file(plan, ".gitignore", gitignore)
+
+
+def generate_readme(plan: dict, project_name: str) -> None:
+    """Generate README.md file."""
+    readme = f"""# {project_name}
+
+Project generated with **VisionIT Framework**.
+
+## Setup
+
+1. Install dependencies, generate the Prisma client and initialize the database:
+```bash
+visionit setup
+```
+
+2. Run the application:
+```bash
+python main.py
+```
+
+## Project Structure
+
+- `actions/` - NiceGUI logic and handlers
+- `templates/` - HTML templates
+- `static/` - Static assets (CSS, JS)
+- `db/` - Database schema (Prisma)
+
+## Development
+
+- Edit `main.py` to add routes and pages
+- Add your business logic in `actions/`
+- Use Prisma for database operations
+"""
+    add_file(plan, "README.md", readme)
+
+
+def plan_project(
+    project_name: str,
+    author: str,
+    version: str,
+    orm: str,
+    db_type: str,
+    db_profile: str = DEFAULT_PROFILE,
+) -> dict:
+    """Build the in-memory plan of every file and folder of a new project."""
+    plan = new_plan()
+    create_project_structure(plan)
+    generate_info_json(plan, project_name, author, version, orm, db_type)
+    generate_package_txt(plan)
+    generate_prisma_schema(plan, db_type, db_profile)
+    generate_db_tuning(plan, db_profile)
+    generate_db_client(plan)
+    generate_main_py(plan, project_name)
+    generate_gitignore(plan)
+    generate_readme(plan, project_name)
+    generate_build_config(plan, project_name)
+    generate_icon_placeholder(plan)
+    generate_components(plan)
+    return plan
+
+
+def load_manifest(manifest_path: Path, defaults: Optional[dict] = None) -> list:
+    """Read project entries from a JSON list, {"projects": [...]} or JSONL file.
+
+    defaults overrides DEFAULT_ANSWERS for fields an entry leaves out.
+    Raises ValueError if the manifest is malformed.
+    """
+    content = manifest_path.read_text(encoding="utf-8")
+    if manifest_path.suffix == ".jsonl":
+        entries = [json.loads(line) for line in content.splitlines() if line.strip()]
+    else:
+        entries = json.loads(content)
+        if isinstance(entries, dict):
+            entries = entries.get("projects", [])
+
+    projects = []
+    for index, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or not entry.get("project_name"):
+            raise ValueError(f"entry {index} has no project_name")
+        name = entry["project_name"]
+        # The name is the project folder, and its prefix in --to-zip archives
+        if (
+            not isinstance(name, str)
+            or name in (".", "..")
+            or "/" in name
+            or "\\" in name
+            or Path(name).is_absolute()
+        ):
+            raise ValueError(f"entry {index} has an invalid project_name: {name!r}")
+        unknown = set(entry) - set(DEFAULT_ANSWERS) - {"project_name"}
+        if unknown:
+            raise ValueError(f"entry {index} has unknown fields: {', '.join(sorted(unknown))}")
+        if entry.get("db_profile", DEFAULT_PROFILE) not in PROFILES:
+            raise ValueError(f"entry {index} has an unknown db_profile: {entry['db_profile']}")
+        projects.append({**DEFAULT_ANSWERS, **(defaults or {}), **entry})
+
+    names = [p["project_name"] for p in projects]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"duplicate project_name: {', '.join(duplicates)}")
+    return projects
+
+
+def create_project(entry: dict, base_dir: Path) -> float:
+    """Plan and write one project from a manifest entry; return the elapsed seconds."""
+    start = time.perf_counter()
+    plan = plan_project(
+        entry["project_name"],
+        entry["author"],
+        entry["version"],
+        entry["orm"],
+        entry["db_type"],
+        entry["db_profile"],
+    )
+    # Projects already run in parallel: keep each writer small
+    write_plan(plan, base_dir / entry["project_name"], workers=4)
+    return time.perf_counter() - start
+
+
+def zip_target(to_zip: str):
+    """Return the --to-zip destination: a path, or stdout for "-"."""
+    return sys.stdout.buffer if to_zip == "-" else Path(to_zip)
+
+
+def create_batch_zip(projects: list, to_zip: str, jobs: int) -> None:
+    """Plan every project in parallel and stream them into a single archive."""
+    err = to_zip == "-"
+    start = time.perf_counter()
+
+    def plan_entry(entry):
+        return plan_project(
+            entry["project_name"],
+            entry["author"],
+            entry["version"],
+            entry["orm"],
+            entry["db_type"],
+            entry["db_profile"],
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(projects)))) as pool:
+        plans = list(pool.map(plan_entry, projects))
+
+    try:
+        with zip_output(zip_target(to_zip)) as archive:
+            for done, (entry, plan) in enumerate(zip(projects, plans), 1):
+                add_to_zip(archive, plan, entry["project_name"])
+                typer.echo(f"  [{done}/{len(projects)}] ✓ {entry['project_name']}", err=err)
+    except OSError as e:
+        typer.echo(f"❌ Error: could not write {to_zip}: {e}", err=True)
+        raise typer.Exit(1)
+
+    total = time.perf_counter() - start
+    typer.echo(f"\n✅ {len(projects)} projects written to {to_zip} in {total:.2f}s", err=err)
+
+
+def create_batch(
+    manifest: Path,
+    base_dir: Path,
+    jobs: int,
+    to_zip: Optional[str] = None,
+    defaults: Optional[dict] = None,
+) -> None:
+    """Create every project of a manifest in parallel, reporting progress."""
+    err = to_zip == "-"
+    try:
+        projects = load_manifest(manifest, defaults)
+    except (OSError, ValueError) as e:
+        typer.echo(f"❌ Error: invalid manifest {manifest}: {e}", err=err)
+        raise typer.Exit(1)
+
+    typer.echo(f"\n🚀 Creating {len(projects)} projects from {manifest}\n", err=err)
+    if to_zip:
+        create_batch_zip(projects, to_zip, jobs)
+        return
+
+    start = time.perf_counter()
+    failed = []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(projects)))) as pool:
+        futures = {
+            pool.submit(create_project, entry, base_dir): entry["project_name"]
+            for entry in projects
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            name = futures[future]
+            try:
+                elapsed = future.result()
+            except OSError as e:
+                failed.append(name)
+                typer.echo(f"  [{done}/{len(projects)}] ❌ {name}: {e}")
+            else:
+                typer.echo(f"  [{done}/{len(projects)}] ✓ {name} ({elapsed * 1000:.0f} ms)")
+
+    total = time.perf_counter() - start
+    created = len(projects) - len(failed)
+    typer.echo(f"\n✅ {created}/{len(projects)} projects created in {total:.2f}s")
+    if failed:
+        typer.echo(f"❌ Failed: {', '.join(failed)}")
+        raise typer.Exit(1)
+
+
+@app.command("new")
+def new_project(
+    project_name: Optional[str] = typer.Argument(None, help="Name of the new project"),
+    interactive: bool = typer.Option(
+        True, "--interactive/--no-interactive", "-i/-ni", help="Run in interactive mode"
+    ),
+    batch: Optional[Path] = typer.Option(
+        None, "--batch", "-b", help="Create every project of a JSON/JSONL manifest (no prompts)"
+    ),
+    jobs: int = typer.Option(
+        8, "--jobs", "-j", min=1, help="Projects created in parallel with --batch"
+    ),
+    to_zip: Optional[str] = typer.Option(
+        None, "--to-zip", "-z", help="Write a .zip archive instead of a directory ('-' for stdout)"
+    ),
+    db_profile: Optional[str] = typer.Option(
+        None,
+        "--db-profile",
+        help="SQLite profile: default or performance (WAL, busy timeout)",
+    ),
+):
+    """Create a new VisionIT project."""
+    # Keep stdout clean when the archive is streamed to it
+    err = to_zip == "-"
+
+    if db_profile is not None and db_profile not in PROFILES:
+        typer.echo(
+            f"❌ Error: unknown --db-profile '{db_profile}' " f"(use {', '.join(PROFILES)})",
+            err=True,
+        )
+        raise typer.Exit(1)
+
+    if batch is not None:
+        if project_name:
+            typer.echo("❌ Error: give either a project name or --batch, not both", err=True)
+            raise typer.Exit(1)
+        # --db-profile applies to the entries that do not set their own
+        defaults = {"db_profile": db_profile} if db_profile else None
+        create_batch(batch, Path("."), jobs, to_zip, defaults)
+        return
+
+    if not project_name:
+        typer.echo("❌ Error: missing project name (or use --batch manifest.json)", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(f"\n🚀 Creating new project: {project_name}\n", err=err)
+
+    base_path = Path(project_name)
+
+    if base_path.exists() and not to_zip:
+        typer.echo(f"❌ Error: Directory '{project_name}' already exists!")
+        raise typer.Exit(1)
+
+    # Prompts would end up in the archive streamed to stdout
+    if interactive and not err:
+        # Interactive questions
+        import questionary
+
+        author = questionary.text("Nom du développeur :").ask()
+        if not author:
+            author = DEFAULT_ANSWERS["author"]
+
+        version = questionary.text("Version de l'app :", default=DEFAULT_ANSWERS["version"]).ask()
+
+        orm = questionary.select("Choisir l'ORM :", choices=["Prisma"]).ask()
+
+        db_type = questionary.select("Choisir la base de données :", choices=["SQLite"]).ask()
+
+        if db_profile is None:
+            db_profile = questionary.select(
+                "Profil SQLite (performance : WAL, busy timeout) :",
+                choices=list(PROFILES),
+                default=DEFAULT_ANSWERS["db_profile"],
+            ).ask()
+    else:
+        # Default values for non-interactive mode
+        author = DEFAULT_ANSWERS["author"]
+        version = DEFAULT_ANSWERS["version"]
+        orm = DEFAULT_ANSWERS["orm"]
+        db_type = DEFAULT_ANSWERS["db_type"]
+        db_profile = db_profile or DEFAULT_ANSWERS["db_profile"]
+
+    typer.echo("\n📁 Creating project structure...\n", err=err)
+
+    # Plan every file in memory, then write them all at once
+    plan = plan_project(project_name, author, version, orm, db_type, db_profile)
+    try:
+        if to_zip:
+            write_zip(plan, zip_target(to_zip), project_name)
+        else:
+            write_plan(plan, base_path)
+    except OSError as e:
+        typer.echo(f"❌ Error: could not create project: {e}", err=True)
+        raise typer.Exit(1)
+
+    for message in plan["messages"]:
+        typer.echo(f"  ✓ Created: {message}", err=err)
+
+    if to_zip:
+        typer.echo(f"\n✅ Project '{project_name}' written to {to_zip}", err=err)
+        return
+
+    typer.echo(f"\n✅ Project '{project_name}' created successfully!")
+    typer.echo("\n📝 Next steps:")
+    typer.echo(f"   cd {project_name}")
+    typer.echo("   visionit setup")
+    typer.echo("   python main.py")
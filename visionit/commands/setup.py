@@ -0,0 +1,83 @@
+"""VisionIT `setup` command - bootstrap a project in one parallel, cached pipeline."""
+
+import time
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+from visionit.dependency_lock import LOCK_FILE, WHEELHOUSE_DIR
+from visionit.setup_pipeline import STEPS, WORKERS, current_lock, run_graph, setup_steps
+
+app = typer.Typer(add_completion=False)
+
+_STATUS = {"done": "✓", "cached": "⚡", "failed": "✗", "skipped": "⏭"}
+
+
+def report_step(result: dict) -> None:
+    """Print one finished step."""
+    name, seconds = result["name"], result["seconds"]
+    if result["status"] == "done":
+        typer.echo(f"   ✓ {name} ({seconds:.1f}s)")
+    elif result["status"] == "cached":
+        typer.echo(f"   ⚡ {name} is up to date")
+    elif result["status"] == "skipped":
+        typer.echo(f"   ⏭ {name} skipped ({result['error']})")
+    else:
+        typer.echo(f"   ✗ {name}: {result['error']}")
+        if result["log"]:
+            typer.echo(f"     Full log: {result['log']}")
+
+
+@app.command("setup")
+def setup_project(
+    project_path: str = typer.Option(".", "--path", "-p", help="Path to the project"),
+    offline: bool = typer.Option(False, "--offline", help="Install only from the wheelhouse"),
+    wheelhouse_dir: str = typer.Option(
+        WHEELHOUSE_DIR, "--wheelhouse", "-w", help="Wheelhouse directory, relative to the project"
+    ),
+    skip: Optional[List[str]] = typer.Option(
+        None, "--skip", "-s", help=f"Skip a step ({', '.join(STEPS)})"
+    ),
+    workers: int = typer.Option(WORKERS, "--workers", "-j", help="Steps run at the same time"),
+    force: bool = typer.Option(False, "--force", "-f", help="Run every step even if up to date"),
+):
+    """Install dependencies, set up the database and prepare the project, in parallel."""
+    path = Path(project_path)
+    unknown = sorted(set(skip or []) - set(STEPS))
+    if unknown:
+        typer.echo(f"❌ Error: unknown step {', '.join(unknown)} (use {', '.join(STEPS)})")
+        raise typer.Exit(1)
+    if (path / LOCK_FILE).exists() and current_lock(path) is None:
+        typer.echo(
+            "⚠️  package.lock is older than package.txt and is ignored. Run 'visionit lock'."
+        )
+
+    steps = setup_steps(path, path / wheelhouse_dir if offline else None, skip)
+    typer.echo(f"🚀 Setting up {path.resolve().name} ({len(steps)} steps, {workers} workers)...\n")
+
+    start = time.perf_counter()
+    results = run_graph(
+        steps,
+        workers,
+        force,
+        on_start=lambda name: typer.echo(f"   ▶ {name}"),
+        on_finish=report_step,
+    )
+    elapsed = time.perf_counter() - start
+
+    typer.echo("\n⏱️  Timing:")
+    width = max((len(result["name"]) for result in results), default=0)
+    for result in results:
+        typer.echo(
+            f"   {_STATUS[result['status']]} {result['name']:<{width}}  "
+            f"{result['seconds']:6.2f}s  {result['status']}"
+        )
+    total = sum(result["seconds"] for result in results)
+    typer.echo(f"   Total {elapsed:.2f}s for {total:.2f}s of steps")
+
+    failed = [result["name"] for result in results if result["status"] == "failed"]
+    if failed:
+        typer.echo(f"\n❌ Setup failed: {', '.join(failed)}")
+        raise typer.Exit(1)
+    typer.echo("\n✅ Project is ready! Start it with: python main.py")
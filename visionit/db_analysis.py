@@ -0,0 +1,236 @@
+"""VisionIT database analysis - missing indexes and SQLite query plans."""
+
+import difflib
+import json
+import re
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+from visionit.prisma_schema import block_span, column_name, get_model, table_name
+
+# Query sets looked up in db/ when none is given
+QUERY_FILES = ("queries.json", "queries.sql")
+
+_WHERE_COLUMN_RE = re.compile(r'"?(\w+)"?\s*(?:=|<|>|\bIN\b|\bLIKE\b|\bIS\b)', re.IGNORECASE)
+
+
+def _covered(model: dict, fields: list) -> bool:
+    """Check if an index, unique constraint or primary key starts with fields."""
+    candidates = [index["fields"] for index in model["indexes"]] + model["unique"]
+    if model["id"]:
+        candidates.append(model["id"])
+    return any(candidate[: len(fields)] == fields for candidate in candidates)
+
+
+def find_missing_indexes(schema: dict, queries: Optional[list] = None) -> list:
+    """Flag relation foreign keys and declared lookup fields that no index covers."""
+    findings = []
+    for model in schema["models"]:
+        for field in model["fields"]:
+            relation = field["relation"]
+            if not relation or not relation["fields"]:
+                continue
+            if not _covered(model, relation["fields"]):
+                findings.append(
+                    {
+                        "model": model["name"],
+                        "fields": relation["fields"],
+                        "reason": f"foreign key to {relation['model']} has no index",
+                    }
+                )
+    for query in queries or []:
+        model = get_model(schema, query["model"]) if "model" in query else None
+        where = query.get("where", [])
+        if model is None or "sql" in query or not where or _covered(model, where):
+            continue
+        if not any(f["model"] == model["name"] and f["fields"] == where for f in findings):
+            findings.append(
+                {
+                    "model": model["name"],
+                    "fields": where,
+                    "reason": "lookup field is neither unique nor indexed",
+                }
+            )
+    return findings
+
+
+def load_queries(query_file: Path) -> list:
+    """Read a query set: SQL statements (.sql) or declared lookups (.json).
+
+    A declared lookup is {"model": "Post", "where": ["authorId"], "order_by": ["createdAt"]}.
+    """
+    text = query_file.read_text(encoding="utf-8")
+    if query_file.suffix == ".json":
+        return validate_queries(json.loads(text))
+    statements = []
+    for statement in text.split(";"):
+        lines = [line for line in statement.splitlines() if not line.strip().startswith("--")]
+        statement = "\n".join(lines).strip()
+        if statement:
+            statements.append({"sql": statement})
+    return statements
+
+
+def validate_queries(queries) -> list:
+    """Check the shape of a JSON query set; raises ValueError naming the bad entry."""
+    if not isinstance(queries, list):
+        raise ValueError("a JSON query set is a list of lookups")
+    for i, query in enumerate(queries):
+        if not isinstance(query, dict):
+            raise ValueError(f"entry {i}: expected an object, got {type(query).__name__}")
+        if not isinstance(query.get("sql"), str) and not isinstance(query.get("model"), str):
+            raise ValueError(f'entry {i}: needs a "model" name or a "sql" statement')
+        for key in ("where", "order_by"):
+            value = query.get(key, [])
+            if not isinstance(value, list) or not all(isinstance(f, str) for f in value):
+                raise ValueError(f'entry {i}: "{key}" must be a list of field names')
+    return queries
+
+
+def default_queries(schema: dict) -> list:
+    """Without a query set, check the lookups every relation performs."""
+    queries = []
+    for model in schema["models"]:
+        for field in model["fields"]:
+            relation = field["relation"]
+            if relation and relation["fields"]:
+                queries.append({"model": model["name"], "where": relation["fields"]})
+    return queries
+
+
+def query_sql(schema: dict, query: dict) -> tuple:
+    """Return (sql, model name, where fields) for a declared lookup or raw SQL."""
+    if "sql" in query:
+        return query["sql"], query.get("model"), query.get("where", [])
+
+    model = get_model(schema, query["model"])
+    if model is None:
+        raise ValueError(f"unknown model in query set: {query['model']}")
+    columns = {field["name"]: column_name(field) for field in model["fields"]}
+    where = query.get("where", [])
+    sql = f'SELECT * FROM "{table_name(model)}"'
+    if where:
+        sql += " WHERE " + " AND ".join(f'"{columns.get(f, f)}" = ?' for f in where)
+    if query.get("order_by"):
+        sql += " ORDER BY " + ", ".join(f'"{columns.get(f, f)}"' for f in query["order_by"])
+    return sql, model["name"], where
+
+
+def _fields_from_sql(schema: dict, sql: str) -> tuple:
+    """Best-effort (model, where fields) for a raw SQL statement on one table."""
+    table = re.search(r'\bFROM\s+"?(\w+)"?', sql, re.IGNORECASE)
+    where = re.split(r"\bWHERE\b", sql, maxsplit=1, flags=re.IGNORECASE)
+    if not table or len(where) < 2:
+        return None, []
+    model = next((m for m in schema["models"] if table_name(m) == table.group(1)), None)
+    if model is None:
+        return None, []
+    fields = {column_name(f): f["name"] for f in model["fields"]}
+    clause = re.split(r"\b(?:ORDER|GROUP|LIMIT)\b", where[1], maxsplit=1, flags=re.IGNORECASE)[0]
+    names = []
+    for column in _WHERE_COLUMN_RE.findall(clause):
+        if column in fields and fields[column] not in names:
+            names.append(fields[column])
+    return model["name"], names
+
+
+def explain(connection: sqlite3.Connection, sql: str) -> list:
+    """Return the EXPLAIN QUERY PLAN detail lines of a statement."""
+    # Placeholders are bound to NULL: only the plan matters
+    params = [None] * sql.count("?")
+    return [row[3] for row in connection.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def is_full_scan(detail: str) -> bool:
+    """Check if a plan step reads a whole table instead of searching an index.
+
+    SEARCH steps use an index to find rows; SCAN steps visit every row, even
+    "SCAN t USING INDEX i", which only walks an index to get the sort order.
+    """
+    detail = detail.upper()
+    return detail.startswith("SCAN") and "CONSTANT ROW" not in detail
+
+
+def check_query_plans(schema: dict, database: Path, queries: list) -> list:
+    """Run EXPLAIN QUERY PLAN for each query against the SQLite database."""
+    results = []
+    connection = sqlite3.connect(Path(database).resolve().as_uri() + "?mode=ro", uri=True)
+    try:
+        for query in queries:
+            sql, model_name, where = query_sql(schema, query)
+            if "sql" in query and not model_name:
+                model_name, where = _fields_from_sql(schema, sql)
+            try:
+                plan = explain(connection, sql)
+                error = None
+            except sqlite3.Error as e:
+                plan, error = [], str(e)
+            results.append(
+                {
+                    "sql": sql,
+                    "model": model_name,
+                    "where": where,
+                    "plan": plan,
+                    "full_scan": any(is_full_scan(step) for step in plan),
+                    "temp_sort": any("TEMP B-TREE" in step.upper() for step in plan),
+                    "error": error,
+                }
+            )
+    finally:
+        connection.close()
+    return results
+
+
+def propose_indexes(schema: dict, findings: list, plans: list) -> dict:
+    """Group the @@index lines to add by model, without duplicates."""
+    proposals = {}
+    wanted = [(f["model"], f["fields"]) for f in findings]
+    wanted += [
+        (p["model"], p["where"]) for p in plans if p["full_scan"] and p["model"] and p["where"]
+    ]
+    for model_name, fields in wanted:
+        model = get_model(schema, model_name)
+        if model is None or _covered(model, fields):
+            continue
+        lines = proposals.setdefault(model_name, [])
+        line = f"@@index([{', '.join(fields)}])"
+        if line not in lines:
+            lines.append(line)
+    return proposals
+
+
+def apply_proposals(text: str, proposals: dict) -> str:
+    """Insert the proposed @@index lines before the closing brace of each model."""
+    for model_name, lines in proposals.items():
+        span = block_span(text, "model", model_name)
+        if span is None:
+            continue
+        end = span[1]
+        body_start = text.rfind("\n", 0, end) + 1
+        before = text[:body_start].rstrip("\n") + "\n"
+        last_line = before.rstrip("\n").rsplit("\n", 1)[-1].strip()
+        # Keep block attributes together, separated from the fields by a blank line
+        addition = "" if last_line.startswith("@@") else "\n"
+        addition += "".join(f"  {line}\n" for line in lines)
+        text = before + addition + text[body_start:]
+    return text
+
+
+def schema_diff(schema_path: Path, original: str, updated: str) -> str:
+    """Return a unified diff of the proposed schema edits."""
+    name = schema_path.as_posix()
+    return "".join(
+        difflib.unified_diff(
+            original.splitlines(True), updated.splitlines(True), fromfile=name, tofile=name
+        )
+    )
+
+
+def find_query_file(schema_path: Path) -> Optional[Path]:
+    """Return db/queries.json or db/queries.sql if the project declares one."""
+    for name in QUERY_FILES:
+        candidate = schema_path.parent / name
+        if candidate.exists():
+            return candidate
+    return None
@@ -0,0 +1,327 @@
+"""VisionIT export - stream SQLite tables to JSONL or CSV in constant memory.
+
+Rows are read page by page with keyset pagination on the primary key
+(``WHERE (key) > (last key) ORDER BY key LIMIT n``): each page costs an index
+seek, whatever its position, and only one page is ever in memory.
+
+Model fields are written back to the values ``db seed`` reads (DateTime as
+ISO 8601, Boolean as true/false, Json as JSON), so an export can be seeded
+into another database.
+"""
+
+import base64
+import csv
+import gzip
+import io
+import itertools
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator, Optional, TextIO
+
+from visionit.prisma_schema import column_name, table_name
+
+FORMATS = ("jsonl", "csv", "csv-chunks")
+PAGE_SIZE = 1000
+CHUNK_ROWS = 100000
+
+
+def connect_readonly(database: Path) -> sqlite3.Connection:
+    """Open database read-only, so a --where filter can never modify it."""
+    connection = sqlite3.connect(Path(database).resolve().as_uri() + "?mode=ro", uri=True)
+    connection.execute("PRAGMA query_only = ON")
+    return connection
+
+
+def database_tables(connection: sqlite3.Connection) -> list:
+    """Return the user tables of the database (without SQLite and Prisma internals)."""
+    rows = connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' "
+        "AND name NOT LIKE 'sqlite_%' AND name != '_prisma_migrations' ORDER BY name"
+    )
+    return [row[0] for row in rows]
+
+
+def table_info(connection: sqlite3.Connection, table: str) -> tuple:
+    """Return (columns, key columns) of a table; the key is rowid without a primary key."""
+    info = connection.execute(f'PRAGMA table_info("{table}")').fetchall()
+    if not info:
+        raise ValueError(f"table {table} not found in the database")
+    columns = [row[1] for row in info]
+    keys = [row[1] for row in sorted((row for row in info if row[5]), key=lambda row: row[5])]
+    return columns, keys or ["rowid"]
+
+
+def resolve_targets(schema: dict, connection: sqlite3.Connection, names: Optional[list]) -> list:
+    """Return {"name", "table", "model"} for each model or table to export.
+
+    Names may be model or table names. Without names, every model of the
+    schema is exported, or every table without a schema (a lone dev.db).
+    Raises ValueError for an unknown name.
+    """
+    tables = database_tables(connection)
+    models = [m for m in schema["models"] if m.get("kind", "model") == "model"]
+    if not names and not models:
+        return [{"name": table, "table": table, "model": None} for table in tables]
+    if not names:
+        return [
+            {"name": m["name"], "table": table_name(m), "model": m}
+            for m in models
+            if table_name(m) in tables
+        ]
+
+    targets = []
+    for name in names:
+        model = next((m for m in models if name in (m["name"], table_name(m))), None)
+        if model is not None:
+            targets.append({"name": model["name"], "table": table_name(model), "model": model})
+        elif name in tables:
+            targets.append({"name": name, "table": name, "model": None})
+        else:
+            raise ValueError(f"no model or table named {name}")
+    return targets
+
+
+def split_filters(filters: list, targets: list) -> dict:
+    """Map each target name to its SQL filters.
+
+    "Model: condition" applies to one model or table, a bare condition to all.
+    """
+    names = {t["name"]: t["name"] for t in targets}
+    names.update({t["table"]: t["name"] for t in targets})
+    by_target = {t["name"]: [] for t in targets}
+    for condition in filters or []:
+        match = re.match(r"^(\w+):\s*(.+)$", condition, re.DOTALL)
+        if match and match.group(1) in names:
+            by_target[names[match.group(1)]].append(match.group(2))
+        else:
+            for conditions in by_target.values():
+                conditions.append(condition)
+    return by_target
+
+
+def iter_pages(
+    connection: sqlite3.Connection,
+    table: str,
+    columns: list,
+    keys: list,
+    where: Optional[list] = None,
+    page_size: int = PAGE_SIZE,
+) -> Iterator[list]:
+    """Yield pages of rows in key order, resuming after the last key of each page."""
+    extra = [key for key in keys if key not in columns]
+    selected = ", ".join(f'"{c}"' if c != "rowid" else "rowid" for c in columns + extra)
+    key_list = ", ".join(f'"{k}"' if k != "rowid" else "rowid" for k in keys)
+    key_index = [(columns + extra).index(key) for key in keys]
+    filters = [f"({condition})" for condition in where or []]
+
+    last = None
+    while True:
+        conditions = list(filters)
+        if last is not None:
+            conditions.append(f"({key_list}) > ({', '.join('?' for _ in keys)})")
+        sql = f'SELECT {selected} FROM "{table}"'
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += f" ORDER BY {key_list} LIMIT {int(page_size)}"
+
+        rows = connection.execute(sql, last or []).fetchall()
+        if not rows:
+            return
+        last = [rows[-1][i] for i in key_index]
+        yield [row[: len(columns)] for row in rows] if extra else rows
+        if len(rows) < page_size:
+            return
+
+
+def _datetime(value):
+    if isinstance(value, (int, float)):
+        moment = datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+        return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    return value
+
+
+def _boolean(value):
+    return bool(value) if isinstance(value, int) else value
+
+
+def _json(value):
+    try:
+        return json.loads(value) if isinstance(value, str) else value
+    except ValueError:
+        return value
+
+
+def _bytes(value):
+    return base64.b64encode(value).decode("ascii") if isinstance(value, bytes) else value
+
+
+_DECODERS = {"DateTime": _datetime, "Boolean": _boolean, "Json": _json}
+
+
+def record_fields(target: dict, columns: list, text_json: bool = False) -> tuple:
+    """Return (output names, decoders) for the columns of a target.
+
+    With text_json, Json columns keep their JSON text (for CSV cells).
+    """
+    model = target["model"]
+    by_column = {}
+    if model is not None:
+        by_column = {
+            column_name(f): f for f in model["fields"] if not f["relation"] and not f["list"]
+        }
+    names, decoders = [], []
+    for column in columns:
+        field = by_column.get(column)
+        names.append(field["name"] if field else column)
+        if field and field["type"] == "Json" and text_json:
+            decoders.append(str)
+        else:
+            decoders.append(_DECODERS.get(field["type"], _bytes) if field else _bytes)
+    return names, decoders
+
+
+def iter_records(
+    connection: sqlite3.Connection,
+    target: dict,
+    where: Optional[list] = None,
+    page_size: int = PAGE_SIZE,
+    text_json: bool = False,
+) -> Iterator[dict]:
+    """Yield each row of a target as a {field: value} dict."""
+    columns, keys = table_info(connection, target["table"])
+    names, decoders = record_fields(target, columns, text_json)
+    for page in iter_pages(connection, target["table"], columns, keys, where, page_size):
+        for row in page:
+            yield {
+                name: decode(value) if value is not None else None
+                for name, decode, value in zip(names, decoders, row)
+            }
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return value
+
+
+def open_output(path: Path, compress: bool) -> TextIO:
+    """Open a text output, gzip-compressed if asked."""
+    if compress:
+        return io.TextIOWrapper(gzip.open(path, "wb"), encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+@contextmanager
+def atomic_output(path: Path, compress: bool):
+    """Write to a temporary file that replaces path only once complete."""
+    tmp = path.with_name(f".{path.name}.visionit-{os.getpid()}")
+    try:
+        with open_output(tmp, compress) as out:
+            yield out
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_records(
+    records: Iterator[dict],
+    out: TextIO,
+    file_format: str,
+    progress: Optional[Callable] = None,
+    header: Optional[list] = None,
+) -> int:
+    """Write records as JSONL or CSV; return the number of rows written."""
+    count = 0
+    writer = None
+    for record in records:
+        if file_format == "jsonl":
+            out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        else:
+            if writer is None:
+                writer = csv.writer(out)
+                writer.writerow(header or list(record))
+            writer.writerow([_csv_value(value) for value in record.values()])
+        count += 1
+        if progress and count % PAGE_SIZE == 0:
+            progress(count)
+    if file_format == "csv" and writer is None and header:
+        csv.writer(out).writerow(header)
+    return count
+
+
+def export_target(
+    connection: sqlite3.Connection,
+    target: dict,
+    output: Path,
+    file_format: str = "jsonl",
+    compress: bool = False,
+    where: Optional[list] = None,
+    page_size: int = PAGE_SIZE,
+    chunk_rows: int = CHUNK_ROWS,
+    progress: Optional[Callable] = None,
+) -> dict:
+    """Export one model or table into the output directory ("-": stdout).
+
+    csv-chunks writes <name>/part-00000.csv, part-00001.csv... of chunk_rows
+    rows each, every one with its header, so each chunk can be loaded alone.
+    """
+    start = time.perf_counter()
+    columns, _ = table_info(connection, target["table"])
+    header = record_fields(target, columns)[0]
+    records = iter_records(connection, target, where, page_size, text_json=file_format != "jsonl")
+    suffix = ".gz" if compress else ""
+
+    if str(output) == "-":
+        rows = write_records(
+            records, sys.stdout, "csv" if file_format != "jsonl" else "jsonl", progress, header
+        )
+        files = ["-"]
+    elif file_format != "csv-chunks":
+        output.mkdir(parents=True, exist_ok=True)
+        path = output / f"{target['name']}.{file_format}{suffix}"
+        with atomic_output(path, compress) as out:
+            rows = write_records(records, out, file_format, progress, header)
+        files = [str(path)]
+    else:
+        chunk_dir = output / target["name"]
+        chunk_dir.mkdir(parents=True, exist_ok=True)
+        for old in chunk_dir.glob("part-*.csv*"):
+            old.unlink()
+        rows, files = 0, []
+        while True:
+            chunk = itertools.islice(records, chunk_rows)
+            first = next(chunk, None)
+            if first is None and files:
+                break
+            path = chunk_dir / f"part-{len(files):05d}.csv{suffix}"
+            with atomic_output(path, compress) as out:
+                rows_in_chunk = itertools.chain([first] if first else [], chunk)
+                written = write_records(
+                    rows_in_chunk,
+                    out,
+                    "csv",
+                    progress and (lambda count: progress(rows + count)),
+                    header,
+                )
+            rows += written
+            files.append(str(path))
+            if written < chunk_rows:
+                break
+
+    return {
+        "name": target["name"],
+        "table": target["table"],
+        "rows": rows,
+        "files": files,
+        "seconds": time.perf_counter() - start,
+    }
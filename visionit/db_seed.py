@@ -0,0 +1,379 @@
+"""VisionIT seed loader - stream CSV and JSONL rows into the SQLite database.
+
+Rows go through a generator pipeline, so memory stays flat whatever the file
+size: read (``read_rows``) -> validate against the parsed schema
+(``validate_rows``) -> group (``batched``) -> one transaction per batch with
+``executemany`` (``insert_batches``).
+
+Values are stored the way Prisma stores them in SQLite: DateTime as epoch
+milliseconds, Boolean as 0/1, Json as text.
+"""
+
+import base64
+import csv
+import itertools
+import json
+import re
+import secrets
+import sqlite3
+import string
+import time
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from visionit.prisma_schema import column_name, get_model, table_name
+
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+SEED_DIR = Path("db") / "seed"
+BATCH_SIZE = 1000
+# Skipped rows beyond this are only counted, so memory stays flat
+MAX_ERROR_MESSAGES = 100
+
+_TRUE = {"true", "1", "yes", "oui"}
+_FALSE = {"false", "0", "no", "non"}
+_BASE36 = string.digits + string.ascii_lowercase
+
+
+class SeedError(ValueError):
+    """A row that does not match the schema; line is its position in the file."""
+
+    def __init__(self, line: int, message: str):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+
+
+def file_format(path: Path) -> str:
+    """Return "csv" or "jsonl" from the file extension; raises ValueError otherwise."""
+    try:
+        return FORMATS[path.suffix.lower()]
+    except KeyError:
+        raise ValueError(f"unsupported seed file {path.name} (use {', '.join(FORMATS)})") from None
+
+
+def read_rows(path: Path) -> Iterator[tuple]:
+    """Yield (line number, row dict) one at a time from a CSV or JSONL file."""
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        if file_format(path) == "csv":
+            reader = csv.DictReader(f)
+            for row in reader:
+                # Empty CSV cells mean "no value": defaults or NULL apply
+                yield reader.line_num, {k: v for k, v in row.items() if v != ""}
+            return
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                raise SeedError(number, f"invalid JSON: {e}") from None
+            if not isinstance(row, dict):
+                raise SeedError(number, "expected a JSON object")
+            yield number, row
+
+
+def find_model(schema: dict, path: Path) -> Optional[dict]:
+    """Return the model a seed file is named after (User.csv, 02_users.jsonl...)."""
+    name = re.sub(r"^\d+[_-]", "", path.stem).lower()
+    # users.csv also seeds User
+    names = {name, name[:-1]} if name.endswith("s") else {name}
+    return next(
+        (m for m in schema["models"] if names & {m["name"].lower(), table_name(m).lower()}), None
+    )
+
+
+def seed_files(project_path: Path) -> list:
+    """Return the files of db/seed/, in name order (prefix them to order the models)."""
+    seed_dir = project_path / SEED_DIR
+    if not seed_dir.is_dir():
+        return []
+    return sorted(p for p in seed_dir.iterdir() if p.suffix.lower() in FORMATS)
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+def _cuid() -> str:
+    # Same shape as Prisma's cuid(): "c" and 24 base 36 characters
+    return "c" + "".join(secrets.choice(_BASE36) for _ in range(24))
+
+
+def _datetime(value) -> int:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return int(value)
+    if not isinstance(value, str):
+        raise ValueError("expected an ISO 8601 date")
+    text = value.strip()
+    if text.isdigit():
+        return int(text)
+    parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+def _boolean(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.strip().lower() in _TRUE | _FALSE:
+        return value.strip().lower() in _TRUE
+    raise ValueError("expected true or false")
+
+
+def _integer(value) -> int:
+    if isinstance(value, bool) or isinstance(value, float):
+        raise ValueError("expected an integer")
+    return int(value)
+
+
+def _float(value) -> float:
+    if isinstance(value, bool):
+        raise ValueError("expected a number")
+    return float(value)
+
+
+def _decimal(value) -> str:
+    if isinstance(value, bool):
+        raise ValueError("expected a number")
+    try:
+        return str(Decimal(str(value)))
+    except InvalidOperation:
+        raise ValueError("expected a decimal number") from None
+
+
+def _string(value) -> str:
+    if not isinstance(value, str):
+        raise ValueError("expected a string")
+    return value
+
+
+def _json(value, from_text: bool) -> str:
+    return json.dumps(json.loads(value) if from_text else value)
+
+
+def _bytes(value) -> bytes:
+    return base64.b64decode(_string(value), validate=True)
+
+
+_CONVERTERS = {
+    "String": _string,
+    "Int": _integer,
+    "BigInt": _integer,
+    "Float": _float,
+    "Decimal": _decimal,
+    "Boolean": _boolean,
+    "DateTime": _datetime,
+    "Bytes": _bytes,
+}
+
+
+def _default(field: dict):
+    """Return the @default argument of a field, or None."""
+    default = next((a for a in field["attributes"] if a["name"] == "default"), None)
+    return default["args"][0] if default and default["args"] else None
+
+
+def _db_generated(field: dict) -> bool:
+    default = _default(field)
+    return isinstance(default, dict) and default["function"] == "dbgenerated"
+
+
+def column_plan(schema: dict, model: dict, first_row: dict) -> list:
+    """Return the fields to insert, in column order.
+
+    Relation fields are not columns (seed their foreign key instead). An
+    autoincrement key is always a column: rows without it insert NULL, which
+    SQLite numbers itself. A dbgenerated() key absent from the first row is
+    left to the database, so the other rows must not set it either.
+    """
+    enums = {enum["name"] for enum in schema["enums"]}
+    fields = []
+    for field in model["fields"]:
+        if field["relation"] or field["list"]:
+            continue
+        field_type = field["type"]
+        if field_type not in _CONVERTERS and field_type != "Json" and field_type not in enums:
+            continue
+        if _db_generated(field) and field["name"] not in first_row:
+            continue
+        fields.append(field)
+    return fields
+
+
+def field_converter(schema: dict, field: dict, from_text: bool) -> Callable:
+    """Return the function that validates a value of field and returns the stored value."""
+    enum = next((e for e in schema["enums"] if e["name"] == field["type"]), None)
+    if enum is not None:
+        values = set(enum["values"])
+
+        def to_enum(value):
+            if value not in values:
+                raise ValueError(f"expected one of {', '.join(enum['values'])}")
+            return value
+
+        return to_enum
+    if field["type"] == "Json":
+        return lambda value: _json(value, from_text)
+    return _CONVERTERS[field["type"]]
+
+
+def _missing_value(field: dict):
+    default = _default(field)
+    if isinstance(default, dict):
+        function = default["function"]
+        if function == "now":
+            return _now_ms()
+        if function == "uuid":
+            return str(uuid.uuid4())
+        if function == "cuid":
+            return _cuid()
+        # autoincrement(): SQLite numbers the row, dbgenerated(): other rows set it
+        return None
+    if default is not None:
+        return _datetime(default) if field["type"] == "DateTime" else default
+    if any(a["name"] == "updatedAt" for a in field["attributes"]):
+        return _now_ms()
+    if field["optional"]:
+        return None
+    raise KeyError(field["name"])
+
+
+def validate_rows(
+    schema: dict,
+    model: dict,
+    rows: Iterable[tuple],
+    fields: list,
+    from_text: bool,
+    errors: Optional[dict] = None,
+) -> Iterator[tuple]:
+    """Yield one tuple of column values per valid row.
+
+    Raises SeedError on the first invalid row, unless errors is given
+    ({"count": 0, "messages": []}): the row is then counted there and skipped.
+    """
+    known = {field["name"] for field in fields}
+    names = {field["name"] for field in model["fields"]}
+    left_to_database = {field["name"] for field in model["fields"] if _db_generated(field)} - known
+    converters = [field_converter(schema, field, from_text) for field in fields]
+    for line, row in rows:
+        try:
+            # csv.DictReader keeps the cells past the header under None
+            if None in row:
+                raise SeedError(line, "too many values")
+            unknown = sorted(set(row) - known)
+            generated = [name for name in unknown if name in left_to_database]
+            if generated:
+                raise SeedError(
+                    line,
+                    f"{', '.join(generated)} is generated by the database: "
+                    "set it in every row or in none (the first row omits it)",
+                )
+            if unknown:
+                kind = "not a column" if set(unknown) <= names else "unknown field"
+                raise SeedError(line, f"{kind}: {', '.join(unknown)}")
+            values = []
+            for field, converter in zip(fields, converters):
+                value = row.get(field["name"])
+                if value is None:
+                    try:
+                        values.append(_missing_value(field))
+                    except KeyError:
+                        raise SeedError(line, f"missing required field {field['name']}") from None
+                    continue
+                try:
+                    values.append(converter(value))
+                except (ValueError, TypeError) as e:
+                    raise SeedError(line, f"{field['name']}: {e} (got {value!r})") from None
+            yield tuple(values)
+        except SeedError as e:
+            if errors is None:
+                raise
+            errors["count"] += 1
+            if len(errors["messages"]) < MAX_ERROR_MESSAGES:
+                errors["messages"].append(str(e))
+
+
+def batched(rows: Iterable, size: int) -> Iterator[list]:
+    """Group rows into lists of at most size rows."""
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def insert_batches(
+    connection: sqlite3.Connection,
+    model: dict,
+    fields: list,
+    batches: Iterable[list],
+    progress: Optional[Callable] = None,
+) -> int:
+    """Insert each batch in its own transaction with executemany; return the row count.
+
+    A failing batch is rolled back; the batches before it stay committed.
+    """
+    columns = ", ".join(f'"{column_name(field)}"' for field in fields)
+    placeholders = ", ".join("?" for _ in fields)
+    sql = f'INSERT INTO "{table_name(model)}" ({columns}) VALUES ({placeholders})'
+
+    total = 0
+    for batch in batches:
+        connection.execute("BEGIN")
+        try:
+            connection.executemany(sql, batch)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+        total += len(batch)
+        if progress:
+            progress(total)
+    return total
+
+
+def seed_file(
+    schema: dict,
+    database: Path,
+    path: Path,
+    model_name: Optional[str] = None,
+    batch_size: int = BATCH_SIZE,
+    errors: Optional[dict] = None,
+    progress: Optional[Callable] = None,
+) -> dict:
+    """Stream one seed file into its model's table and return the counts.
+
+    Raises ValueError if no model matches, SeedError on an invalid row and
+    sqlite3.Error if the database rejects a batch.
+    """
+    model = get_model(schema, model_name) if model_name else find_model(schema, path)
+    if model is None:
+        raise ValueError(f"no model for {path.name} (name the file after a model or use --model)")
+
+    rows = read_rows(path)
+    first = next(rows, None)
+    start = time.perf_counter()
+    if first is None:
+        return {"file": str(path), "model": model["name"], "rows": 0, "seconds": 0.0}
+
+    fields = column_plan(schema, model, first[1])
+    from_text = file_format(path) == "csv"
+    valid = validate_rows(schema, model, itertools.chain([first], rows), fields, from_text, errors)
+
+    connection = sqlite3.connect(database, isolation_level=None)
+    try:
+        # Foreign keys are checked as Prisma does: seed referenced models first
+        connection.execute("PRAGMA foreign_keys = ON")
+        total = insert_batches(connection, model, fields, batched(valid, batch_size), progress)
+    finally:
+        connection.close()
+    return {
+        "file": str(path),
+        "model": model["name"],
+        "rows": total,
+        "seconds": time.perf_counter() - start,
+    }
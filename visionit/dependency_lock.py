@@ -0,0 +1,193 @@
+"""VisionIT dependency lock - pinned, hashed package.lock and a local wheelhouse.
+
+``visionit lock`` resolves package.txt once with pip (``pip install --dry-run
+--report``) and writes every package of the resolution as ``name==version``
+with the sha256 of the artifact pip chose, in requirements format, so pip can
+install it in hash-checking mode.
+
+``visionit wheelhouse`` puts a wheel of each locked package in wheelhouse/,
+building the ones only published as sources, and ``visionit install
+--offline`` installs from there with ``--no-index``: build agents never reach
+an index.
+
+Before running pip at all, ``visionit install`` compares the lock with the
+installed distributions (``importlib.metadata``); when every pin is already
+installed there is nothing to do.
+"""
+
+import hashlib
+import json
+import re
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import Optional
+
+PACKAGE_FILE = "package.txt"
+LOCK_FILE = "package.lock"
+WHEELHOUSE_DIR = "wheelhouse"
+
+_SOURCE_HASH = "# package.txt sha256:"
+
+
+def normalize_name(name: str) -> str:
+    """Return the normalized form of a distribution name (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def requirements_hash(package_file: Path) -> str:
+    """Hash the requirements of package.txt, ignoring comments and blank lines."""
+    lines = []
+    for line in package_file.read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            lines.append(line)
+    return hashlib.sha256("\n".join(lines).encode("utf-8")).hexdigest()
+
+
+def pip_command(*args: str) -> list:
+    """Return a pip command for the running interpreter, the one install checks."""
+    return [sys.executable, "-m", "pip", *args]
+
+
+def resolve_command(package_file: Path, report: Path) -> list:
+    """Return the pip command that resolves package.txt into a JSON report."""
+    return pip_command(
+        "install",
+        "--dry-run",
+        "--ignore-installed",
+        "--quiet",
+        "--report",
+        str(report),
+        "-r",
+        str(package_file),
+    )
+
+
+def _artifact_hash(item: dict) -> Optional[str]:
+    archive = item.get("download_info", {}).get("archive_info", {})
+    if "sha256" in archive.get("hashes", {}):
+        return "sha256:" + archive["hashes"]["sha256"]
+    # pip < 23 only reports "hash": "sha256=..."
+    algorithm, _, digest = archive.get("hash", "").partition("=")
+    return f"{algorithm}:{digest}" if algorithm == "sha256" and digest else None
+
+
+def lock_entries(report: dict) -> list:
+    """Return {"name", "version", "hash"} for each package of a pip report, by name.
+
+    Raises ValueError for a package pip did not resolve to an archive
+    (a local directory or a VCS URL), which cannot be pinned by hash.
+    """
+    entries = []
+    for item in report["install"]:
+        info = item["metadata"]
+        digest = _artifact_hash(item)
+        if digest is None:
+            raise ValueError(f"{info['name']} does not come from an archive and cannot be locked")
+        entries.append(
+            {"name": normalize_name(info["name"]), "version": info["version"], "hash": digest}
+        )
+    return sorted(entries, key=lambda entry: entry["name"])
+
+
+def format_lock(entries: list, source_hash: str, environment: str) -> str:
+    """Return package.lock content, in pip requirements format."""
+    lines = [
+        "# Generated by `visionit lock` from package.txt - do not edit",
+        f"# Resolved for {environment}",
+        f"{_SOURCE_HASH} {source_hash}",
+        "",
+    ]
+    for entry in entries:
+        lines.append(f"{entry['name']}=={entry['version']} \\")
+        lines.append(f"    --hash={entry['hash']}")
+    return "\n".join(lines) + "\n"
+
+
+def environment_name() -> str:
+    """Describe the interpreter a lock is resolved for ("CPython 3.11 on linux")."""
+    implementation = sys.implementation.name.replace("cpython", "CPython")
+    return f"{implementation} {sys.version_info[0]}.{sys.version_info[1]} on {sys.platform}"
+
+
+def read_lock(lock_file: Path) -> dict:
+    """Return {"source": package.txt hash or None, "packages": {name: version}}."""
+    source = None
+    packages = {}
+    for line in lock_file.read_text(encoding="utf-8").splitlines():
+        if line.startswith(_SOURCE_HASH):
+            source = line[len(_SOURCE_HASH) :].strip()
+            continue
+        match = re.match(r"^([A-Za-z0-9][A-Za-z0-9._-]*)==([^\s\\;]+)", line)
+        if match:
+            packages[normalize_name(match.group(1))] = match.group(2)
+    return {"source": source, "packages": packages}
+
+
+def installed_versions() -> dict:
+    """Return {normalized name: version} of the distributions importable here."""
+    versions = {}
+    for dist in metadata.distributions():
+        name = dist.metadata["Name"]
+        # The first distribution on sys.path wins, as for imports
+        if name and normalize_name(name) not in versions:
+            versions[normalize_name(name)] = dist.version
+    return versions
+
+
+def unsatisfied(packages: dict, installed: dict) -> list:
+    """Return the "name==version" pins that are not installed at that version."""
+    return [
+        f"{name}=={version}" for name, version in packages.items() if installed.get(name) != version
+    ]
+
+
+def install_command(
+    lock: Optional[dict], package_file: Path, lock_file: Path, wheelhouse: Optional[Path] = None
+) -> list:
+    """Return the pip command that installs the lock (or package.txt without one).
+
+    With a wheelhouse, pip reads nothing but that directory. Wheels built from
+    sources there do not have the hash of the locked source archive, so the
+    offline install pins versions with --no-deps (the lock is the full
+    resolution) instead of checking hashes; they were checked when the
+    wheelhouse was filled.
+    """
+    if wheelhouse is not None:
+        offline = ["install", "--no-index", "--find-links", str(wheelhouse)]
+        if lock is None:
+            return pip_command(*offline, "-r", str(package_file))
+        pins = [f"{name}=={version}" for name, version in lock["packages"].items()]
+        return pip_command(*offline, "--no-deps", *pins)
+    if lock is None:
+        return pip_command("install", "-r", str(package_file))
+    return pip_command("install", "--require-hashes", "--no-deps", "-r", str(lock_file))
+
+
+def wheel_command(requirements: Path, wheelhouse: Path, locked: bool) -> list:
+    """Return the pip command that downloads or builds the wheels of requirements.
+
+    A lock already lists every dependency, with hashes pip checks on download.
+    """
+    args = ["wheel", "--wheel-dir", str(wheelhouse), "-r", str(requirements)]
+    return pip_command(*args, "--no-deps") if locked else pip_command(*args)
+
+
+def wheelhouse_missing(packages: dict, wheelhouse: Path) -> list:
+    """Return the locked "name==version" pins with no wheel in the wheelhouse."""
+    available = set()
+    for wheel in wheelhouse.glob("*.whl"):
+        name, version = wheel.name.split("-")[:2]
+        available.add((normalize_name(name), version))
+    return [
+        f"{name}=={version}"
+        for name, version in packages.items()
+        if (name, version) not in available
+    ]
+
+
+def load_report(report: Path) -> dict:
+    """Read the JSON report written by `pip install --report`."""
+    with open(report, "r", encoding="utf-8") as f:
+        return json.load(f)
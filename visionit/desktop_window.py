@@ -3,15 +3,16 @@
 This module fixes the native window display issue.
 """
 
-import sys
-import webview
+import os
+import socket
 import threading
 import time
-from pathlib import Path
+from typing import Optional
 
 # Check if pywebview is available
 try:
     import webview
+
     WEBVIEW_AVAILABLE = True
 except ImportError:
     WEBVIEW_AVAILABLE = False
@@ -20,20 +21,21 @@ except ImportError:
 
 def create_desktop_window(url: str, title: str, width: int, height: int):
     """Create a native desktop window using pywebview."""
-    
+
     if not WEBVIEW_AVAILABLE:
         print("❌ pywebview not available. Opening in browser instead.")
         import webbrowser
+
         webbrowser.open(url)
         return
-    
-    print(f"\n🖥️  Creating desktop window...")
+
+    print("\n🖥️  Creating desktop window...")
     print(f"   Title: {title}")
     print(f"   Size: {width}x{height}")
     print(f"   URL: {url}")
-    
+
     # Create the window
-    window = webview.create_window(
+    webview.create_window(
         title=title,
         url=url,
         width=width,
@@ -42,48 +44,150 @@ def create_desktop_window(url: str, title: str, width: int, height: int):
         fullscreen=False,
         min_size=(400, 300),
     )
-    
+
     print("✅ Window created. Starting webview...\n")
-    
+
     # Start the webview
     webview.start()
 
 
-def run_desktop_app(app_func, title: str, width: int = 1000, height: int = 800):
-    """Run a NiceGUI app in a desktop window."""
-    
-    from nicegui import ui
-    
-    # Start NiceGUI server in a thread
-    def start_server():
-        ui.run(
-            host='127.0.0.1',
-            port=8080,
-            reload=False,
-            show=False,  # Don't open browser automatically
-            uvicorn_logging_level='error'
-        )
-    
+def parse_port_range(value: str) -> tuple:
+    """Parse "8080" or "8100-8199" into an inclusive (first, last) port range."""
+    first, _, last = value.strip().partition("-")
+    port_range = (int(first), int(last or first))
+    if not 0 < port_range[0] <= port_range[1] <= 65535:
+        raise ValueError(f"Invalid port range: {value}")
+    return port_range
+
+
+def bind_server_socket(
+    host: str, port: Optional[int] = None, port_range: Optional[tuple] = None
+) -> socket.socket:
+    """Bind the server socket: explicit port, then port_range, then VISIONIT_PORT, else ephemeral.
+
+    The socket is returned bound, and is handed to uvicorn as is: no other
+    process can take its port in between. It is not listening yet, so the
+    port only accepts connections once the server runs.
+    Raises RuntimeError if every port of the range is in use.
+    """
+    if port:
+        port_range = (port, port)
+    elif port_range is None and os.environ.get("VISIONIT_PORT"):
+        port_range = parse_port_range(os.environ["VISIONIT_PORT"])
+    candidates = range(port_range[0], port_range[1] + 1) if port_range else [0]
+    for candidate in candidates:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.bind((host, candidate))
+        except OSError:
+            sock.close()
+            continue
+        return sock
+    raise RuntimeError(f"No free port in range {port_range[0]}-{port_range[1]}")
+
+
+def wait_for_server(
+    host: str,
+    port: int,
+    timeout: float = 30.0,
+    ready_event: Optional[threading.Event] = None,
+    server_thread: Optional[threading.Thread] = None,
+) -> float:
+    """Block until the server accepts connections and return the boot time in seconds.
+
+    The startup hook sets ``ready_event`` once the app is up; the socket is then
+    polled with exponential backoff until uvicorn is actually listening.
+    Raises TimeoutError if the server is not reachable within ``timeout`` and
+    RuntimeError if ``server_thread`` dies first.
+    """
+    start = time.perf_counter()
+    deadline = start + timeout
+    delay = 0.005
+
+    while True:
+        if ready_event is None or ready_event.is_set():
+            try:
+                with socket.create_connection((host, port), timeout=0.5):
+                    return time.perf_counter() - start
+            except OSError:
+                pass
+
+        if server_thread is not None and not server_thread.is_alive():
+            raise RuntimeError("NiceGUI server stopped before it was ready")
+
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            raise TimeoutError(f"Server on {host}:{port} not ready after {timeout:.1f}s")
+
+        if ready_event is not None and not ready_event.is_set():
+            # Wakes up as soon as the startup hook fires
+            ready_event.wait(min(delay, remaining))
+        else:
+            time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 0.25)
+
+
+def run_desktop_app(
+    app_func,
+    title: str,
+    width: int = 1000,
+    height: int = 800,
+    timeout: float = 30.0,
+    port: Optional[int] = None,
+    port_range: Optional[tuple] = None,
+):
+    """Run a NiceGUI app in a desktop window.
+
+    The server binds a free port (see ``bind_server_socket``), so several apps
+    or instances can run side by side.
+    """
+
+    import uvicorn
+    from fastapi import FastAPI
+    from nicegui import app, ui
+
+    host = "127.0.0.1"
+    try:
+        sock = bind_server_socket(host, port, port_range)
+    except (RuntimeError, ValueError) as e:
+        print(f"❌ {e}")
+        return
+    port = sock.getsockname()[1]
+
+    # Signal readiness from the app's startup hook
+    ready = threading.Event()
+    app.on_startup(ready.set)
+
+    # NiceGUI mounted on FastAPI, so that uvicorn serves the socket bound above
+    fastapi_app = FastAPI()
+    ui.run_with(fastapi_app)
+    server = uvicorn.Server(uvicorn.Config(fastapi_app, log_level="error"))
+
     # Start server thread
-    server_thread = threading.Thread(target=start_server, daemon=True)
+    server_thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
     server_thread.start()
-    
+
     # Wait for server to start
-    print("⏳ Starting NiceGUI server...")
-    time.sleep(2)
-    
+    print(f"⏳ Starting NiceGUI server on port {port}...")
+    try:
+        boot_time = wait_for_server(host, port, timeout, ready, server_thread)
+    except (TimeoutError, RuntimeError) as e:
+        print(f"❌ {e}")
+        return
+    print(f"✅ Server ready in {boot_time * 1000:.0f} ms")
+
     # Create desktop window
-    url = "http://127.0.0.1:8080"
+    url = f"http://{host}:{port}"
     create_desktop_window(url, title, width, height)
 
 
 # Example usage
 if __name__ == "__main__":
     from nicegui import ui
-    
+
     @ui.page("/")
     def index():
         ui.label("Hello Desktop!").classes("text-h4")
         ui.button("Click me", on_click=lambda: ui.notify("It works!"))
-    
+
     run_desktop_app(index, "Test Window", 800, 600)
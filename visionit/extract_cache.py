@@ -0,0 +1,123 @@
+"""VisionIT extraction cache - append the onedir bundle to the onefile launcher."""
+
+import hashlib
+import os
+import shutil
+import stat
+import struct
+import sys
+import zipfile
+import zlib
+from pathlib import Path
+
+from visionit.onefile_launcher import COOKIE_SIZE, TRAILER_MAGIC
+
+LAUNCHER_SCRIPT = "visionit_launcher.py"
+
+# PyInstaller's archive cookie (PyInstaller/archive/writers.py)
+COOKIE_MAGIC = b"MEI\014\013\012\013\016"
+COOKIE_FORMAT = "!8sIIII64s"
+
+# Fixed timestamp so identical bundles produce identical payloads
+ZIP_DATE = (1980, 1, 1, 0, 0, 0)
+
+# Standard library modules the launcher pulls in indirectly but never uses
+# (hashlib alone brings OpenSSL's libcrypto)
+LAUNCHER_EXCLUDES = [
+    "_decimal",
+    "_hashlib",
+    "_socket",
+    "_ssl",
+    "array",
+    "bz2",
+    "csv",
+    "ctypes",
+    "datetime",
+    "decimal",
+    "email",
+    "hashlib",
+    "http",
+    "logging",
+    "lzma",
+    "pickle",
+    "random",
+    "socket",
+    "ssl",
+    "tempfile",
+    "typing",
+    "unicodedata",
+    "urllib.request",
+]
+# Debug symbols make up most of libpython on Linux; strip is not a Windows tool
+STRIP_LAUNCHER = sys.platform != "win32"
+
+
+def is_supported() -> bool:
+    """Check that the payload can be appended to the launcher on this platform.
+
+    On macOS PyInstaller signs the executable (ad-hoc on arm64): data appended
+    afterwards breaks the signature, and codesign refuses to re-sign a Mach-O
+    with trailing data.
+    """
+    return sys.platform != "darwin"
+
+
+def write_launcher_script(project_path: Path) -> Path:
+    """Copy the launcher source next to the spec so PyInstaller can freeze it."""
+    dest = project_path / "build" / LAUNCHER_SCRIPT
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(Path(__file__).with_name("onefile_launcher.py"), dest)
+    return dest
+
+
+def pack_bundle(bundle_dir: Path, zip_path: Path) -> None:
+    """Zip a onedir bundle deterministically, keeping file modes and symlinks."""
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for path in sorted(bundle_dir.rglob("*")):
+            name = path.relative_to(bundle_dir).as_posix()
+            if path.is_symlink():
+                info = zipfile.ZipInfo(name, ZIP_DATE)
+                info.external_attr = (stat.S_IFLNK | 0o777) << 16
+                archive.writestr(info, os.readlink(path))
+            elif path.is_file():
+                info = zipfile.ZipInfo(name, ZIP_DATE)
+                info.external_attr = (stat.S_IFREG | stat.S_IMODE(path.stat().st_mode)) << 16
+                info.compress_type = zipfile.ZIP_DEFLATED
+                with open(path, "rb") as src, archive.open(info, "w") as out:
+                    shutil.copyfileobj(src, out, 1 << 20)
+
+
+def attach_payload(exe_path: Path, bundle_dir: Path) -> str:
+    """Append the zipped bundle and its trailer to the launcher; return the payload hash.
+
+    The SHA-256 names the cache directory; the CRC-32 lets the launcher check
+    the payload without hashlib.
+    """
+    with open(exe_path, "rb") as f:
+        launcher = f.read()
+    start = launcher.rfind(COOKIE_MAGIC)
+    if start < 0:
+        raise RuntimeError(f"No PyInstaller archive found in {exe_path}")
+    cookie = struct.unpack(COOKIE_FORMAT, launcher[start : start + COOKIE_SIZE])
+    archive_start = start + COOKIE_SIZE - cookie[1]
+
+    zip_path = exe_path.with_name(exe_path.name + ".payload.zip")
+    pack_bundle(bundle_dir, zip_path)
+    try:
+        digest = hashlib.sha256()
+        crc = 0
+        with open(zip_path, "rb") as src, open(exe_path, "ab") as out:
+            for chunk in iter(lambda: src.read(1 << 20), b""):
+                digest.update(chunk)
+                crc = zlib.crc32(chunk, crc)
+                out.write(chunk)
+            size = zip_path.stat().st_size
+            # The bootloader searches its cookie backwards from the end of the file,
+            # which costs about 10 ms per MB of payload: this copy is found at once
+            length = len(launcher) + size + COOKIE_SIZE - archive_start
+            out.write(struct.pack(COOKIE_FORMAT, cookie[0], length, *cookie[2:]))
+            trailer = b"%s%08x%016d" % (digest.hexdigest().encode("ascii"), crc, size)
+            out.write(TRAILER_MAGIC + trailer)
+    finally:
+        zip_path.unlink()
+    return digest.hexdigest()
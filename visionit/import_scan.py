@@ -0,0 +1,120 @@
+"""VisionIT import scanner - derive PyInstaller hidden imports from the project sources."""
+
+import ast
+import json
+from pathlib import Path
+
+CACHE_FILE = Path(".visionit") / "imports.json"
+
+# Modules a framework loads at runtime, needed once the framework is imported
+RUNTIME_IMPORTS = {
+    "nicegui": ["nicegui", "nicegui.elements", "nicegui.page", "uvicorn"],
+}
+
+# Modules needed when the app opens a native window (ui.run(native=True))
+NATIVE_IMPORTS = ["webview"]
+
+
+class ScanError(ValueError):
+    """A project source that cannot be parsed; the message starts with file:line."""
+
+
+def scan_source(source: str, filename: str = "<unknown>") -> dict:
+    """Collect static imports, literal dynamic imports and native mode from one file."""
+    tree = ast.parse(source, filename=filename)
+    imports, dynamic = set(), set()
+    native = False
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.module and not node.level:
+                imports.add(node.module)
+        elif isinstance(node, ast.Call):
+            func = node.func
+            name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+            if name in ("import_module", "__import__") and node.args:
+                arg = node.args[0]
+                if (
+                    isinstance(arg, ast.Constant)
+                    and isinstance(arg.value, str)
+                    and not arg.value.startswith(".")
+                ):
+                    dynamic.add(arg.value)
+            for keyword in node.keywords:
+                # native=<expression> (e.g. `not HEADLESS`) may enable the window too
+                if keyword.arg == "native" and not (
+                    isinstance(keyword.value, ast.Constant) and not keyword.value.value
+                ):
+                    native = True
+
+    return {"imports": sorted(imports), "dynamic": sorted(dynamic), "native": native}
+
+
+def project_sources(project_path: Path, config: dict) -> list:
+    """Return the entry module and every module under actions/."""
+    sources = [project_path / f"{config.get('main_module', 'main')}.py"]
+    actions = project_path / "actions"
+    if actions.is_dir():
+        sources.extend(sorted(actions.rglob("*.py")))
+    return [path for path in sources if path.is_file()]
+
+
+def _load_cache(project_path: Path) -> dict:
+    cache_file = project_path / CACHE_FILE
+    if not cache_file.exists():
+        return {}
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def scan_project(project_path: Path, config: dict) -> dict:
+    """Scan the project sources, reusing per-file results whose mtime is unchanged.
+
+    Raises ScanError for a source that does not parse.
+    """
+    cache = _load_cache(project_path)
+    results, fresh = {}, {}
+
+    for path in project_sources(project_path, config):
+        key = path.relative_to(project_path).as_posix()
+        stat = path.stat()
+        entry = cache.get(key)
+        if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            result = entry["result"]
+        else:
+            try:
+                result = scan_source(path.read_text(encoding="utf-8"), str(path))
+            except SyntaxError as e:
+                raise ScanError(f"{key}:{e.lineno}: {e.msg}") from e
+            except UnicodeDecodeError as e:
+                raise ScanError(f"{key}: not UTF-8 ({e.reason})") from e
+        fresh[key] = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "result": result}
+        results[key] = result
+
+    if fresh != cache:
+        cache_file = project_path / CACHE_FILE
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(fresh, f, indent=4)
+
+    return results
+
+
+def compute_hidden_imports(project_path: Path, config: dict) -> list:
+    """Return the minimal hidden imports PyInstaller cannot find on its own."""
+    hidden = set()
+    for result in scan_project(project_path, config).values():
+        # Static imports are found by PyInstaller; only runtime loading needs help
+        hidden.update(result["dynamic"])
+        top_levels = {name.split(".")[0] for name in result["imports"]}
+        for package, modules in RUNTIME_IMPORTS.items():
+            if package in top_levels:
+                hidden.update(modules)
+        if result["native"]:
+            hidden.update(NATIVE_IMPORTS)
+    return sorted(hidden)
@@ -0,0 +1,273 @@
+"""VisionIT onefile launcher - run a cached copy of the app bundle.
+
+This script is frozen by PyInstaller as the onefile executable when
+``extract_cache`` is enabled in build.json. The onedir bundle of the app is
+appended to the executable as a zip payload, followed by a copy of
+PyInstaller's archive cookie and a fixed-size trailer.
+On first launch the payload is unpacked into a per-user cache directory named
+after its SHA-256; later launches reuse that directory.
+
+The launcher is itself a onefile, unpacked by PyInstaller on every launch, so
+it only uses a small part of the standard library: the SHA-256 is computed at
+build time and the payload is checked with zlib's CRC-32, keeping hashlib and
+OpenSSL out of the launcher. Each bundle directory holds an ``.in-use-<pid>``
+marker per running launch, and a bundle is only removed once none is alive.
+"""
+
+import json
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import zipfile
+import zlib
+from pathlib import Path
+
+TRAILER_MAGIC = b"VISIONIT-PAYLOAD"
+TRAILER_SIZE = len(TRAILER_MAGIC) + 64 + 8 + 16
+# PyInstaller's archive cookie, repeated between the payload and the trailer
+COOKIE_SIZE = 88
+MARKER_FILE = ".visionit-payload"
+IN_USE_PREFIX = ".in-use-"
+
+
+def read_trailer(exe_path: Path) -> tuple:
+    """Return (sha256, crc32, size) of the payload appended to exe_path."""
+    with open(exe_path, "rb") as f:
+        f.seek(-TRAILER_SIZE, os.SEEK_END)
+        trailer = f.read(TRAILER_SIZE)
+    if not trailer.startswith(TRAILER_MAGIC):
+        raise RuntimeError(f"No VisionIT payload found in {exe_path}")
+    fields = trailer[len(TRAILER_MAGIC) :].decode("ascii")
+    return fields[:64], int(fields[64:72], 16), int(fields[72:])
+
+
+def cache_root(app_name: str) -> Path:
+    """Return the per-user cache directory for the app."""
+    if sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+        return base / app_name / "cache"
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / app_name
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / app_name
+
+
+def _payload_crc(exe_path: Path, size: int) -> int:
+    crc = 0
+    with open(exe_path, "rb") as f:
+        f.seek(-(TRAILER_SIZE + COOKIE_SIZE + size), os.SEEK_END)
+        remaining = size
+        while remaining:
+            chunk = f.read(min(remaining, 1 << 20))
+            if not chunk:
+                break
+            crc = zlib.crc32(chunk, crc)
+            remaining -= len(chunk)
+    return crc
+
+
+def is_valid(target: Path, digest: str) -> bool:
+    """Check an extracted bundle against its marker: same payload, all files present.
+
+    Only file sizes are compared: hashing the bundle on every launch would
+    cost what the cache saves.
+    """
+    marker = target / MARKER_FILE
+    try:
+        with open(marker, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if manifest.get("sha256") != digest:
+        return False
+    for name, size in manifest.get("files", []):
+        path = target / name
+        if not os.path.lexists(path):
+            return False
+        if size >= 0 and not path.is_symlink() and path.stat().st_size != size:
+            return False
+    return True
+
+
+def pid_alive(pid: int) -> bool:
+    """Check whether a process with this pid is still running."""
+    if sys.platform == "win32":
+        # _winapi is built in, unlike ctypes and its libffi
+        import _winapi
+
+        try:
+            # PROCESS_QUERY_LIMITED_INFORMATION
+            handle = _winapi.OpenProcess(0x1000, False, pid)
+        except OSError as e:
+            # ERROR_ACCESS_DENIED: the process exists but belongs to someone else
+            return e.winerror == 5
+        try:
+            # STILL_ACTIVE
+            return _winapi.GetExitCodeProcess(handle) == 259
+        finally:
+            _winapi.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def mark_in_use(bundle: Path) -> Path:
+    """Mark bundle as used by this process and drop the markers of dead ones.
+
+    The marker outlives os.execve, which keeps the pid, so it stays valid for
+    as long as the app runs.
+    """
+    for marker in bundle.glob(f"{IN_USE_PREFIX}*"):
+        pid = marker.name[len(IN_USE_PREFIX) :]
+        if not (pid.isdigit() and pid_alive(int(pid))):
+            try:
+                marker.unlink()
+            except OSError:
+                pass
+    marker = bundle / f"{IN_USE_PREFIX}{os.getpid()}"
+    marker.touch()
+    return marker
+
+
+def is_in_use(directory: Path) -> bool:
+    """Check whether a running process has marked directory in use."""
+    for marker in directory.glob(f"{IN_USE_PREFIX}*"):
+        pid = marker.name[len(IN_USE_PREFIX) :]
+        if pid.isdigit() and pid_alive(int(pid)):
+            return True
+    return False
+
+
+def extract_payload(exe_path: Path, target: Path, digest: str) -> Path:
+    """Verify the payload, unpack it atomically and return the bundle directory.
+
+    The bundle lands in target, or in a fresh directory next to it when a
+    damaged copy already sits there. It is marked in use before it appears.
+    """
+    _, crc, size = read_trailer(exe_path)
+    if _payload_crc(exe_path, size) != crc:
+        raise RuntimeError(f"Corrupted payload in {exe_path}")
+
+    staging = target.with_name(f"{target.name}.tmp-{os.getpid()}")
+    shutil.rmtree(staging, ignore_errors=True)
+    files = []
+    with zipfile.ZipFile(exe_path) as archive:
+        for info in archive.infolist():
+            dest = staging / info.filename
+            mode = info.external_attr >> 16
+            if info.is_dir():
+                dest.mkdir(parents=True, exist_ok=True)
+                continue
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            if stat.S_ISLNK(mode):
+                os.symlink(archive.read(info).decode("utf-8"), dest)
+                files.append((info.filename, -1))
+                continue
+            with archive.open(info) as src, open(dest, "wb") as out:
+                shutil.copyfileobj(src, out, 1 << 20)
+            if mode:
+                os.chmod(dest, stat.S_IMODE(mode))
+            files.append((info.filename, info.file_size))
+
+    with open(staging / MARKER_FILE, "w", encoding="utf-8") as f:
+        json.dump({"sha256": digest, "files": files}, f)
+    # Marked before the rename, so no cleanup can see it unused
+    (staging / f"{IN_USE_PREFIX}{os.getpid()}").touch()
+
+    try:
+        os.replace(staging, target)
+    except OSError:
+        # Another launch won the race, or a damaged copy is in the way
+        marker = mark_in_use(target)
+        if is_valid(target, digest):
+            shutil.rmtree(staging, ignore_errors=True)
+            return target
+        marker.unlink()
+        target = target.with_name(f"{target.name}-{os.getpid()}")
+        os.replace(staging, target)
+    return target
+
+
+def cleanup_stale(root: Path, keep: Path) -> None:
+    """Remove the bundles and staging directories no running launch uses.
+
+    This covers other versions and the other copies of this one (damaged or
+    left by a lost race); keep is the bundle this launch runs.
+    """
+    for entry in root.iterdir():
+        if not entry.is_dir() or entry == keep:
+            continue
+        _, _, pid = entry.name.partition(".tmp-")
+        if pid:
+            # Staging directories belong to their launch as long as it runs
+            alive = pid.isdigit() and pid_alive(int(pid))
+        else:
+            # Deleting files under a running app breaks it (and fails halfway on Windows)
+            alive = is_in_use(entry)
+        if not alive:
+            shutil.rmtree(entry, ignore_errors=True)
+
+
+def ensure_extracted(exe_path: Path, root: Path) -> Path:
+    """Return the cached bundle directory for exe_path, unpacking it if needed.
+
+    The returned bundle is marked in use by this process. A damaged copy is
+    never deleted while a running instance may still use it: the bundle is
+    unpacked again into a fresh directory instead.
+    """
+    digest, _, _ = read_trailer(exe_path)
+    prefix = digest[:16]
+    copies = sorted(root.glob(f"{prefix}*")) if root.is_dir() else []
+    for copy in copies:
+        if ".tmp-" in copy.name:
+            continue
+        # Marked before the check, so a concurrent cleanup cannot remove it in between
+        try:
+            marker = mark_in_use(copy)
+        except OSError:
+            continue
+        if is_valid(copy, digest):
+            cleanup_stale(root, copy)
+            return copy
+        marker.unlink()
+
+    root.mkdir(parents=True, exist_ok=True)
+    target = root / prefix
+    if os.path.lexists(target):
+        target = root / f"{prefix}-{os.getpid()}"
+    target = extract_payload(exe_path, target, digest)
+    cleanup_stale(root, target)
+    return target
+
+
+def main() -> int:
+    exe_path = Path(sys.executable)
+    app_name = exe_path.stem
+    bundle = ensure_extracted(exe_path, cache_root(app_name))
+    app_exe = bundle / exe_path.name
+
+    # Start the cached app as an independent PyInstaller process
+    env = dict(os.environ, PYINSTALLER_RESET_ENVIRONMENT="1")
+    for var in ("LD_LIBRARY_PATH", "DYLD_LIBRARY_PATH"):
+        if f"{var}_ORIG" in env:
+            env[var] = env.pop(f"{var}_ORIG")
+        else:
+            env.pop(var, None)
+
+    args = [str(app_exe)] + sys.argv[1:]
+    if sys.platform == "win32":
+        try:
+            return subprocess.call(args, env=env)
+        finally:
+            (bundle / f"{IN_USE_PREFIX}{os.getpid()}").unlink()
+    os.execve(str(app_exe), args, env)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
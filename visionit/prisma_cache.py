@@ -0,0 +1,133 @@
+"""VisionIT Prisma cache - skip `prisma generate` and `db push` when the schema is unchanged."""
+
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+from importlib import metadata
+from pathlib import Path
+
+from visionit.prisma_schema import SchemaError, parse_schema
+
+STATE_FILE = Path(".visionit") / "state.json"
+
+
+def _strip_comment(line: str) -> str:
+    """Remove a trailing // comment, ignoring // inside strings (e.g. URLs)."""
+    in_string = False
+    for i, char in enumerate(line):
+        if char == '"' and (i == 0 or line[i - 1] != "\\"):
+            in_string = not in_string
+        elif not in_string and line.startswith("//", i):
+            # /// comments are documentation copied into the generated client
+            return line if line.startswith("///", i) else line[:i]
+    return line
+
+
+def normalize_schema(text: str) -> str:
+    """Return the schema without comments, blank lines or layout whitespace."""
+    lines = []
+    for line in text.splitlines():
+        line = _strip_comment(line).strip()
+        if not line:
+            continue
+        # Collapse alignment spaces outside of strings
+        parts = line.split('"')
+        parts[::2] = [" ".join(part.split()) for part in parts[::2]]
+        lines.append('"'.join(parts))
+    return "\n".join(lines) + "\n"
+
+
+def schema_hash(schema_path: Path) -> str:
+    """Hash the normalized schema, so formatting and comment edits are ignored."""
+    text = schema_path.read_text(encoding="utf-8")
+    return hashlib.sha256(normalize_schema(text).encode("utf-8")).hexdigest()
+
+
+def client_version() -> dict:
+    """Identify the installed Prisma Client Python the client is generated into."""
+    try:
+        version = metadata.version("prisma")
+    except metadata.PackageNotFoundError:
+        version = None
+    spec = importlib.util.find_spec("prisma")
+    package_file = Path(spec.origin) if spec and spec.origin else None
+    return {
+        "prisma": version,
+        "python": sys.prefix,
+        # A reinstall of the same version wipes the generated client
+        "installed": (
+            package_file.stat().st_mtime_ns if package_file and package_file.exists() else None
+        ),
+    }
+
+
+def database_file(schema_path: Path) -> Path:
+    """Return the SQLite file of the datasource, or None for other databases."""
+    try:
+        datasources = parse_schema(schema_path.read_text(encoding="utf-8"))["datasources"]
+    except SchemaError:
+        return None
+    if not datasources:
+        return None
+    url = datasources[0].get("url", "")
+    if isinstance(url, dict) and url.get("function") == "env" and url["args"]:
+        url = os.environ.get(url["args"][0], "")
+    if not isinstance(url, str) or not url.startswith("file:"):
+        return None
+    # Prisma resolves relative SQLite paths from the schema directory
+    return (schema_path.parent / url[len("file:") :].split("?", 1)[0]).resolve()
+
+
+def load_state(project_path: Path) -> dict:
+    """Load .visionit/state.json, or an empty state."""
+    state_file = project_path / STATE_FILE
+    if not state_file.exists():
+        return {}
+    try:
+        with open(state_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(project_path: Path, state: dict) -> None:
+    """Write .visionit/state.json."""
+    state_file = project_path / STATE_FILE
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(state_file, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=4)
+
+
+def generate_fingerprint(schema_path: Path) -> dict:
+    """Inputs of `prisma generate`: the schema and the client package."""
+    return dict(client_version(), schema=schema_hash(schema_path))
+
+
+def push_fingerprint(schema_path: Path) -> dict:
+    """Inputs of `prisma db push`: the schema and the database it targets."""
+    db_file = database_file(schema_path)
+    return {
+        "schema": schema_hash(schema_path),
+        "database": str(db_file) if db_file else None,
+    }
+
+
+def is_up_to_date(project_path: Path, step: str, fingerprint: dict, schema_path: Path) -> bool:
+    """Check if step ("generate" or "push") already ran with this fingerprint."""
+    recorded = load_state(project_path).get("prisma", {}).get(step)
+    if recorded != fingerprint:
+        return False
+    if step == "push":
+        # A deleted SQLite database must be pushed again
+        db_file = database_file(schema_path)
+        return db_file is None or db_file.exists()
+    return True
+
+
+def record(project_path: Path, step: str, fingerprint: dict) -> None:
+    """Record a successful step."""
+    state = load_state(project_path)
+    state.setdefault("prisma", {})[step] = fingerprint
+    save_state(project_path, state)
@@ -0,0 +1,404 @@
+"""VisionIT Prisma schema parser - read db/schema.prisma without the Prisma toolchain.
+
+The schema is parsed into plain dicts (JSON-serializable)::
+
+    {
+        "datasources": [{"name": "db", "provider": "sqlite", "url": "file:../dev.db"}],
+        "generators": [{"name": "client", "provider": "prisma-client-py"}],
+        "enums": [{"name": "Role", "values": ["USER", "ADMIN"]}],
+        "models": [{
+            "name": "Post",
+            "fields": [{"name": "authorId", "type": "Int", "optional": False,
+                        "list": False, "attributes": [...], "relation": None}, ...],
+            "attributes": [{"name": "index", "args": [["authorId"]], "named": {},
+                            "raw": "@@index([authorId])"}],
+            "id": ["id"],
+            "unique": [["slug"]],
+            "indexes": [{"fields": ["authorId"], "name": None}],
+        }],
+    }
+
+Attribute arguments keep their structure: strings, numbers, booleans, lists,
+bare identifiers (as str) and calls ({"function": "now", "args": [], "named": {}}).
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Optional
+
+CACHE_FILE = Path(".visionit") / "schema.json"
+
+# Bump when the parsed structure changes, to invalidate cached results
+PARSER_VERSION = 1
+
+BLOCK_KINDS = ("datasource", "generator", "model", "enum", "view", "type")
+
+_BLOCK_RE = re.compile(r"\b(" + "|".join(BLOCK_KINDS) + r")\s+(\w+)\s*\{")
+_TOKEN_RE = re.compile(r'\s*(?:("(?:[^"\\]|\\.)*")|([A-Za-z0-9_.\-]+)|(@@?[\w.]+)|([()\[\],:=?]))')
+
+
+class SchemaError(ValueError):
+    """Raised when schema.prisma cannot be parsed."""
+
+
+def _strip_comments(text: str) -> str:
+    """Blank out // comments (keeping /// docs as markers) outside strings."""
+    lines = []
+    for line in text.splitlines():
+        in_string = False
+        for i, char in enumerate(line):
+            if char == '"' and (i == 0 or line[i - 1] != "\\"):
+                in_string = not in_string
+            elif not in_string and line.startswith("//", i):
+                line = line[:i] + (
+                    "\0" + line[i + 3 :].strip() if line.startswith("///", i) else ""
+                )
+                break
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _blocks(text: str):
+    """Yield (kind, name, body) for every top-level block."""
+    pos = 0
+    while True:
+        match = _BLOCK_RE.search(text, pos)
+        if not match:
+            return
+        depth, i, in_string = 1, match.end(), False
+        while i < len(text) and depth:
+            char = text[i]
+            if char == '"' and text[i - 1] != "\\":
+                in_string = not in_string
+            elif not in_string and char == "{":
+                depth += 1
+            elif not in_string and char == "}":
+                depth -= 1
+            i += 1
+        if depth:
+            raise SchemaError(f"Unclosed block: {match.group(1)} {match.group(2)}")
+        yield match.group(1), match.group(2), text[match.end() : i - 1]
+        pos = i
+
+
+def _tokenize(text: str) -> tuple:
+    """Split one line into tokens and their (start, end) offsets."""
+    tokens, spans, pos = [], [], 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if not match or match.end() == pos:
+            raise SchemaError(f"Unexpected character in: {text.strip()}")
+        group = next(i for i, g in enumerate(match.groups(), 1) if g is not None)
+        tokens.append(match.group(group))
+        spans.append(match.span(group))
+        pos = match.end()
+    return tokens, spans
+
+
+class _Parser:
+    """Recursive-descent parser over the tokens of one schema line."""
+
+    def __init__(self, line: str):
+        self.line = line
+        self.tokens, self.spans = _tokenize(line)
+        self.pos = 0
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, expected: Optional[str] = None) -> str:
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            raise SchemaError(f"Expected {expected or 'a value'}, got {token!r}")
+        self.pos += 1
+        return token
+
+    def value(self):
+        token = self.take()
+        if token.startswith('"'):
+            return json.loads(token)
+        if token == "[":
+            items = []
+            while self.peek() != "]":
+                items.append(self.value())
+                if self.peek() == ",":
+                    self.take()
+            self.take("]")
+            return items
+        if self.peek() == "(":
+            args, named = self.arguments()
+            return {"function": token, "args": args, "named": named}
+        if token in ("true", "false"):
+            return token == "true"
+        if re.fullmatch(r"-?\d+", token):
+            return int(token)
+        if re.fullmatch(r"-?\d+\.\d+", token):
+            return float(token)
+        return token
+
+    def arguments(self) -> tuple:
+        args, named = [], {}
+        self.take("(")
+        while self.peek() != ")":
+            if self.pos + 1 < len(self.tokens) and self.tokens[self.pos + 1] == ":":
+                key = self.take()
+                self.take(":")
+                named[key] = self.value()
+            else:
+                args.append(self.value())
+            if self.peek() == ",":
+                self.take()
+        self.take(")")
+        return args, named
+
+    def attributes(self) -> list:
+        attributes = []
+        while self.peek() is not None:
+            start = self.spans[self.pos][0]
+            token = self.take()
+            if not token.startswith("@"):
+                raise SchemaError(f"Expected an attribute, got {token!r}")
+            args, named = self.arguments() if self.peek() == "(" else ([], {})
+            # Source text keeps the string/identifier distinction for display
+            raw = self.line[start : self.spans[self.pos - 1][1]]
+            attributes.append({"name": token.lstrip("@"), "args": args, "named": named, "raw": raw})
+        return attributes
+
+
+def field_names(value) -> list:
+    """Return the field names of an attribute list argument, e.g. [title(sort: Desc), id]."""
+    items = value if isinstance(value, list) else [value]
+    return [item["function"] if isinstance(item, dict) else item for item in items]
+
+
+def _attribute_fields(attribute: dict) -> list:
+    value = attribute["args"][0] if attribute["args"] else attribute["named"].get("fields", [])
+    return field_names(value)
+
+
+def _parse_settings(body: str) -> dict:
+    settings = {}
+    for line in body.splitlines():
+        line = line.split("\0", 1)[0].strip()
+        if not line:
+            continue
+        parser = _Parser(line)
+        key = parser.take()
+        parser.take("=")
+        settings[key] = parser.value()
+    return settings
+
+
+def _parse_model(name: str, body: str) -> dict:
+    fields, attributes, doc = [], [], []
+    for line in body.splitlines():
+        line, _, comment = line.partition("\0")
+        line = line.strip()
+        if not line:
+            if comment:
+                doc.append(comment)
+            continue
+        parser = _Parser(line)
+        if line.startswith("@@"):
+            attributes.extend(parser.attributes())
+            continue
+
+        field_name = parser.take()
+        type_name = parser.take()
+        if parser.peek() == "(":  # Unsupported("...")
+            args, _ = parser.arguments()
+            type_name = f'{type_name}("{args[0]}")'
+        is_list = optional = False
+        if parser.peek() == "[":
+            parser.take("[")
+            parser.take("]")
+            is_list = True
+        if parser.peek() == "?":
+            parser.take("?")
+            optional = True
+        fields.append(
+            {
+                "name": field_name,
+                "type": type_name,
+                "list": is_list,
+                "optional": optional,
+                "attributes": parser.attributes(),
+                "doc": "\n".join(doc) or None,
+            }
+        )
+        doc = []
+
+    model = {
+        "name": name,
+        "fields": fields,
+        "attributes": attributes,
+        "id": [],
+        "unique": [],
+        "indexes": [],
+    }
+    for field in fields:
+        for attribute in field["attributes"]:
+            if attribute["name"] == "id":
+                model["id"] = [field["name"]]
+            elif attribute["name"] == "unique":
+                model["unique"].append([field["name"]])
+    for attribute in attributes:
+        if attribute["name"] == "id":
+            model["id"] = _attribute_fields(attribute)
+        elif attribute["name"] == "unique":
+            model["unique"].append(_attribute_fields(attribute))
+        elif attribute["name"] == "index":
+            model["indexes"].append(
+                {
+                    "fields": _attribute_fields(attribute),
+                    "name": attribute["named"].get("name") or attribute["named"].get("map"),
+                }
+            )
+    return model
+
+
+def _link_relations(models: list) -> None:
+    by_name = {model["name"]: model for model in models}
+    for model in models:
+        for field in model["fields"]:
+            field["relation"] = None
+            if field["type"] not in by_name:
+                continue
+            relation = next((a for a in field["attributes"] if a["name"] == "relation"), None)
+            named = relation["named"] if relation else {}
+            args = relation["args"] if relation else []
+            field["relation"] = {
+                "model": field["type"],
+                "name": named.get("name") or (args[0] if args else None),
+                "fields": field_names(named.get("fields", [])),
+                "references": field_names(named.get("references", [])),
+                "on_delete": named.get("onDelete"),
+            }
+
+
+def parse_schema(text: str) -> dict:
+    """Parse schema.prisma source into datasources, generators, enums and models."""
+    text = _strip_comments(text)
+    schema = {"datasources": [], "generators": [], "enums": [], "models": []}
+
+    for kind, name, body in _blocks(text):
+        try:
+            if kind in ("datasource", "generator"):
+                schema[kind + "s"].append(dict(_parse_settings(body), name=name))
+            elif kind == "enum":
+                values = [
+                    line.split("\0", 1)[0].split()[0]
+                    for line in body.splitlines()
+                    if line.split("\0", 1)[0].strip()
+                    and not line.split("\0", 1)[0].strip().startswith("@@")
+                ]
+                schema["enums"].append({"name": name, "values": values})
+            else:
+                model = _parse_model(name, body)
+                model["kind"] = kind
+                schema["models"].append(model)
+        except SchemaError as e:
+            raise SchemaError(f"{kind} {name}: {e}") from None
+
+    _link_relations(schema["models"])
+    return schema
+
+
+def load_schema(project_path: Path, schema_path: Optional[Path] = None) -> dict:
+    """Parse the project schema, reusing the cached result while its mtime is unchanged."""
+    schema_path = schema_path or project_path / "db" / "schema.prisma"
+    stat = schema_path.stat()
+    key = {
+        "version": PARSER_VERSION,
+        "path": str(schema_path.resolve()),
+        "mtime": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+
+    cache_file = project_path / CACHE_FILE
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if cached.get("key") == key:
+            return cached["schema"]
+    except (OSError, ValueError):
+        pass
+
+    schema = parse_schema(schema_path.read_text(encoding="utf-8"))
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_file, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "schema": schema}, f)
+    return schema
+
+
+def block_span(text: str, kind: str, name: str) -> Optional[tuple]:
+    """Return (start, closing brace offset) of a block in the original schema text."""
+    match = re.search(rf"^[ \t]*{kind}\s+{re.escape(name)}\s*\{{", text, re.MULTILINE)
+    if not match:
+        return None
+    depth, i, in_string = 1, match.end(), False
+    while i < len(text):
+        char = text[i]
+        if char == '"' and text[i - 1] != "\\":
+            in_string = not in_string
+        elif not in_string and text.startswith("//", i):
+            i = text.find("\n", i)
+            if i < 0:
+                return None
+            continue
+        elif not in_string and char == "{":
+            depth += 1
+        elif not in_string and char == "}":
+            depth -= 1
+            if not depth:
+                return match.start(), i
+        i += 1
+    return None
+
+
+def table_name(model: dict) -> str:
+    """Return the database table of a model (@@map or the model name)."""
+    mapped = next((a for a in model["attributes"] if a["name"] == "map"), None)
+    return mapped["args"][0] if mapped and mapped["args"] else model["name"]
+
+
+def column_name(field: dict) -> str:
+    """Return the database column of a field (@map or the field name)."""
+    mapped = next((a for a in field["attributes"] if a["name"] == "map"), None)
+    return mapped["args"][0] if mapped and mapped["args"] else field["name"]
+
+
+def get_model(schema: dict, name: str) -> Optional[dict]:
+    """Return the model called name, or None."""
+    return next((model for model in schema["models"] if model["name"] == name), None)
+
+
+def format_value(value) -> str:
+    """Render a parsed attribute argument back to schema syntax."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return "[" + ", ".join(format_value(item) for item in value) + "]"
+    if isinstance(value, dict):
+        return value["function"] + _format_arguments(value["args"], value["named"])
+    if isinstance(value, str) and not re.fullmatch(r"[A-Za-z_][\w.]*", value):
+        return json.dumps(value)
+    return str(value)
+
+
+def _format_arguments(args: list, named: dict) -> str:
+    parts = [format_value(arg) for arg in args]
+    parts += [f"{key}: {format_value(value)}" for key, value in named.items()]
+    return f"({', '.join(parts)})"
+
+
+def format_attribute(attribute: dict, block: bool = False) -> str:
+    """Render a parsed attribute, e.g. @default(now()) or @@index([authorId])."""
+    if attribute.get("raw"):
+        return attribute["raw"]
+    prefix = "@@" if block else "@"
+    if not attribute["args"] and not attribute["named"]:
+        return prefix + attribute["name"]
+    return prefix + attribute["name"] + _format_arguments(attribute["args"], attribute["named"])
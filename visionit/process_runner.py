@@ -0,0 +1,128 @@
+"""VisionIT process runner - stream external commands to a log file.
+
+PyInstaller, pip and Prisma are run with their stdout and stderr merged and
+read line by line as they are written: every line goes straight to a log file
+under .visionit/logs/, and only the last lines are kept in memory (for the
+error message), so a multi-megabyte build log costs nothing.
+
+Lines matching a phase pattern (PyInstaller's Analysis, PYZ, PKG, EXE and
+COLLECT steps, pip's collect/download/install steps) mark the start of a
+phase; the time spent in each phase is returned and saved next to the log.
+"""
+
+import json
+import os
+import re
+import subprocess
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Optional
+
+LOG_DIR = Path(".visionit") / "logs"
+TAIL_LINES = 40
+
+PYINSTALLER_PHASES = [
+    (re.compile(r"\b(?:Running|Building) (Analysis|PYZ|PKG|EXE|COLLECT)\b"), None),
+]
+PIP_PHASES = [
+    (re.compile(r"^(?:Collecting|Looking in|Obtaining|Processing) "), "Resolve"),
+    (re.compile(r"^\s*Downloading "), "Download"),
+    (re.compile(r"^\s*(?:Building wheels?|Created wheel) "), "Build"),
+    (re.compile(r"^Installing collected packages"), "Install"),
+]
+
+
+def detect_phase(line: str, phases: list) -> Optional[str]:
+    """Return the phase a line starts, or None.
+
+    A pattern paired with None names the phase after its first group.
+    """
+    for pattern, name in phases:
+        match = pattern.search(line)
+        if match:
+            return name or match.group(1)
+    return None
+
+
+def log_path(project_path: Path, name: str) -> Path:
+    """Return .visionit/logs/<name>.log in the project."""
+    return project_path / LOG_DIR / f"{name}.log"
+
+
+def timings_path(log_file: Path) -> Path:
+    """Return the file next to a log that holds its durations (build.log -> build.timings.json)."""
+    return log_file.with_name(f"{log_file.stem}.timings.json")
+
+
+def run_streamed(
+    command: list,
+    log_file: Path,
+    cwd: Optional[Path] = None,
+    phases: Optional[list] = None,
+    on_phase: Optional[Callable] = None,
+    on_line: Optional[Callable] = None,
+    tail_lines: int = TAIL_LINES,
+    env: Optional[dict] = None,
+) -> dict:
+    """Run command, writing its output to log_file as it comes, and return the result.
+
+    The result holds the return code, the total and per-phase seconds, and
+    the last tail_lines lines of output. on_phase is called with each phase
+    name the first time it starts, on_line with every decoded line. env
+    adds variables to the environment. Raises FileNotFoundError if the
+    program is not installed.
+    """
+    log_file.parent.mkdir(parents=True, exist_ok=True)
+    env = dict(os.environ, PYTHONUNBUFFERED="1", **(env or {}))
+    tail = deque(maxlen=tail_lines)
+    durations = {}
+    current, phase_start = None, None
+
+    start = time.perf_counter()
+    with open(log_file, "wb") as log:
+        proc = subprocess.Popen(
+            command,
+            cwd=cwd,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        with proc.stdout:
+            for raw in proc.stdout:
+                log.write(raw)
+                line = raw.decode("utf-8", errors="replace").rstrip()
+                tail.append(line)
+                if on_line:
+                    on_line(line)
+                phase = detect_phase(line, phases or [])
+                if phase and phase != current:
+                    now = time.perf_counter()
+                    if current:
+                        durations[current] = durations.get(current, 0.0) + now - phase_start
+                    if on_phase and phase not in durations:
+                        on_phase(phase)
+                    current, phase_start = phase, now
+        returncode = proc.wait()
+    end = time.perf_counter()
+    if current:
+        durations[current] = durations.get(current, 0.0) + end - phase_start
+
+    result = {
+        "command": command,
+        "returncode": returncode,
+        "seconds": round(end - start, 3),
+        "phases": {name: round(seconds, 3) for name, seconds in durations.items()},
+        "log": str(log_file),
+    }
+    with open(timings_path(log_file), "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=2)
+    result["tail"] = list(tail)
+    return result
+
+
+def phase_summary(result: dict) -> str:
+    """Format the phase durations of a result ("Analysis 12.1s, PYZ 0.8s...")."""
+    phases = result["phases"] or {"total": result["seconds"]}
+    return ", ".join(f"{name} {seconds:.1f}s" for name, seconds in phases.items())
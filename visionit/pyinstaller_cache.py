@@ -0,0 +1,172 @@
+"""VisionIT PyInstaller cache - share PyInstaller's binary cache per dependency stack.
+
+The only PyInstaller state that can be reused across projects is its
+binary cache (bincache): the collected shared libraries once UPX-compressed,
+and on macOS once their headers are rewritten and re-signed. PyInstaller
+only fills it when UPX is installed or on macOS; elsewhere it stays empty
+and VisionIT leaves PyInstaller's default cache alone. Analysis results are
+specific to each project and stay in its build/ folder.
+
+When the bincache is used, VisionIT points PYINSTALLER_CONFIG_DIR at
+``~/.cache/visionit/pyinstaller/<key>``, where the key hashes the
+interpreter, PyInstaller and the installed versions of the packages the
+project bundles: projects on the same NiceGUI/uvicorn/pywebview stack share
+one entry, while an upgrade starts a new one.
+
+Entries are evicted least recently used first once the cache exceeds its
+size cap (VISIONIT_CACHE_MAX_MB, 2 GB by default). A build marks its entry
+in use, and entries in use by a running process are never evicted.
+"""
+
+import hashlib
+import json
+import os
+import platform
+import shutil
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from visionit.build_cache import bundled_distributions, package_versions
+from visionit.onefile_launcher import IN_USE_PREFIX, cache_root, is_in_use
+
+MAX_CACHE_MB = 2048
+_ENTRY_FILE = "visionit-cache.json"
+
+
+def cache_dir() -> Path:
+    """Return the shared PyInstaller cache root (VISIONIT_CACHE_DIR overrides it)."""
+    override = os.environ.get("VISIONIT_CACHE_DIR")
+    return Path(override) / "pyinstaller" if override else cache_root("visionit") / "pyinstaller"
+
+
+def max_cache_bytes(max_mb: Optional[int] = None) -> int:
+    """Return the cache size cap in bytes, from max_mb or VISIONIT_CACHE_MAX_MB."""
+    if max_mb is None:
+        max_mb = int(os.environ.get("VISIONIT_CACHE_MAX_MB", MAX_CACHE_MB))
+    return max_mb * 1024 * 1024
+
+
+def uses_bincache(config: dict) -> bool:
+    """Check that PyInstaller will cache processed binaries for this build."""
+    if sys.platform == "darwin":
+        return True
+    return bool(config.get("upx", True) and shutil.which("upx"))
+
+
+def inactive_reason(config: dict) -> Optional[str]:
+    """Return why PyInstaller will not fill the shared cache, or None if it will."""
+    if uses_bincache(config):
+        return None
+    if not config.get("upx", True):
+        return "upx is false in build.json"
+    return "UPX is not installed"
+
+
+def stack(project_path: Path, config: dict) -> dict:
+    """Return what a cache entry depends on: interpreter, platform and bundled packages."""
+    names = bundled_distributions(project_path, config)
+    # Project modules (actions, db...) are not distributions and must not split the cache
+    versions = {name: version for name, version in package_versions(names).items() if version}
+    return {
+        "python": f"{sys.implementation.name} {platform.python_version()}",
+        "platform": f"{sys.platform}-{platform.machine()}",
+        "packages": versions,
+    }
+
+
+def cache_key(project_stack: dict) -> str:
+    """Return the content address of a stack."""
+    content = json.dumps(project_stack, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
+def entry_for(project_path: Path, config: dict, root: Optional[Path] = None) -> Path:
+    """Return the cache entry of a project, creating it and marking it used."""
+    project_stack = stack(project_path, config)
+    entry = (root or cache_dir()) / cache_key(project_stack)
+    entry.mkdir(parents=True, exist_ok=True)
+    info_file = entry / _ENTRY_FILE
+    info = {"stack": project_stack, "projects": []}
+    if info_file.exists():
+        try:
+            with open(info_file, "r", encoding="utf-8") as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            pass
+    project = str(project_path.resolve())
+    if project not in info["projects"]:
+        info["projects"].append(project)
+    info["last_used"] = time.time()
+    # Concurrent workspace builds share entries: never leave a half-written file
+    tmp = info_file.with_name(f".{_ENTRY_FILE}.visionit-{os.getpid()}")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(info, f, indent=2)
+    os.replace(tmp, info_file)
+    return entry
+
+
+@contextmanager
+def in_use(entry: Path) -> Iterator[Path]:
+    """Mark entry as used by this process, so that no eviction removes it."""
+    marker = entry / f"{IN_USE_PREFIX}{os.getpid()}"
+    marker.touch()
+    try:
+        yield entry
+    finally:
+        try:
+            marker.unlink()
+        except OSError:
+            pass
+
+
+def _size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file() and not p.is_symlink())
+
+
+def list_entries(root: Optional[Path] = None) -> list:
+    """Return {"path", "size", "last_used", "projects"} per entry, least recently used first."""
+    root = root or cache_dir()
+    if not root.is_dir():
+        return []
+    entries = []
+    for entry in root.iterdir():
+        if not entry.is_dir():
+            continue
+        info = {}
+        try:
+            with open(entry / _ENTRY_FILE, "r", encoding="utf-8") as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            pass
+        entries.append(
+            {
+                "path": entry,
+                "size": _size(entry),
+                "last_used": info.get("last_used", entry.stat().st_mtime),
+                "projects": info.get("projects", []),
+            }
+        )
+    return sorted(entries, key=lambda e: e["last_used"])
+
+
+def evict(max_bytes: int, root: Optional[Path] = None, keep: Optional[Path] = None) -> list:
+    """Remove least recently used entries until the cache fits in max_bytes.
+
+    keep and the entries in use by running builds (concurrent workspace jobs)
+    are never removed. Returns the removed entries.
+    """
+    entries = list_entries(root)
+    total = sum(e["size"] for e in entries)
+    removed = []
+    for entry in entries:
+        if total <= max_bytes:
+            break
+        if entry["path"] == keep or is_in_use(entry["path"]):
+            continue
+        shutil.rmtree(entry["path"], ignore_errors=True)
+        total -= entry["size"]
+        removed.append(entry)
+    return removed
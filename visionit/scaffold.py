@@ -0,0 +1,169 @@
+"""VisionIT scaffolding engine - plan a project in memory, then write it out.
+
+A plan is a dict with the directories and files of a project (paths relative
+to the project root) and the messages shown once it is written. The same plan
+can go to one of three outputs:
+
+- ``write_plan``: a directory, written concurrently into a staging directory
+  that is then renamed into place, so an interrupted run never leaves a
+  half-built project;
+- ``write_zip``: a zip archive, streamed to a file or any binary stream;
+- ``write_memory``: a ``{path: content}`` dict, without touching the disk.
+"""
+
+import os
+import shutil
+import sys
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+# Per-file latency (network home directories, antivirus scanning) dominates
+MAX_WORKERS = 16
+
+
+def new_plan() -> dict:
+    """Return an empty plan."""
+    return {"dirs": [], "files": {}, "messages": []}
+
+
+def add_dir(plan: dict, path: str, announce: bool = True) -> None:
+    """Add a directory to the plan."""
+    if path not in plan["dirs"]:
+        plan["dirs"].append(path)
+    if announce:
+        plan["messages"].append(f"{path}/")
+
+
+def add_file(plan: dict, path: str, content: Union[str, bytes], announce: bool = True) -> None:
+    """Add a file to the plan; str content is written as UTF-8 text."""
+    plan["files"][path] = content
+    if announce:
+        plan["messages"].append(path)
+
+
+def _all_dirs(plan: dict) -> list:
+    dirs = set()
+    for path in list(plan["dirs"]) + [str(Path(f).parent) for f in plan["files"]]:
+        parts = Path(path).parts
+        dirs.update(Path(*parts[:i]) for i in range(1, len(parts) + 1))
+    return sorted(dirs, key=lambda d: (len(d.parts), str(d)))
+
+
+def _write_file(root: Path, path: str, content: Union[str, bytes]) -> None:
+    if isinstance(content, bytes):
+        with open(root / path, "wb") as f:
+            f.write(content)
+    else:
+        with open(root / path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+def _rename(staging: Path, target: Path) -> None:
+    # Antivirus scanners briefly lock freshly written files on Windows
+    attempts = 5 if sys.platform == "win32" else 1
+    for attempt in range(attempts):
+        try:
+            os.rename(staging, target)
+            return
+        except PermissionError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(0.1 * 2**attempt)
+
+
+def write_plan(plan: dict, target: Path, workers: Optional[int] = None) -> None:
+    """Write the plan into a staging directory, then rename it to target.
+
+    Raises FileExistsError if target exists. On any error the staging
+    directory is removed and target is left untouched.
+    """
+    target = Path(target)
+    if target.exists():
+        raise FileExistsError(f"Directory '{target}' already exists")
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = target.parent / f".{target.name}.visionit-{os.getpid()}"
+    workers = workers or min(MAX_WORKERS, max(len(plan["files"]), 1))
+
+    try:
+        staging.mkdir()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # Directories level by level, so parents exist before children
+            dirs = _all_dirs(plan)
+            for depth in sorted({len(d.parts) for d in dirs}):
+                level = [staging / d for d in dirs if len(d.parts) == depth]
+                list(pool.map(lambda d: d.mkdir(exist_ok=True), level))
+            list(pool.map(lambda item: _write_file(staging, *item), plan["files"].items()))
+
+        if target.exists():
+            raise FileExistsError(f"Directory '{target}' already exists")
+        _rename(staging, target)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def iter_entries(plan: dict, root: str = "") -> list:
+    """Return (path, content) for every directory (content None, path ending in /) and file."""
+    prefix = f"{root.strip('/')}/" if root else ""
+    entries = [(f"{prefix}{d.as_posix()}/", None) for d in _all_dirs(plan)]
+    entries += [(f"{prefix}{path}", content) for path, content in plan["files"].items()]
+    return entries
+
+
+def write_memory(plan: dict, root: str = "") -> dict:
+    """Return the project as a {path: content} dict; directories map to None."""
+    return dict(iter_entries(plan, root))
+
+
+def add_to_zip(archive: zipfile.ZipFile, plan: dict, root: str = "") -> None:
+    """Add every directory and file of the plan to an open archive, under root/."""
+    date_time = time.localtime()[:6]
+    if root:
+        info = zipfile.ZipInfo(f"{root.strip('/')}/", date_time)
+        info.external_attr = 0o40755 << 16
+        archive.writestr(info, b"")
+    for path, content in iter_entries(plan, root):
+        info = zipfile.ZipInfo(path, date_time)
+        if content is None:
+            info.external_attr = 0o40755 << 16
+            archive.writestr(info, b"")
+        else:
+            info.external_attr = 0o644 << 16
+            info.compress_type = zipfile.ZIP_DEFLATED
+            data = content if isinstance(content, bytes) else content.encode("utf-8")
+            archive.writestr(info, data)
+
+
+@contextmanager
+def zip_output(target: Union[Path, BinaryIO]):
+    """Open a zip archive on a path (replaced atomically) or a binary stream.
+
+    Streams may be unseekable (stdout, an HTTP response): nothing is written
+    to disk.
+    """
+    if not isinstance(target, (str, Path)):
+        with zipfile.ZipFile(target, "w") as archive:
+            yield archive
+        return
+
+    target = Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.visionit-{os.getpid()}")
+    try:
+        with open(tmp, "wb") as f, zipfile.ZipFile(f, "w") as archive:
+            yield archive
+        os.replace(tmp, target)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def write_zip(plan: dict, target: Union[Path, BinaryIO], root: str = "") -> None:
+    """Write the plan as a zip archive, with every entry under root/."""
+    with zip_output(target) as archive:
+        add_to_zip(archive, plan, root)
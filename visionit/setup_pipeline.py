@@ -0,0 +1,332 @@
+"""VisionIT setup pipeline - bootstrap a project as a graph of cached steps.
+
+Each step names the steps it runs after, and starts on a thread pool as soon
+as they have finished, so independent work overlaps: installing packages,
+creating the static folders and compiling the sources run side by side. The
+Prisma steps wait for the install (they run the installed prisma package),
+and `db push` waits for `generate`, since both Prisma commands share the
+engine files downloaded on first use.
+
+Every step checks its cache before doing anything, so setting up a project
+that is already set up only costs those checks.
+"""
+
+import compileall
+import hashlib
+import json
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Optional
+
+from visionit.build_cache import iter_files
+from visionit.dependency_lock import (
+    LOCK_FILE,
+    PACKAGE_FILE,
+    install_command,
+    installed_versions,
+    read_lock,
+    requirements_hash,
+    unsatisfied,
+)
+from visionit.prisma_cache import (
+    generate_fingerprint,
+    is_up_to_date,
+    load_state,
+    push_fingerprint,
+    record,
+    save_state,
+)
+from visionit.process_runner import log_path, run_streamed
+
+STEPS = ("install", "generate", "push", "static", "compile")
+WORKERS = 4
+# Asset folders of the generated project: git does not keep them while empty
+STATIC_DIRS = ("static/css", "static/js", "static/icons")
+
+# Steps record their cache in .visionit/state.json from several threads
+_state_lock = threading.Lock()
+
+
+class StepError(RuntimeError):
+    """A failed step; log is the file holding its full output, if any."""
+
+    def __init__(self, message: str, log: Optional[str] = None):
+        super().__init__(message)
+        self.log = log
+
+
+def record_step(project_path: Path, step: str, fingerprint) -> None:
+    """Record a successful setup step in .visionit/state.json."""
+    with _state_lock:
+        state = load_state(project_path)
+        state.setdefault("setup", {})[step] = fingerprint
+        save_state(project_path, state)
+
+
+def recorded_step(project_path: Path, step: str):
+    """Return the fingerprint recorded for a setup step, or None."""
+    return load_state(project_path).get("setup", {}).get(step)
+
+
+def _run(command: list, project_path: Path, log_name: str, error: str) -> None:
+    try:
+        result = run_streamed(command, log_path(project_path, log_name), cwd=project_path)
+    except FileNotFoundError:
+        raise StepError(f"{command[0]} not found") from None
+    if result["returncode"] != 0:
+        last = next((line for line in reversed(result["tail"]) if line.strip()), "")
+        raise StepError(f"{error}: {last}" if last else error, result["log"])
+
+
+def current_lock(project_path: Path) -> Optional[dict]:
+    """Return package.lock if it matches package.txt, else None."""
+    lock_file = project_path / LOCK_FILE
+    if not lock_file.exists():
+        return None
+    lock = read_lock(lock_file)
+    return lock if lock["source"] == requirements_hash(project_path / PACKAGE_FILE) else None
+
+
+def install_step(project_path: Path, wheelhouse: Optional[Path] = None) -> dict:
+    """Install package.txt, or the pins of a current package.lock."""
+    package_file = project_path / PACKAGE_FILE
+
+    def fingerprint():
+        return {"requirements": requirements_hash(package_file), "python": sys.executable}
+
+    def check():
+        lock = current_lock(project_path)
+        if lock is not None:
+            return not unsatisfied(lock["packages"], installed_versions())
+        return recorded_step(project_path, "install") == fingerprint()
+
+    def run():
+        if wheelhouse is not None and not wheelhouse.is_dir():
+            raise StepError(f"wheelhouse not found at {wheelhouse} (run 'visionit wheelhouse')")
+        lock = current_lock(project_path)
+        command = install_command(lock, package_file, project_path / LOCK_FILE, wheelhouse)
+        _run(command, project_path, "install", "pip install failed")
+        record_step(project_path, "install", fingerprint())
+
+    return {"name": "install", "after": [], "check": check, "run": run}
+
+
+def generate_step(project_path: Path, schema_path: Path) -> dict:
+    """Generate the Prisma client, once the prisma package is installed."""
+
+    def check():
+        return is_up_to_date(
+            project_path, "generate", generate_fingerprint(schema_path), schema_path
+        )
+
+    def run():
+        _run(
+            ["prisma", "generate", "--schema", str(schema_path)],
+            project_path,
+            "prisma-generate",
+            "prisma generate failed",
+        )
+        with _state_lock:
+            record(project_path, "generate", generate_fingerprint(schema_path))
+
+    return {"name": "generate", "after": ["install"], "check": check, "run": run}
+
+
+def push_step(project_path: Path, schema_path: Path) -> dict:
+    """Push the schema to the database; the client is left to generate."""
+
+    def check():
+        return is_up_to_date(project_path, "push", push_fingerprint(schema_path), schema_path)
+
+    def run():
+        _run(
+            ["prisma", "db", "push", "--schema", str(schema_path), "--skip-generate"],
+            project_path,
+            "prisma-push",
+            "prisma db push failed",
+        )
+        with _state_lock:
+            record(project_path, "push", push_fingerprint(schema_path))
+
+    return {"name": "push", "after": ["install", "generate"], "check": check, "run": run}
+
+
+def static_folders(project_path: Path) -> list:
+    """Return the asset folders the project needs: the skeleton and build.json add_data."""
+    folders = [project_path / folder for folder in STATIC_DIRS]
+    build_file = project_path / "build.json"
+    if build_file.exists():
+        with open(build_file, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        # Sources with an extension are files, which setup cannot create
+        folders += [
+            project_path / src for src, _ in config.get("add_data", []) if not Path(src).suffix
+        ]
+    return folders
+
+
+def static_step(project_path: Path) -> dict:
+    """Create the missing asset folders, which PyInstaller's add_data requires."""
+
+    def check():
+        return all(folder.is_dir() for folder in static_folders(project_path))
+
+    def run():
+        for folder in static_folders(project_path):
+            folder.mkdir(parents=True, exist_ok=True)
+
+    return {"name": "static", "after": [], "check": check, "run": run}
+
+
+def source_files(project_path: Path) -> list:
+    """Return the Python sources of the project."""
+    return [
+        path
+        for path in iter_files(project_path)
+        if path.suffix == ".py" and ".visionit" not in path.relative_to(project_path).parts
+    ]
+
+
+def sources_fingerprint(project_path: Path) -> str:
+    """Hash the path, size and mtime of every source, and the Python version."""
+    digest = hashlib.sha256(sys.version.encode("utf-8"))
+    for path in source_files(project_path):
+        stat = path.stat()
+        digest.update(
+            f"{path.relative_to(project_path).as_posix()}\0{stat.st_size}\0"
+            f"{stat.st_mtime_ns}\0".encode("utf-8")
+        )
+    return digest.hexdigest()
+
+
+def compile_step(project_path: Path) -> dict:
+    """Byte-compile the sources, so the first start skips compilation."""
+
+    def check():
+        return recorded_step(project_path, "compile") == sources_fingerprint(project_path)
+
+    def run():
+        failed = [
+            path.relative_to(project_path).as_posix()
+            for path in source_files(project_path)
+            if not compileall.compile_file(str(path), quiet=2)
+        ]
+        if failed:
+            raise StepError(f"syntax errors in {', '.join(failed)}")
+        record_step(project_path, "compile", sources_fingerprint(project_path))
+
+    return {"name": "compile", "after": [], "check": check, "run": run}
+
+
+def setup_steps(
+    project_path: Path, wheelhouse: Optional[Path] = None, skip: Optional[list] = None
+) -> list:
+    """Return the setup graph of a project, without the skipped steps.
+
+    Steps without their input (package.txt, db/schema.prisma) are left out;
+    a skipped step is treated as done by the steps after it.
+    """
+    steps = []
+    if (project_path / PACKAGE_FILE).exists():
+        steps.append(install_step(project_path, wheelhouse))
+    schema_path = project_path / "db" / "schema.prisma"
+    if schema_path.exists():
+        steps += [generate_step(project_path, schema_path), push_step(project_path, schema_path)]
+    steps += [static_step(project_path), compile_step(project_path)]
+
+    kept = [step for step in steps if step["name"] not in (skip or [])]
+    names = {step["name"] for step in kept}
+    for step in kept:
+        step["after"] = [name for name in step["after"] if name in names]
+    return kept
+
+
+def check_graph(steps: list) -> None:
+    """Raise ValueError if a step runs after an unknown step or the graph has a cycle."""
+    names = {step["name"] for step in steps}
+    for step in steps:
+        unknown = set(step["after"]) - names
+        if unknown:
+            raise ValueError(f"{step['name']} runs after unknown step {', '.join(sorted(unknown))}")
+    done = set()
+    remaining = list(steps)
+    while remaining:
+        ready = [step for step in remaining if set(step["after"]) <= done]
+        if not ready:
+            raise ValueError(f"cycle between {', '.join(step['name'] for step in remaining)}")
+        done.update(step["name"] for step in ready)
+        remaining = [step for step in remaining if step["name"] not in done]
+
+
+def _execute(step: dict, force: bool) -> dict:
+    start = time.perf_counter()
+    result = {"name": step["name"], "status": "done", "error": None, "log": None}
+    try:
+        if not force and step["check"]():
+            result["status"] = "cached"
+        else:
+            step["run"]()
+    except Exception as e:
+        result.update(status="failed", error=str(e), log=getattr(e, "log", None))
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def run_graph(
+    steps: list,
+    workers: int = WORKERS,
+    force: bool = False,
+    on_start: Optional[Callable] = None,
+    on_finish: Optional[Callable] = None,
+) -> list:
+    """Run each step once the steps it runs after are done; return the results in order.
+
+    A step after a failed or skipped step is skipped. on_start and on_finish
+    are called from the calling thread, with the step name and the result.
+    Raises ValueError for an invalid graph.
+    """
+    check_graph(steps)
+    results = {}
+    pending = list(steps)
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        while pending or running:
+            started = True
+            while started:
+                started = False
+                for step in list(pending):
+                    before = [results.get(name) for name in step["after"]]
+                    if None in before:
+                        continue
+                    pending.remove(step)
+                    started = True
+                    blocked = [r["name"] for r in before if r["status"] in ("failed", "skipped")]
+                    if blocked:
+                        result = {
+                            "name": step["name"],
+                            "status": "skipped",
+                            "seconds": 0.0,
+                            "error": f"after {', '.join(blocked)}",
+                            "log": None,
+                        }
+                        results[step["name"]] = result
+                        if on_finish:
+                            on_finish(result)
+                        continue
+                    if on_start:
+                        on_start(step["name"])
+                    running[pool.submit(_execute, step, force)] = step
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                results[step["name"]] = future.result()
+                if on_finish:
+                    on_finish(results[step["name"]])
+
+    return [results[step["name"]] for step in steps]
@@ -0,0 +1,254 @@
+"""VisionIT SQLite profiles - WAL and busy timeout for generated apps.
+
+A profile is a set of PRAGMAs. Prisma opens its own pooled connections, so a
+profile only holds settings that reach every one of them:
+
+- the datasource URL of schema.prisma, for what Prisma reads from it
+  (``socket_timeout`` is the busy timeout of every pooled connection, and
+  ``connection_limit`` sizes the pool for concurrent WAL readers);
+- ``db/tuning.py``, a startup hook that writes the PRAGMAs SQLite stores in
+  the database file (the journal mode) to the datasource file.
+
+Per-connection PRAGMAs (synchronous, cache_size, mmap_size) would only reach
+the connection that runs them, and are left out.
+"""
+
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from visionit.prisma_schema import block_span
+
+PROFILES = {
+    # SQLite defaults: rollback journal, full fsync, no mmap, no busy timeout
+    "default": {},
+    "performance": {
+        # Readers no longer block the writer, and the reverse
+        "journal_mode": "WAL",
+        # socket_timeout of the datasource URL
+        "busy_timeout": 5000,
+    },
+}
+
+# PRAGMAs SQLite stores in the database file: db/tuning.py writes them once
+# and every connection, Prisma's included, reads them from the file
+FILE_PRAGMAS = ("journal_mode",)
+
+# Prisma connections of the performance profile: with WAL, readers run
+# concurrently. db/client.py lets as many queries through at once.
+CONNECTION_LIMIT = 8
+
+DEFAULT_PROFILE = "default"
+TUNING_FILE = Path("db") / "tuning.py"
+DATABASE_PATH = "../dev.db"
+
+_URL_LINE_RE = re.compile(r'^([ \t]*url[ \t]*=[ \t]*)"([^"]*)"', re.MULTILINE)
+
+
+def connection_url(profile: str, database: str = DATABASE_PATH) -> str:
+    """Return the Prisma SQLite URL of a profile."""
+    pragmas = PROFILES[profile]
+    if not pragmas:
+        return f"file:{database}"
+    # Prisma takes the busy timeout in seconds
+    timeout = max(1, round(pragmas["busy_timeout"] / 1000))
+    return f"file:{database}?connection_limit={CONNECTION_LIMIT}&socket_timeout={timeout}"
+
+
+def set_datasource_url(text: str, url: str) -> str:
+    """Replace the literal url of the datasource block of a schema.
+
+    Raises ValueError if the schema has no datasource with a literal url
+    (e.g. env("DATABASE_URL"), which must be changed in the environment).
+    """
+    match = re.search(r"^[ \t]*datasource\s+(\w+)\s*\{", text, re.MULTILINE)
+    if not match:
+        raise ValueError("schema.prisma has no datasource block")
+    start, end = block_span(text, "datasource", match.group(1))
+    block = text[start:end]
+    if not _URL_LINE_RE.search(block):
+        raise ValueError("the datasource url is not a literal string")
+    block = _URL_LINE_RE.sub(lambda m: f'{m.group(1)}"{url}"', block, count=1)
+    return text[:start] + block + text[end:]
+
+
+def pragma_statements(pragmas: dict) -> list:
+    """Return the PRAGMA statements of a profile."""
+    return [f"PRAGMA {name} = {value}" for name, value in pragmas.items()]
+
+
+def tuning_module(profile: str) -> str:
+    """Return the source of the generated db/tuning.py startup hook."""
+    items = "".join(
+        f"    {name!r}: {value!r},\n"
+        for name, value in PROFILES[profile].items()
+        if name in FILE_PRAGMAS
+    )
+    pragmas = f"{{\n{items}}}" if items else "{}"
+    connection_limit = CONNECTION_LIMIT if PROFILES[profile] else None
+    return f'''"""SQLite profile "{profile}" - generated by VisionIT (`visionit db tune`)."""
+
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+PROFILE = {profile!r}
+
+# PRAGMAs stored in the database file, so they reach every Prisma connection.
+# The busy timeout and the pool size are in the datasource URL.
+PRAGMAS = {pragmas}
+
+# connection_limit of the datasource URL (None: Prisma's default pool)
+CONNECTION_LIMIT = {connection_limit!r}
+
+SCHEMA = Path(__file__).resolve().parent / "schema.prisma"
+
+# url of the datasource block: a literal or env("VARIABLE")
+_URL_RE = re.compile(
+    r'^[ \\t]*datasource\\s+\\w+\\s*\\{{[^}}]*?^[ \\t]*url[ \\t]*=[ \\t]*'
+    r'(?:"([^"]*)"|env\\(\\s*"([^"]*)"\\s*\\))',
+    re.MULTILINE,
+)
+
+
+def database_file(schema: Path = SCHEMA) -> Optional[Path]:
+    """Return the SQLite file of the datasource url, or None for other databases."""
+    match = _URL_RE.search(schema.read_text(encoding="utf-8")) if schema.exists() else None
+    if not match:
+        return None
+    url = match.group(1) if match.group(1) is not None else os.environ.get(match.group(2), "")
+    if not url.startswith("file:"):
+        return None
+    # Prisma resolves relative SQLite paths from the schema directory
+    return (schema.parent / url[len("file:"):].split("?", 1)[0]).resolve()
+
+
+def pragma_statements() -> list:
+    """Return the PRAGMA statements of the profile."""
+    return [f"PRAGMA {{name}} = {{value}}" for name, value in PRAGMAS.items()]
+
+
+def tune_database(path: Optional[Path] = None) -> None:
+    """Write the profile to an existing database file (default: the datasource's)."""
+    path = path or database_file()
+    if not PRAGMAS or path is None or not Path(path).exists():
+        return
+    connection = sqlite3.connect(path)
+    try:
+        for statement in pragma_statements():
+            connection.execute(statement).fetchall()
+    finally:
+        connection.close()
+'''
+
+
+def current_profile(project_path: Path) -> Optional[str]:
+    """Return the profile recorded in db/tuning.py, or None if there is none."""
+    tuning_file = project_path / TUNING_FILE
+    if not tuning_file.exists():
+        return None
+    content = tuning_file.read_text(encoding="utf-8")
+    match = re.search(r"^PROFILE = ['\"](\w+)['\"]", content, re.MULTILINE)
+    return match.group(1) if match else None
+
+
+def read_settings(database: Path, names: Optional[list] = None) -> dict:
+    """Return the current value of PRAGMAs on a new connection to database."""
+    names = names or list(PROFILES["performance"])
+    connection = sqlite3.connect(Path(database).resolve().as_uri() + "?mode=ro", uri=True)
+    try:
+        return {name: connection.execute(f"PRAGMA {name}").fetchone()[0] for name in names}
+    finally:
+        connection.close()
+
+
+def apply_profile(database: Path, profile: str) -> None:
+    """Write the persistent settings of a profile (the journal mode) to database."""
+    # Going back to the default profile also leaves WAL
+    journal_mode = PROFILES[profile].get("journal_mode", "DELETE")
+    connection = sqlite3.connect(database)
+    try:
+        connection.execute(f"PRAGMA journal_mode = {journal_mode}").fetchall()
+    finally:
+        connection.close()
+
+
+def _connect(database: Path, pragmas: dict) -> sqlite3.Connection:
+    # isolation_level=None: one explicit transaction per write, like an ORM create
+    timeout = pragmas.get("busy_timeout", 0) / 1000
+    connection = sqlite3.connect(
+        database, timeout=timeout, isolation_level=None, check_same_thread=False
+    )
+    for statement in pragma_statements(pragmas):
+        connection.execute(statement).fetchall()
+    return connection
+
+
+def bench_writes(
+    profile: str, writers: int = 8, writes: int = 200, directory: Optional[Path] = None
+) -> dict:
+    """Measure concurrent single-row write transactions on a fresh database.
+
+    Each writer is a thread with its own connection, like the connections of
+    several NiceGUI clients. Writes that fail with "database is locked" are
+    counted and not retried.
+    """
+    pragmas = PROFILES[profile]
+    with tempfile.TemporaryDirectory(dir=directory) as tmp:
+        database = Path(tmp) / "bench.db"
+        setup = _connect(database, pragmas)
+        setup.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT, payload TEXT)")
+        setup.close()
+
+        latencies, errors = [], []
+        lock = threading.Lock()
+        barrier = threading.Barrier(writers)
+
+        def writer(index: int) -> None:
+            connection = _connect(database, pragmas)
+            barrier.wait()
+            try:
+                for i in range(writes):
+                    start = time.perf_counter()
+                    try:
+                        connection.execute("BEGIN IMMEDIATE")
+                        connection.execute(
+                            "INSERT INTO item (name, payload) VALUES (?, ?)",
+                            (f"writer-{index}-{i}", "x" * 200),
+                        )
+                        connection.execute("COMMIT")
+                    except sqlite3.OperationalError as e:
+                        if connection.in_transaction:
+                            connection.execute("ROLLBACK")
+                        with lock:
+                            errors.append(str(e))
+                        continue
+                    with lock:
+                        latencies.append((time.perf_counter() - start) * 1000)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+    return {
+        "profile": profile,
+        "writers": writers,
+        "attempted": writers * writes,
+        "committed": len(latencies),
+        "locked": len(errors),
+        "seconds": elapsed,
+        "writes_per_second": len(latencies) / elapsed if elapsed else 0.0,
+        "latencies_ms": latencies,
+    }
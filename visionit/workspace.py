@@ -0,0 +1,243 @@
+"""VisionIT workspace - build every project of a monorepo concurrently.
+
+Projects are the folders holding a build.json, found under the workspace
+root or listed in its visionit-workspace.json. Each build runs as its own
+`visionit build <mode>` process in its project folder, with its own build/
+and dist/. Projects only share the machine and PyInstaller's binary cache,
+whose entries are never evicted while a build uses them.
+
+The number of builds at a time is capped by the CPU count and by the
+available memory (a PyInstaller Analysis of a NiceGUI app easily takes a
+gigabyte). Projects whose build fingerprints still match are reported as
+cache hits without starting a process, and the others start longest first,
+using the durations of the previous workspace build.
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Optional
+
+from visionit.build_cache import IGNORED_DIRS, is_up_to_date, mode_fingerprints
+from visionit.process_runner import log_path, run_streamed
+
+WORKSPACE_FILE = "visionit-workspace.json"
+REPORT_FILE = Path(".visionit") / "workspace-build.json"
+MODES = {"onefile": ["onefile"], "onedir": ["onedir"], "all": ["onefile", "onedir"]}
+MEMORY_PER_JOB_MB = 1536
+# Never projects: build outputs, environments and VisionIT's own files
+_SKIPPED_DIRS = IGNORED_DIRS | {".visionit"}
+
+# Phases the child `visionit build` prints ("   ⏳ Analysis...")
+BUILD_PHASES = [(re.compile(r"⏳ (\w+)\.\.\."), None)]
+
+
+def load_workspace(path: Path) -> tuple:
+    """Return (root, configuration) for a workspace folder or workspace file.
+
+    A folder without visionit-workspace.json has an empty configuration.
+    """
+    workspace_file = path if path.is_file() else path / WORKSPACE_FILE
+    if not workspace_file.exists():
+        return path, {}
+    with open(workspace_file, "r", encoding="utf-8") as f:
+        return workspace_file.parent, json.load(f)
+
+
+def discover_projects(root: Path, workspace: dict) -> list:
+    """Return the project folders of the workspace, sorted.
+
+    "projects" globs (relative to root) select the folders; without them,
+    every build.json under root marks a project. "exclude" globs remove some.
+    """
+    if workspace.get("projects"):
+        candidates = [folder for pattern in workspace["projects"] for folder in root.glob(pattern)]
+    else:
+        candidates = [
+            build_file.parent
+            for build_file in root.rglob("build.json")
+            if not _SKIPPED_DIRS.intersection(build_file.relative_to(root).parts)
+        ]
+    excluded = {
+        folder.resolve()
+        for pattern in workspace.get("exclude", [])
+        for folder in root.glob(pattern)
+    }
+    return sorted(
+        {
+            folder
+            for folder in candidates
+            if (folder / "build.json").is_file() and folder.resolve() not in excluded
+        }
+    )
+
+
+def available_memory_mb() -> Optional[int]:
+    """Return the available physical memory in MB, or None where it is unknown."""
+    try:
+        with open("/proc/meminfo", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def max_jobs(
+    requested: Optional[int] = None,
+    memory_per_job_mb: int = MEMORY_PER_JOB_MB,
+    cpus: Optional[int] = None,
+    memory_mb: Optional[int] = None,
+) -> int:
+    """Return how many builds may run at once: cores and memory permitting, at least one."""
+    cpus = cpus or os.cpu_count() or 1
+    jobs = min(requested, cpus) if requested else cpus
+    if memory_mb is not None and memory_per_job_mb > 0:
+        jobs = min(jobs, memory_mb // memory_per_job_mb)
+    return max(1, jobs)
+
+
+def load_report(root: Path) -> dict:
+    """Return the last workspace report, or an empty one."""
+    report_file = root / REPORT_FILE
+    if not report_file.exists():
+        return {}
+    try:
+        with open(report_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def schedule(projects: list, root: Path, previous: dict) -> list:
+    """Order projects longest build first; never-built projects come first."""
+    durations = {
+        entry["project"]: entry["seconds"]
+        for entry in previous.get("projects", [])
+        if entry["status"] == "built"
+    }
+
+    def key(project):
+        name = project.relative_to(root).as_posix()
+        return -durations.get(name, float("inf")), name
+
+    return sorted(projects, key=key)
+
+
+def is_cached(project: Path, modes: list) -> bool:
+    """Check that every mode of a project is built from its current inputs."""
+    with open(project / "build.json", "r", encoding="utf-8") as f:
+        config = json.load(f)
+    fingerprints = mode_fingerprints(project, config, modes)
+    return all(is_up_to_date(project, config, mode, fingerprints[mode]) for mode in modes)
+
+
+def build_command(project: Path, mode: str, force: bool = False, clean: bool = False) -> list:
+    """Return the `visionit build` command that builds one project."""
+    command = [sys.executable, "-m", "visionit.cli", "build", mode, "--path", str(project)]
+    if force:
+        command.append("--force")
+    if clean:
+        command.append("--clean")
+    return command
+
+
+def build_project(
+    root: Path,
+    project: Path,
+    mode: str,
+    force: bool = False,
+    clean: bool = False,
+    on_phase: Optional[Callable] = None,
+) -> dict:
+    """Build one project in its own process and return its report entry."""
+    name = project.relative_to(root).as_posix()
+    start = time.perf_counter()
+    if not (force or clean) and is_cached(project, MODES[mode]):
+        return {
+            "project": name,
+            "status": "cached",
+            "seconds": time.perf_counter() - start,
+            "phases": {},
+            "log": None,
+            "error": None,
+        }
+
+    result = run_streamed(
+        build_command(project, mode, force, clean),
+        log_path(project, "workspace-build"),
+        cwd=project,
+        phases=BUILD_PHASES,
+        on_phase=on_phase and (lambda phase: on_phase(name, phase)),
+    )
+    failed = result["returncode"] != 0
+    error = next((line.strip() for line in result["tail"] if "❌" in line), "build failed")
+    return {
+        "project": name,
+        "status": "failed" if failed else "built",
+        "seconds": result["seconds"],
+        "phases": result["phases"],
+        "log": result["log"],
+        "error": error if failed else None,
+    }
+
+
+def build_workspace(
+    root: Path,
+    projects: list,
+    mode: str,
+    jobs: int,
+    force: bool = False,
+    clean: bool = False,
+    on_phase: Optional[Callable] = None,
+    on_finish: Optional[Callable] = None,
+) -> dict:
+    """Build the projects, jobs at a time, and write the workspace report.
+
+    Each job is a thread waiting on its `visionit build` process. on_phase
+    receives the project name and phase, on_finish the report entry.
+    """
+    start = time.perf_counter()
+    ordered = schedule(projects, root, load_report(root))
+    entries = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(build_project, root, project, mode, force, clean, on_phase): project
+            for project in ordered
+        }
+        for future in as_completed(futures):
+            project = futures[future]
+            try:
+                entry = future.result()
+            except Exception as e:
+                entry = {
+                    "project": project.relative_to(root).as_posix(),
+                    "status": "failed",
+                    "seconds": 0.0,
+                    "phases": {},
+                    "log": None,
+                    "error": str(e),
+                }
+            entries[project] = entry
+            if on_finish:
+                on_finish(entry)
+
+    report = {
+        "mode": mode,
+        "jobs": jobs,
+        "seconds": time.perf_counter() - start,
+        "projects": [entries[project] for project in ordered],
+    }
+    report_file = root / REPORT_FILE
+    report_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_file, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return report